@@ -2,21 +2,276 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from helper.browser_helper import human_delay, smooth_scroll, scroll_page_to_load, create_driver
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from helper.browser_helper import scroll_page_to_load, create_driver, throttle_navigation
 from helper.auth_helper import login
-from helper.extraction_helper import click_show_all, click_back_arrow, extract_items_from_detail_page
+from helper.extraction_helper import (
+    click_show_all, show_all_needed, click_back_arrow, extract_items_from_detail_page,
+    read_item_spans, watch_until_stable, wait_until_stable
+)
+from helper.embedded_data_helper import parse_embedded_profile
+from helper.cache_helper import ProfileCache, PartialProfileWriter
+from helper.http_helper import HTTP_FAST_PATH, ProfileFetcher
 import gender_guesser.detector as gender
+import json
+import logging
 import re
+import sqlite3
+import time
+from functools import lru_cache
+from itertools import groupby, islice, takewhile
+from operator import itemgetter
 from datetime import datetime
+from pathlib import Path
+
+
+log = logging.getLogger(__name__)
+
+# In-browser harvester that reads every main-page field in one execute_script call
+PROFILE_EXTRACTOR_JS = (Path(__file__).parent / 'js' / 'profile_extractor.js').read_text(encoding='utf-8')
+
+# Bulk in-page reads for _bulk_extract: arguments[0] is a list of <li> elements
+_ITEM_TEXTS_JS = "return arguments[0].map((el) => el.innerText || '');"
+# Same, for the main-page list items of a section element (CSS child combinators, not an XPath descendant scan)
+_SECTION_ITEM_TEXTS_JS = "return Array.from(arguments[0].querySelectorAll('ul > li'), (li) => li.innerText || '');"
+
+# Skill name (first aria-hidden span) + visible detail lines, filtered in the page
+_SKILL_ITEMS_JS = """
+// Endorsement counts, "N experiences at ..." and assessment badges, compiled once per call
+const SKIP_LINE = /endorsement|experience.* at |Passed LinkedIn|LinkedIn Skill Assessment/i;
+return arguments[0].map((li) => {
+    const nameSpan = li.querySelector('span[aria-hidden="true"]');
+    const name = nameSpan ? (nameSpan.innerText || '').trim() : '';
+    const lines = (li.innerText || '').split('\\n').map((line) => line.trim()).filter(Boolean)
+        .filter((line, i, all) => i === 0 || line !== all[i - 1]);
+    const details = [];
+    const seen = new Set();
+    for (const line of lines.slice(1)) {
+        if (line.length < 5 || line === name || SKIP_LINE.test(line) || seen.has(line)) continue;
+        seen.add(line);
+        details.push(line);
+    }
+    const detailsBtn = Array.from(li.querySelectorAll('button, a')).find(
+        (btn) => btn.textContent.includes('Show all') && btn.textContent.includes('detail')
+    );
+    // "Show all 5 details" -> 5, so the modal can be skipped when every detail is already visible
+    const count = detailsBtn && detailsBtn.textContent.match(/Show all (\\d+) detail/);
+    return {
+        name: name,
+        details: details,
+        has_details: Boolean(detailsBtn),
+        detail_count: count ? parseInt(count[1], 10) : null,
+    };
+});
+"""
+
+# Click the first known modal close button; false when none is on the page
+_CLOSE_MODAL_JS = """
+const button = document.querySelector(
+    "button[aria-label='Dismiss'], button[aria-label*='Close'],"
+    + " button[class*='artdeco-modal__dismiss'], button[data-test-modal-close-btn]"
+);
+if (!button) return false;
+button.click();
+return true;
+"""
+
+# First element matching each XPath in arguments[0] (null when absent), in document order like find_element
+_DISCOVER_SECTIONS_JS = """
+return arguments[0].map((xpath) => document.evaluate(
+    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue);
+"""
+
+# Modal items matching the CSS selector in arguments[0], read in the page: item count and the
+# first line (title/name) of each item, unique, skipping short entries. Items that were already
+# there when watch_until_stable was called (a previous skill's modal) are skipped
+_MODAL_DETAILS_JS = """
+const seen = new Set();
+const stale = window.__scrapeStale || new Set();
+const texts = Array.from(document.querySelectorAll(arguments[0]))
+    .filter((el) => !stale.has(el))
+    .map((el) => (el.innerText || '').trim());
+return {
+    count: texts.length,
+    details: texts
+        .filter((text) => text.length > 5)
+        .map((text) => text.split('\\n')[0].trim())
+        .filter((line) => line && !seen.has(line) && seen.add(line)),
+};
+"""
+
+# Section lookups as single XPath unions so one wait covers every variant
+_EXP_XPATH = "//section[contains(@id, 'experience') or .//div[@id='experience'] or .//h2[contains(text(), 'Experience')]]"
+_EDU_XPATH = "//section[contains(@id, 'education') or .//div[@id='education'] or .//h2[contains(text(), 'Education')]]"
+_SKILLS_XPATH = "//section[contains(@id, 'skills') or .//div[@id='skills'] or .//h2[contains(text(), 'Skills')]]"
+_SHOW_ALL_DETAIL_XPATH = ".//*[self::button or self::a][contains(., 'Show all') and contains(., 'detail')]"
+_ABOUT_XPATH = "//section[contains(@id, 'about') or .//h2[contains(., 'About')]]"
+_SEE_MORE_XPATH = ".//button[contains(., 'more')]"
+_MODAL_CSS = "div[role*='dialog'], div[data-test-modal], div[class*='artdeco-modal']"
+_MODAL_ITEMS_CSS = "div[role*='dialog'] ul > li, div[data-test-modal] ul > li, div[class*='artdeco-modal'] ul > li"
+_PROJECTS_XPATH = "//section[contains(@id, 'projects') or .//div[@id='projects'] or .//h2[contains(text(), 'Projects')]]"
+_LANGUAGES_XPATH = "//section[contains(@id, 'languages') or .//div[@id='languages'] or .//h2[contains(text(), 'Languages')]]"
+
+_HONORS_XPATH = (
+    "//section[contains(@id, 'honors') or contains(@id, 'accomplishments')"
+    " or .//div[@id='honors' or @id='accomplishments']"
+    " or .//h2[contains(text(), 'Honors') or contains(text(), 'awards')]"
+    " or .//span[contains(text(), 'Honors & awards')]]"
+)
+_LICENSES_XPATH = (
+    "//section[contains(@id, 'licenses') or contains(@id, 'certifications')"
+    " or .//div[@id='licenses_and_certifications']"
+    " or .//h2[contains(text(), 'Licenses') or contains(text(), 'Certifications')]"
+    " or .//span[contains(text(), 'Licenses & certifications')]]"
+)
+_COURSES_XPATH = "//section[contains(@id, 'courses') or .//div[@id='courses'] or .//h2[contains(text(), 'Courses')]]"
+_VOLUNTEERING_XPATH = (
+    "//section[contains(@id, 'volunteering')"
+    " or .//div[@id='volunteering-experience' or @id='volunteering_experience']"
+    " or .//h2[contains(text(), 'Volunteering')]"
+    " or .//span[contains(text(), 'Volunteer experience')]]"
+    " | //div[@id='volunteering-experience-section']"
+)
+_TEST_SCORES_XPATH = (
+    "//section[contains(@id, 'test-scores') or contains(@id, 'test_scores')"
+    " or .//div[@id='test-scores']"
+    " or .//h2[contains(text(), 'Test scores') or contains(text(), 'Test Scores')]"
+    " or .//span[contains(text(), 'Test scores')]]"
+)
+
+# Every section lookup, resolved together in one call after the page has loaded
+_SECTION_XPATHS = (
+    _EXP_XPATH, _EDU_XPATH, _SKILLS_XPATH, _PROJECTS_XPATH, _LANGUAGES_XPATH,
+    _HONORS_XPATH, _LICENSES_XPATH, _COURSES_XPATH, _VOLUNTEERING_XPATH, _TEST_SCORES_XPATH,
+)
+
+# Header locators for the live-DOM gender / location fallbacks
+_PRONOUN_LOCATORS = (
+    (By.XPATH, "//h1[contains(@class, 'text-heading-xlarge')]/..//span[contains(@class, 'text-body-small')]"),
+    (By.XPATH, "//h1[contains(@class, 'text-heading-xlarge')]/following-sibling::*//span"),
+    (By.XPATH, "//div[.//h1[contains(@class, 'text-heading-xlarge')]]//span[contains(@class, 'text-body-small')]"),
+    (By.XPATH, "//main//section[1]//span[contains(@class, 'text-body-small')]"),
+)
+_LOCATION_LOCATORS = (
+    (By.XPATH, "//div[contains(@class, 'mt2')]//span[contains(@class, 'text-body-small') and contains(., ',')]"),
+    (By.XPATH, "//span[contains(@class, 'text-body-small') and contains(., 'Indonesia') or contains(., 'Jakarta') or contains(., 'Bandung') or contains(., 'Surabaya')]"),
+    (By.CSS_SELECTOR, "div.mt2 span.text-body-small"),
+)
+
+# Line classifiers for the experience parsers (one C-level scan instead of chained `in` checks)
+_MONTHS_PATTERN = r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+_DATE_HINT = re.compile(rf'-|Present|{_MONTHS_PATTERN}')
+_DURATION_LINE = re.compile(rf'-|Present|(?i:to)|{_MONTHS_PATTERN}')
+_TENURE_HINT = re.compile(r'yr|mo')
+_ROLE_DURATION = re.compile(r'-|Present')
+_YEAR_END = re.compile(r'[-–]\s*([^-–]*?)\s*$')
+_LOC_REJECT = re.compile(r' to |(?i:http|www\.)')
+# Repeated duration line of a volunteering item: starts with a month or year, then "· <tenure>"
+_DUPLICATE_DURATION = re.compile(rf'(?:{_MONTHS_PATTERN}|\d{{4}}).*·')
+
+# estimate_age: 4-digit years, and typical graduation age per degree level, checked in this order
+# (High School ~18, Master/S2 ~24, Doctoral/PhD/S3 ~27, Bachelor/S1 ~22, Diploma ~21)
+_YEAR_RE = re.compile(r'\d{4}')
+_DEGREE_AGES = (
+    (re.compile(r'high school|sma|smk|smu'), 18),
+    (re.compile(r'master|s2|magister|mba'), 24),
+    (re.compile(r'doctor|phd|s3|doctoral'), 27),
+    (re.compile(r'bachelor|s1|sarjana|degree'), 22),
+    (re.compile(r'diploma|d3|d4'), 21),
+)
+
+# Project metadata lines to skip when looking for the detail; "Other contributors" ends the search
+_PROJECT_SKIP = re.compile(r'Associated with|Show project')
+
+# Course code lines ("Course number: CS101"), any case
+_COURSE_NUMBER = re.compile(r'number', re.I)
+# Field labels stripped from license / course lines ("Credential ID: ABC123" → "ABC123")
+_CREDENTIAL_ID_LABEL = re.compile(r'^Credential ID\s*:?')
+_COURSE_NUMBER_LABEL = re.compile(r'^Course number\s*:?')
+
+# Skill-name junk: "Show/See ..." links, assessment badges, "6 endorsements", "2 experiences at ..."
+_SKILL_SKIP = re.compile(
+    r'^(?:Show |See )|Passed LinkedIn|LinkedIn Skill Assessment| endorsement|^\d+\s.*(?i:experience|endorsement)'
+)
+
+# Comma-joined CSS unions, evaluated by the browser in one DOM walk
+_NAME_CSS = "h1.text-heading-xlarge, h1[class*='inline'], h1[class*='text-heading']"
+_ABOUT_TEXT_CSS = (
+    "div[class*='display-flex'] span[aria-hidden='true'], "
+    "div[class*='inline-show-more-text'] span, "
+    "span[aria-hidden='true']"
+)
+
+
+# Extraction order for get_profile; later sections may use earlier results
+PROFILE_SECTIONS = (
+    'name', 'location', 'about', 'gender', 'experiences', 'education', 'estimated_age',
+    'skills', 'projects', 'honors', 'languages', 'licenses', 'courses', 'volunteering', 'test_scores',
+)
+
+# Sections that can be served from the embedded JSON of a plain HTTP fetch (estimated_age is derived)
+HTTP_SECTIONS = ('name', 'location', 'experiences', 'education', 'estimated_age', 'skills', 'projects', 'languages')
+
+# Profile page loads tried before giving up (backoff 1s, 2s between attempts)
+PAGE_LOAD_ATTEMPTS = 3
+
+# Seconds to wait for a skill's details modal to render and settle (includes the 250ms quiet period)
+MODAL_TIMEOUT = 1.2
+
+# Rendered with the top card, before any lazy loading
+_TOP_CARD_SECTIONS = ('name', 'location')
+
+# Embedded data keys whose page snapshot section has a different name
+_SNAPSHOT_KEYS = {'experiences': 'experience'}
+
+# Sections computed from other sections' results
+SECTION_DEPENDENCIES = {
+    'gender': ('name', 'about'),
+    'estimated_age': ('education',),
+}
+
+# One match per non-blank line, group 1 is the line without surrounding whitespace
+_LINE_RE = re.compile(r'[^\S\n]*([^\n]*\S)')
+
+
+def _dedupe_lines(text):
+    """Stripped non-empty lines of text with consecutive duplicates collapsed (single regex scan)"""
+    return [line for line, _ in groupby(m.group(1) for m in _LINE_RE.finditer(text))]
+
+
+# Name data is loaded once per process and shared by every crawler
+_DETECTOR = gender.Detector()
+
+# "Sri.Mah Gunawan" → Sri, Mah, Gunawan
+_NAME_SPLIT_RE = re.compile(r'[.,\s]+')
+
+
+@lru_cache(maxsize=10000)
+def _guess_gender(name):
+    """gender-guesser result for one name part (first names repeat a lot across a batch)"""
+    return _DETECTOR.get_gender(name)
 
 
 class LinkedInCrawler:
-    def __init__(self):
-        """Initialize crawler with browser"""
-        self.driver = create_driver()
+    def __init__(self, driver=None):
+        """Initialize crawler with browser (uses the given driver or creates a new one)"""
+        self.driver = driver or create_driver()
         self.wait = WebDriverWait(self.driver, 10)
-        self.gender_detector = gender.Detector()
+        # Section lookups: short poll first, escalate to the long wait only on a miss
+        self.fast_wait = WebDriverWait(self.driver, 4, poll_frequency=0.2)
+        self.slow_wait = WebDriverWait(self.driver, 10, poll_frequency=0.3)
+        self.snapshot = {}
+        self.embedded = {}
+        # True when the current profile came from the HTTP fetch (no rendered page to check against)
+        self.served_over_http = False
+        # Section elements found for the current profile, keyed by XPath (reset per page load)
+        self.section_cache = {}
+        # Name of the current profile, read once (also the gender fallback input)
+        self.profile_name = None
+        self.fetcher = None
+        self.cache = ProfileCache()
+        self.logged_in = False
         
         # Indonesian name patterns for gender detection fallback
         self.indonesian_female_indicators = [
@@ -33,169 +288,341 @@ class LinkedInCrawler:
         ]
     
     def login(self):
-        """Login to LinkedIn"""
+        """Login to LinkedIn (once per driver; reuses the shared cookie jar when available)"""
+        if self.logged_in:
+            return
         login(self.driver)
+        self.logged_in = True
     
-    def get_profile(self, url):
-        """Main method to scrape a LinkedIn profile"""
-        print(f"\nScraping profile: {url}")
-        self.driver.get(url)
+    def get_profile(self, url, sections=PROFILE_SECTIONS, force_refresh=False):
+        """Main method to scrape a LinkedIn profile (served from disk cache when the requested sections are fresh)"""
+        sections = tuple(sections)
+        if not force_refresh:
+            cached = self.cache.get(url, sections)
+            if cached is not None:
+                log.info("\n✓ Cache hit, skipping scrape: %s", url)
+                return cached
         
-        # Wait for page to load - check if main content exists
-        try:
-            print("Waiting for page to load...")
-            self.wait.until(
-                EC.presence_of_element_located((By.TAG_NAME, "main"))
-            )
-            human_delay(2, 2.5)  # Increased for better initial load
-        except TimeoutException:
-            print("⚠ Page load timeout! Content may not be available.")
-            human_delay(3, 4)  # Wait longer on timeout
-        
-        # Scroll to load all sections - AGGRESSIVE LOADING
-        print("\n" + "="*60)
-        print("LOADING ALL CONTENT - AGGRESSIVE SCROLLING")
-        print("="*60)
-        
-        # Get initial height
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        
-        # Scroll down multiple times to trigger lazy loading
-        for scroll_round in range(3):  # 3 rounds of full page scroll
-            print(f"\nScroll round {scroll_round + 1}/3")
-            
-            # Scroll to bottom in chunks
-            current_position = 0
-            scroll_step = 800
-            
-            while current_position < last_height:
-                current_position += scroll_step
-                self.driver.execute_script(f"window.scrollTo(0, {current_position});")
-                human_delay(0.8, 1.2)  # Wait for content to load
-            
-            # Wait at bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            human_delay(1.5, 2)
-            
-            # Check if new content loaded
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            print(f"  Height: {last_height} → {new_height}")
-            
-            if new_height > last_height:
-                last_height = new_height
-                print(f"  ✓ New content loaded, continuing...")
-            else:
-                print(f"  ✓ No new content, page fully loaded")
-                break
+        data = self.scrape_profile(url, sections)
+        
+        # Partial scrapes merge into the cached row; don't cache failed loads (no name means the page didn't render)
+        if 'name' not in data or data['name'] not in ('', "N/A"):
+            try:
+                self.cache.set(url, data)
+            except (OSError, sqlite3.Error) as e:
+                log.warning("⚠ Could not write profile cache: %s", e)
         
-        # Scroll back to top
-        print("\nScrolling back to top...")
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        human_delay(1, 1.5)
+        return data
+    
+    def scrape_profile(self, url, sections=PROFILE_SECTIONS):
+        """Scrape the requested sections of a LinkedIn profile from the live page"""
+        data = {}
         
-        print("="*60)
-        print("CONTENT FULLY LOADED - STARTING EXTRACTION")
-        print("="*60)
+        # Stream sections to a partial JSONL file so a crash mid-profile keeps what was extracted
+        with PartialProfileWriter(url) as partial:
+            for section, value in self.iter_profile(url, sections):
+                data[section] = value
+                partial.write(section, value)
         
-        # Debug: print page info
-        print(f"DEBUG - Current URL: {self.driver.current_url}")
-        print(f"DEBUG - Page title: {self.driver.title}")
+        return data
+    
+    def iter_profile(self, url, sections=PROFILE_SECTIONS):
+        """Scrape a profile and yield (section, value) pairs as each section is extracted"""
+        sections = tuple(sections)
+        to_extract = self._resolve_sections(sections)
+        self.profile_name = None
         
-        data = {}
+        if not self._load_profile_over_http(url, to_extract):
+            self._load_profile_page(url, to_extract)
         
-        print("\n" + "="*60)
-        print("EXTRACTING PROFILE DATA")
-        print("="*60)
+        log.info("\n" + "="*60)
+        log.info("EXTRACTING PROFILE DATA")
+        log.info("="*60)
         
         # Add profile URL first
-        data['profile_url'] = url
-        
-        print("\n[1/15] Extracting name...")
-        data['name'] = self.extract_name()
-        print(f"→ {data['name']}")
+        yield 'profile_url', url
         
-        print("\n[2/15] Extracting location...")
-        data['location'] = self.extract_location()
-        print(f"→ {data['location']}")
+        # Only results other sections depend on are kept around
+        dependencies = {dep for deps in SECTION_DEPENDENCIES.values() for dep in deps}
+        inputs = {}
         
-        print("\n[3/15] Extracting about...")
-        data['about'] = self.extract_about()
-        print(f"→ {len(data['about'])} characters")
+        extractors = self._section_extractors()
+        for step, section in enumerate(to_extract, 1):
+            label, noun, extract = extractors[section]
+            log.info("\n[%s/%s] Extracting %s...", step, len(to_extract), label)
+            value = extract(inputs)
+            
+            if isinstance(value, list):
+                log.info("→ Found %s %s", len(value), noun)
+            elif noun:
+                log.info("→ %s %s", len(value), noun)
+            else:
+                log.info("→ %s", value)
+            
+            if section in dependencies:
+                inputs[section] = value
+            if section in sections:
+                yield section, value
         
-        print("\n[4/15] Extracting gender (from name + about)...")
-        data['gender'] = self.extract_gender_from_name(data['name'], data['about'])
-        print(f"→ {data['gender']}")
+        log.info("\n" + "="*60)
+        log.info("PROFILE EXTRACTION COMPLETE!")
+        log.info("="*60)
+    
+    def _load_profile_page(self, url, to_extract=PROFILE_SECTIONS):
+        """Open a profile, wait for it to render and read the embedded data / page snapshot"""
+        log.info("\nScraping profile: %s", url)
+        throttle_navigation()
+        self.driver.get(url)
+        self.section_cache = {}
         
-        print("\n[5/15] Extracting experiences...")
-        data['experiences'] = self.extract_experiences()
-        print(f"→ Found {len(data['experiences'])} experiences")
+        # Wait for page to load - proceed as soon as the first section renders.
+        # On timeout reload with backoff; give up rather than extract from an empty page
+        log.info("Waiting for page to load...")
+        for attempt in range(PAGE_LOAD_ATTEMPTS):
+            try:
+                self.wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "main section"))
+                )
+                break
+            except TimeoutException:
+                if attempt == PAGE_LOAD_ATTEMPTS - 1:
+                    raise TimeoutException(f"Profile page did not load after {PAGE_LOAD_ATTEMPTS} attempts: {url}")
+                delay = 2 ** attempt
+                log.warning("⚠ Page load timeout, reloading in %ss (attempt %s/%s)", delay, attempt + 2, PAGE_LOAD_ATTEMPTS)
+                time.sleep(delay)
+                throttle_navigation()
+                self.driver.refresh()
         
-        print("\n[6/15] Extracting education...")
-        data['education'] = self.extract_education()
-        print(f"→ Found {len(data['education'])} education entries")
+        # Structured JSON embedded in the page source (bpr-guid code blocks, present before any scrolling)
+        log.info("\nParsing embedded profile data...")
+        self.embedded = self.parse_embedded_data(url)
+        self.served_over_http = False
+        self.snapshot = {}
         
-        print("\n[7/15] Extracting estimated age...")
-        data['estimated_age'] = self.estimate_age(data['education'])
-        print(f"→ {data['estimated_age']}")
+        candidates = [section for section in to_extract
+                      if section not in _TOP_CARD_SECTIONS and section not in SECTION_DEPENDENCIES]
+        if all(section in self.embedded for section in candidates):
+            # The payload may hold only a section's first entries: compare them with the
+            # rendered "Show all N" totals before trusting it
+            log.info("\nHarvesting page snapshot...")
+            self.snapshot = self.harvest_profile()
         
-        print("\n[8/15] Extracting skills...")
-        data['skills'] = self.extract_skills()
-        print(f"→ Found {len(data['skills'])} skills")
+        # Scroll to load all lazy sections - stops once the page is complete and at the bottom.
+        # Skipped when the top card and complete embedded data already cover every section to extract
+        live = [section for section in candidates if not self._embedded_complete(section)]
+        if live:
+            log.info("\n" + "="*60)
+            log.info("LOADING ALL CONTENT")
+            log.info("="*60)
+            scroll_page_to_load(self.driver)
+            
+            log.info("="*60)
+            log.info("CONTENT FULLY LOADED - STARTING EXTRACTION")
+            log.info("="*60)
+        else:
+            log.info("→ Embedded data covers all sections, skipping lazy-load scroll")
         
-        print("\n[9/15] Extracting projects...")
-        data['projects'] = self.extract_projects()
-        print(f"→ Found {len(data['projects'])} projects")
+        # Debug: print page info
+        log.debug("DEBUG - Current URL: %s", self.driver.current_url)
+        log.debug("DEBUG - Page title: %s", self.driver.title)
         
-        print("\n[10/15] Extracting honors & awards...")
-        data['honors'] = self.extract_honors()
-        print(f"→ Found {len(data['honors'])} honors & awards")
+        # Read all main-page fields in one round-trip (already done when the scroll was skipped);
+        # extractors fall back to live DOM if empty
+        if live:
+            log.info("\nHarvesting page snapshot...")
+            self.snapshot = self.harvest_profile()
+        self.discover_sections()
+    
+    def _load_profile_over_http(self, url, to_extract):
+        """
+        Fetch the profile without the browser and use its embedded data if it covers every
+        section needed. Returns False (browser load needed) when it doesn't.
+        """
+        if not HTTP_FAST_PATH or not set(to_extract) <= set(HTTP_SECTIONS):
+            return False
         
-        print("\n[11/15] Extracting languages...")
-        data['languages'] = self.extract_languages()
-        print(f"→ Found {len(data['languages'])} languages")
+        if self.fetcher is None:
+            # Same user agent as the browser the session cookies came from
+            self.fetcher = ProfileFetcher(self.driver.execute_script("return navigator.userAgent"))
         
-        print("\n[12/15] Extracting licenses & certifications...")
-        data['licenses'] = self.extract_licenses()
-        print(f"→ Found {len(data['licenses'])} licenses & certifications")
+        log.info("\nFetching profile over HTTP: %s", url)
+        html = self.fetcher.fetch(url)
+        if not html:
+            log.info("→ HTTP fetch unavailable, using browser")
+            return False
         
-        print("\n[13/15] Extracting courses...")
-        data['courses'] = self.extract_courses()
-        print(f"→ Found {len(data['courses'])} courses")
+        try:
+            embedded = parse_embedded_profile(html, url)
+        except Exception as e:
+            log.warning("⚠ Embedded data parse failed, using browser: %s", e)
+            return False
         
-        print("\n[14/15] Extracting volunteering...")
-        data['volunteering'] = self.extract_volunteering()
-        print(f"→ Found {len(data['volunteering'])} volunteering experiences")
+        # A section missing from the payload may still be on the page, so only skip the browser if none is missing
+        missing = [section for section in to_extract if section != 'estimated_age' and section not in embedded]
+        if missing:
+            log.info("→ Embedded data lacks %s, using browser", ', '.join(missing))
+            return False
         
-        print("\n[15/15] Extracting test scores...")
-        data['test_scores'] = self.extract_test_scores()
-        print(f"→ Found {len(data['test_scores'])} test scores")
+        self.embedded = embedded
+        self.served_over_http = True
+        self.snapshot = {}
+        self.section_cache = {}
+        log.info("✓ Profile served from HTTP embedded data")
+        return True
+    
+    def _resolve_sections(self, sections):
+        """Requested sections plus the sections they depend on, in extraction order"""
+        needed = set(sections)
+        for section in sections:
+            needed.update(SECTION_DEPENDENCIES.get(section, ()))
         
-        print("\n" + "="*60)
-        print("PROFILE EXTRACTION COMPLETE!")
-        print("="*60)
+        unknown = needed - set(PROFILE_SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown profile sections: {', '.join(sorted(unknown))}")
         
-        return data
+        return [section for section in PROFILE_SECTIONS if section in needed]
     
-    def extract_name(self):
-        """Extract profile name"""
-        selectors = [
-            (By.CSS_SELECTOR, "h1.text-heading-xlarge"),
-            (By.XPATH, "//h1[contains(@class, 'inline')]"),
-            (By.XPATH, "//h1[contains(@class, 'text-heading')]"),
-        ]
+    def _section_extractors(self):
+        """Map each section to (progress label, result noun, extractor taking the data so far)"""
+        return {
+            'name': ("name", None, lambda data: self.extract_name()),
+            'location': ("location", None, lambda data: self.extract_location()),
+            'about': ("about", "characters", lambda data: self.extract_about()),
+            'gender': ("gender (from name + about)", None,
+                       lambda data: self.extract_gender_from_name(data['name'], data['about'])),
+            'experiences': ("experiences", "experiences", lambda data: self.extract_experiences()),
+            'education': ("education", "education entries", lambda data: self.extract_education()),
+            'estimated_age': ("estimated age", None, lambda data: self.estimate_age(data['education'])),
+            'skills': ("skills", "skills", lambda data: self.extract_skills()),
+            'projects': ("projects", "projects", lambda data: self.extract_projects()),
+            'honors': ("honors & awards", "honors & awards", lambda data: self.extract_honors()),
+            'languages': ("languages", "languages", lambda data: self.extract_languages()),
+            'licenses': ("licenses & certifications", "licenses & certifications", lambda data: self.extract_licenses()),
+            'courses': ("courses", "courses", lambda data: self.extract_courses()),
+            'volunteering': ("volunteering", "volunteering experiences", lambda data: self.extract_volunteering()),
+            'test_scores': ("test scores", "test scores", lambda data: self.extract_test_scores()),
+        }
+    
+    def harvest_profile(self):
+        """Read name, location, about and main-page section items in a single execute_script call"""
+        try:
+            snapshot = json.loads(self.driver.execute_script(PROFILE_EXTRACTOR_JS))
+            found = [key for key, section in snapshot.get('sections', {}).items() if section]
+            log.debug("✓ Snapshot harvested (sections: %s)", ', '.join(found) or 'none')
+            return snapshot
+        except Exception as e:
+            log.warning("⚠ Snapshot harvest failed, using live DOM: %s", e)
+            return {}
+    
+    def discover_sections(self):
+        """Find every section element in one execute_script call and seed the per-profile section cache"""
+        try:
+            elements = self.driver.execute_script(_DISCOVER_SECTIONS_JS, list(_SECTION_XPATHS))
+        except Exception as e:
+            log.warning("⚠ Section discovery failed, looking sections up one by one: %s", e)
+            return
+        # Misses are left out: _wait_for_section still gives a section that renders late its own wait
+        found = {xpath: element for xpath, element in zip(_SECTION_XPATHS, elements) if element is not None}
+        self.section_cache.update(found)
+        log.debug("✓ Sections discovered: %s of %s", len(found), len(_SECTION_XPATHS))
+    
+    def parse_embedded_data(self, url):
+        """Parse the profile's sections from the bpr-guid JSON payloads embedded in the page source"""
+        try:
+            embedded = parse_embedded_profile(self.driver.page_source, url)
+            if embedded:
+                log.debug("✓ Embedded data found (sections: %s)", ', '.join(embedded))
+            else:
+                log.debug("⚠ No embedded data, using DOM scraping")
+            return embedded
+        except Exception as e:
+            log.warning("⚠ Embedded data parse failed, using DOM scraping: %s", e)
+            return {}
+    
+    def _embedded_complete(self, key):
+        """True when the embedded entries cover the whole section, not just the first few"""
+        entries = self.embedded.get(key)
+        if not entries:
+            return False
+        # Served over HTTP there is no rendered section to count against
+        if self.served_over_http:
+            return True
+        _, section = self._snapshot_section(_SNAPSHOT_KEYS.get(key, key))
+        if not section:
+            return False
+        if not section['show_all']:
+            return True
+        total = section.get('show_all_total')
+        return total is not None and len(entries) >= total
+    
+    def _embedded_section(self, key):
+        """Return embedded entries for a section, or None to fall back to DOM scraping"""
+        if self._embedded_complete(key):
+            entries = self.embedded[key]
+            log.debug("  ✓ Using %s entries from embedded data", len(entries))
+            return list(entries)
+        if self.embedded.get(key):
+            log.debug("  ⚠ Embedded entries not confirmed complete, using DOM scraping")
+        return None
+    
+    def _wait_for_section(self, xpath):
+        """Wait for a section with fast_wait, retrying once with slow_wait; None if not found"""
+        # Memoized per profile; a cached element is re-looked up if the page re-rendered (e.g. after back)
+        if xpath in self.section_cache:
+            section = self.section_cache[xpath]
+            if section is None:
+                return None
+            try:
+                section.is_enabled()
+                return section
+            except StaleElementReferenceException:
+                pass
         
-        for by, selector in selectors:
+        section = None
+        for waiter in (self.fast_wait, self.slow_wait):
             try:
-                element = self.driver.find_element(by, selector)
-                name = element.text.strip()
-                if name:
-                    return name
-            except NoSuchElementException:
+                section = waiter.until(EC.presence_of_element_located((By.XPATH, xpath)))
+                break
+            except TimeoutException:
                 continue
+        self.section_cache[xpath] = section
+        return section
+    
+    def _bulk_extract(self, root, js):
+        """Run an in-page extraction script over root (element or list) in one round-trip"""
+        if not root:
+            return []
+        return self.driver.execute_script(js, root)
+    
+    def _snapshot_section(self, key):
+        """Return (harvested, section) for a snapshot section; section is None if absent"""
+        if not self.snapshot:
+            return False, None
+        return True, self.snapshot.get('sections', {}).get(key)
+    
+    def _snapshot_lacks(self, key):
+        """True when the page snapshot shows a live-DOM-only section is not on the page"""
+        return bool(self.snapshot) and not self.snapshot.get('present', {}).get(key, True)
+    
+    def extract_name(self):
+        """Extract profile name (looked up once per profile)"""
+        if self.profile_name is None:
+            self.profile_name = self._find_name()
+        return self.profile_name
+    
+    def _find_name(self):
+        name = self.embedded.get('name') or self.snapshot.get('name', '').strip()
+        if name:
+            return name
+        
+        elements = self.driver.find_elements(By.CSS_SELECTOR, _NAME_CSS)
+        name = elements[0].text.strip() if elements else ""
+        if name:
+            return name
         
         # Debug: print page source if name not found
-        print("⚠ Name not found! Current URL:", self.driver.current_url)
-        print("⚠ Page title:", self.driver.title)
+        log.warning("⚠ Name not found! Current URL: %s", self.driver.current_url)
+        log.warning("⚠ Page title: %s", self.driver.title)
         return "N/A"
     
     def extract_gender(self):
@@ -207,7 +634,7 @@ class LinkedInCrawler:
                 return pronouns_gender
             
             # Step 2: Fallback to name-based prediction
-            print("  No pronouns found, trying name-based prediction...")
+            log.debug("  No pronouns found, trying name-based prediction...")
             name = self.extract_name()
             if name and name != "N/A":
                 predicted_gender = self._predict_gender_from_name(name)
@@ -215,21 +642,14 @@ class LinkedInCrawler:
             
             return "Unknown"
         except Exception as e:
-            print(f"  Error extracting gender: {e}")
+            log.warning("  Error extracting gender: %s", e)
             return "Unknown"
     
     def _extract_gender_from_pronouns(self):
         """Extract gender from pronouns in profile header"""
         try:
             # Pronouns appear next to name in profile header with smaller font
-            selectors = [
-                (By.XPATH, "//h1[contains(@class, 'text-heading-xlarge')]/..//span[contains(@class, 'text-body-small')]"),
-                (By.XPATH, "//h1[contains(@class, 'text-heading-xlarge')]/following-sibling::*//span"),
-                (By.XPATH, "//div[.//h1[contains(@class, 'text-heading-xlarge')]]//span[contains(@class, 'text-body-small')]"),
-                (By.XPATH, "//main//section[1]//span[contains(@class, 'text-body-small')]"),
-            ]
-            
-            for by, selector in selectors:
+            for by, selector in _PRONOUN_LOCATORS:
                 try:
                     elements = self.driver.find_elements(by, selector)
                     
@@ -244,21 +664,21 @@ class LinkedInCrawler:
                         if '/' in text:
                             # Map pronouns to gender
                             if 'he' in text and 'him' in text:
-                                print(f"  Found pronouns: {element.text.strip()} → Male")
+                                log.debug("  Found pronouns: %s → Male", element.text.strip())
                                 return 'Male'
                             elif 'she' in text and 'her' in text:
-                                print(f"  Found pronouns: {element.text.strip()} → Female")
+                                log.debug("  Found pronouns: %s → Female", element.text.strip())
                                 return 'Female'
                             elif 'they' in text and 'them' in text:
-                                print(f"  Found pronouns: {element.text.strip()} → Non-binary")
+                                log.debug("  Found pronouns: %s → Non-binary", element.text.strip())
                                 return 'Non-binary'
-                    
+                
                 except NoSuchElementException:
                     continue
             
             return "N/A"
         except Exception as e:
-            print(f"  Error in pronoun extraction: {e}")
+            log.warning("  Error in pronoun extraction: %s", e)
             return "N/A"
     
     def extract_gender_from_name(self, full_name, about_text=""):
@@ -271,7 +691,7 @@ class LinkedInCrawler:
         
         # If unknown and about text is available, try to extract full name from about
         if result == "Unknown" and about_text:
-            print("  Primary name unknown, checking about section...")
+            log.debug("  Primary name unknown, checking about section...")
             # Look for patterns like "Nama saya [Full Name]" or "My name is [Full Name]"
             import re
             patterns = [
@@ -284,10 +704,10 @@ class LinkedInCrawler:
                 match = re.search(pattern, about_text)
                 if match:
                     full_name_from_about = match.group(1)
-                    print(f"  Found full name in about: '{full_name_from_about}'")
+                    log.debug("  Found full name in about: '%s'", full_name_from_about)
                     result = self._predict_gender_from_name(full_name_from_about)
                     if result != "Unknown":
-                        print(f"  ✓ Gender detected from about text: {result}")
+                        log.debug("  ✓ Gender detected from about text: %s", result)
                         return result
         
         return result
@@ -297,79 +717,81 @@ class LinkedInCrawler:
         try:
             # Clean and extract first name
             # Handle cases like "Sri.Mah Gunawan" → try "Sri", "Mah", "Gunawan"
-            name_parts = full_name.replace('.', ' ').replace(',', ' ').split()
+            name_parts = [part for part in _NAME_SPLIT_RE.split(full_name) if part]
             
             if not name_parts:
                 return "Unknown"
             
             # Try each name part until we find a match
             for idx, name_part in enumerate(name_parts):
-                result = self.gender_detector.get_gender(name_part)
+                result = _guess_gender(name_part)
                 
                 # gender-guesser returns: male, female, mostly_male, mostly_female, andy (androgynous), unknown
                 if result in ['male', 'mostly_male']:
-                    print(f"  Name prediction: '{name_part}' (part {idx+1}) → Male (confidence: {result})")
+                    log.debug("  Name prediction: '%s' (part %s) → Male (confidence: %s)", name_part, idx+1, result)
                     return 'Male'
                 elif result in ['female', 'mostly_female']:
-                    print(f"  Name prediction: '{name_part}' (part {idx+1}) → Female (confidence: {result})")
+                    log.debug("  Name prediction: '%s' (part %s) → Female (confidence: %s)", name_part, idx+1, result)
                     return 'Female'
                 elif result == 'andy':
-                    print(f"  Name prediction: '{name_part}' (part {idx+1}) → Ambiguous")
+                    log.debug("  Name prediction: '%s' (part %s) → Ambiguous", name_part, idx+1)
                     # Continue to next name part
                     continue
                 else:
                     # Unknown, try next part
-                    print(f"  Name prediction: '{name_part}' (part {idx+1}) → Unknown, trying next...")
+                    log.debug("  Name prediction: '%s' (part %s) → Unknown, trying next...", name_part, idx+1)
                     continue
             
             # If all parts are unknown, try with lowercase (some names work better in lowercase)
-            print("  Trying lowercase variants...")
+            log.debug("  Trying lowercase variants...")
             for idx, name_part in enumerate(name_parts):
-                result = self.gender_detector.get_gender(name_part.lower())
+                result = _guess_gender(name_part.lower())
                 
                 if result in ['male', 'mostly_male']:
-                    print(f"  Name prediction: '{name_part.lower()}' (part {idx+1}, lowercase) → Male (confidence: {result})")
+                    log.debug("  Name prediction: '%s' (part %s, lowercase) → Male (confidence: %s)", name_part.lower(), idx+1, result)
                     return 'Male'
                 elif result in ['female', 'mostly_female']:
-                    print(f"  Name prediction: '{name_part.lower()}' (part {idx+1}, lowercase) → Female (confidence: {result})")
+                    log.debug("  Name prediction: '%s' (part %s, lowercase) → Female (confidence: %s)", name_part.lower(), idx+1, result)
                     return 'Female'
             
             # Fallback: Check Indonesian name patterns
-            print("  Trying Indonesian name patterns...")
+            log.debug("  Trying Indonesian name patterns...")
             for idx, name_part in enumerate(name_parts):
                 name_lower = name_part.lower()
                 
                 # Check if name contains or matches Indonesian female indicators
                 for indicator in self.indonesian_female_indicators:
                     if indicator in name_lower or name_lower in indicator:
-                        print(f"  Indonesian pattern match: '{name_part}' contains '{indicator}' → Female")
+                        log.debug("  Indonesian pattern match: '%s' contains '%s' → Female", name_part, indicator)
                         return 'Female'
                 
                 # Check if name contains or matches Indonesian male indicators
                 for indicator in self.indonesian_male_indicators:
                     if indicator in name_lower or name_lower in indicator:
-                        print(f"  Indonesian pattern match: '{name_part}' contains '{indicator}' → Male")
+                        log.debug("  Indonesian pattern match: '%s' contains '%s' → Male", name_part, indicator)
                         return 'Male'
             
-            print(f"  All methods exhausted, cannot determine gender")
+            log.debug("  All methods exhausted, cannot determine gender")
             return 'Unknown'
         
         except Exception as e:
-            print(f"  Error in name-based prediction: {e}")
+            log.warning("  Error in name-based prediction: %s", e)
             return "Unknown"
     
     def extract_location(self):
         """Extract location (city) from profile header"""
+        location_text = self.embedded.get('location', '')
+        if location_text:
+            return location_text.split(',')[0].strip()
+        
+        if self.snapshot:
+            location_text = self.snapshot.get('location', '')
+            return location_text.split(',')[0].strip() if location_text else "N/A"
+        
         try:
             # Location is usually in the profile header section
             # Format: "Bandung, West Java, Indonesia"
-            selectors = [
-                (By.XPATH, "//div[contains(@class, 'mt2')]//span[contains(@class, 'text-body-small') and contains(., ',')]"),
-                (By.XPATH, "//span[contains(@class, 'text-body-small') and contains(., 'Indonesia') or contains(., 'Jakarta') or contains(., 'Bandung') or contains(., 'Surabaya')]"),
-                (By.CSS_SELECTOR, "div.mt2 span.text-body-small"),
-            ]
-            
-            for by, selector in selectors:
+            for by, selector in _LOCATION_LOCATORS:
                 try:
                     element = self.driver.find_element(by, selector)
                     location_text = element.text.strip()
@@ -388,13 +810,13 @@ class LinkedInCrawler:
                         return city
                     else:
                         return location_text
-                    
+                
                 except NoSuchElementException:
                     continue
             
             return "N/A"
         except Exception as e:
-            print(f"  Error extracting location: {e}")
+            log.warning("  Error extracting location: %s", e)
             return "N/A"
     
     def estimate_age(self, education_data):
@@ -416,7 +838,7 @@ class LinkedInCrawler:
                     continue
                 
                 # Extract year number (handle "2020", "2018 - 2020", etc)
-                year_match = re.findall(r'\d{4}', year_str)
+                year_match = _YEAR_RE.findall(year_str)
                 if year_match:
                     # Get the latest year (graduation year)
                     year = int(year_match[-1])
@@ -429,47 +851,27 @@ class LinkedInCrawler:
             if not graduation_years:
                 return "Unknown"
             
-            # Sort by year (most recent first)
-            graduation_years.sort(key=lambda x: x['year'], reverse=True)
-            
             # Use the most recent graduation to estimate age
-            latest_grad = graduation_years[0]
+            latest_grad = max(graduation_years, key=itemgetter('year'))
             grad_year = latest_grad['year']
             degree = latest_grad['degree']
             
-            # Estimate graduation age based on degree level
-            # High School: ~18 years old
-            # Bachelor/S1: ~22 years old
-            # Master/S2: ~24 years old
-            # Doctoral/PhD/S3: ~27 years old
-            
-            if any(keyword in degree for keyword in ['high school', 'sma', 'smk', 'smu']):
-                graduation_age = 18
-            elif any(keyword in degree for keyword in ['master', 's2', 'magister', 'mba']):
-                graduation_age = 24
-            elif any(keyword in degree for keyword in ['doctor', 'phd', 's3', 'doctoral']):
-                graduation_age = 27
-            elif any(keyword in degree for keyword in ['bachelor', 's1', 'sarjana', 'degree']):
-                graduation_age = 22
-            elif any(keyword in degree for keyword in ['diploma', 'd3', 'd4']):
-                graduation_age = 21
-            else:
-                # Default to bachelor's age if degree type unclear
-                graduation_age = 22
+            # Estimate graduation age based on degree level (default to bachelor's age if unclear)
+            graduation_age = next((age for pattern, age in _DEGREE_AGES if pattern.search(degree)), 22)
             
             # Calculate estimated current age
             estimated_age = (current_year - grad_year) + graduation_age
             
             # Sanity check: age should be between 18-70
             if estimated_age < 18 or estimated_age > 70:
-                print(f"  Age estimation out of range: {estimated_age} (grad year: {grad_year}, degree: {degree})")
+                log.debug("  Age estimation out of range: %s (grad year: %s, degree: %s)", estimated_age, grad_year, degree)
                 return "Unknown"
             
             # Return age range (±2 years for uncertainty)
             age_min = max(18, estimated_age - 2)
             age_max = min(70, estimated_age + 2)
             
-            print(f"  Estimated from {degree} graduation ({grad_year}): ~{estimated_age} years old (range: {age_min}-{age_max})")
+            log.debug("  Estimated from %s graduation (%s): ~%s years old (range: %s-%s)", degree, grad_year, estimated_age, age_min, age_max)
             
             return {
                 'estimated_age': estimated_age,
@@ -478,41 +880,30 @@ class LinkedInCrawler:
             }
         
         except Exception as e:
-            print(f"  Error estimating age: {e}")
+            log.warning("  Error estimating age: %s", e)
             return "Unknown"
     
     def extract_about(self):
         """Extract about section"""
+        if self.snapshot:
+            return self.snapshot.get('about') or "N/A"
+        
         try:
-            about_section = self.driver.find_element(
-                By.XPATH, 
-                "//section[contains(@id, 'about') or .//h2[contains(., 'About')]]"
-            )
+            about_section = self.driver.find_element(By.XPATH, _ABOUT_XPATH)
             
-            smooth_scroll(self.driver, about_section)
-            
-            # Click see more if exists
+            # Click see more if exists (scrolled into view without the smooth-scroll pause)
             try:
-                see_more = about_section.find_element(By.XPATH, ".//button[contains(., 'more')]")
+                see_more = about_section.find_element(By.XPATH, _SEE_MORE_XPATH)
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", see_more)
                 see_more.click()
-                human_delay(0.5, 0.8)
+                self.fast_wait.until(EC.invisibility_of_element(see_more))
             except:
                 pass
             
-            text_selectors = [
-                ".//div[contains(@class, 'display-flex')]//span[@aria-hidden='true']",
-                ".//div[contains(@class, 'inline-show-more-text')]//span",
-                ".//span[@aria-hidden='true']",
-            ]
-            
-            for selector in text_selectors:
-                try:
-                    text_element = about_section.find_element(By.XPATH, selector)
-                    text = text_element.text.strip()
-                    if text and len(text) > 20:
-                        return text
-                except NoSuchElementException:
-                    continue
+            for text_element in about_section.find_elements(By.CSS_SELECTOR, _ABOUT_TEXT_CSS):
+                text = text_element.text.strip()
+                if text and len(text) > 20:
+                    return text
             
             return "N/A"
         except Exception:
@@ -520,644 +911,488 @@ class LinkedInCrawler:
     
     def extract_experiences(self):
         """Extract experience section with show all flow"""
+        embedded = self._embedded_section('experiences')
+        if embedded is not None:
+            return embedded
+        
         experiences = []
+        
+        harvested, snap_section = self._snapshot_section('experience')
+        if harvested and not snap_section:
+            log.debug("⚠ Experience section not found")
+            return experiences
+        if snap_section and not snap_section['show_all']:
+            log.debug("  Parsing %s items from page snapshot...", len(snap_section['items']))
+            return self._parse_experience_items([item['text'] for item in snap_section['items']])
+        
         try:
-            print("Looking for experience section...")
+            log.debug("Looking for experience section...")
             
             # Find section
-            exp_section = None
-            selectors = [
-                "//section[contains(@id, 'experience')]",
-                "//section[.//div[@id='experience']]",
-                "//section[.//h2[contains(text(), 'Experience')]]",
-            ]
-            
-            for selector in selectors:
-                try:
-                    exp_section = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print("✓ Found section")
-                    break
-                except TimeoutException:
-                    continue
+            exp_section = self._wait_for_section(_EXP_XPATH)
+            if exp_section:
+                log.debug("✓ Found section")
             
             if not exp_section:
-                print("⚠ Experience section not found")
+                log.debug("⚠ Experience section not found")
                 return experiences
             
             # Click "Show all"
-            clicked = click_show_all(self.driver, exp_section)
+            # Skip the detail page round-trip when the main page already lists every item
+            clicked = show_all_needed(exp_section) and click_show_all(self.driver, exp_section)
             
             if clicked:
                 # Extract from detail page
                 items = extract_items_from_detail_page(self.driver)
-                print(f"Processing {len(items)} items...")
-                
-                for idx, item in enumerate(items):
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 20:
-                            continue
-                        
-                        print(f"\n  === Item {idx + 1}/{len(items)} ===")
-                        print(f"  Raw text length: {len(text)} chars")
-                        print(f"  First 200 chars: {text[:200]}...")
-                        
-                        # Skip nested items (Skills:, etc)
-                        if text.startswith('Skills:') or text.startswith('Skill'):
-                            print(f"  → SKIP: Nested skills item")
-                            continue
-                        
-                        # Skip if it's just a certificate/training line
-                        if text.startswith('Certificate') or text.startswith('Training'):
-                            print(f"  → SKIP: Certificate/Training item")
-                            continue
-                        
-                        # Must have company indicator OR be a valid experience format
-                        # Some experiences don't have · in first line if it's just title
-                        
-                        # Split by newlines and remove duplicates (LinkedIn has duplicate lines)
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        
-                        # Remove consecutive duplicates
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"  Total unique lines: {len(lines)}")
-                        for i, line in enumerate(lines[:12]):  # Show first 12
-                            print(f"    [{i}] {line[:100]}")
-                        
-                        # LinkedIn structure after deduplication:
-                        # 0: Title
-                        # 1: Company (with or without · Type)
-                        # 2: Date range (e.g., "Aug 2024 - Present · 6 mos")
-                        # 3: Date range again (e.g., "Aug 2024 to Present · 6 mos") 
-                        # 4: Location (if exists)
-                        # 5+: Description/Skills/Certificate (skip these)
-                        
-                        if len(lines) >= 3:
-                            # Check if line 1 looks like a company (has · or is just company name)
-                            # Check if line 2 looks like duration (has date or "Present")
-                            line1_is_company = True  # Assume line 1 is company
-                            line2_is_duration = (
-                                '-' in lines[2] or 
-                                'Present' in lines[2] or 
-                                'to' in lines[2].lower() or
-                                any(month in lines[2] for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
-                            )
-                            
-                            if not line2_is_duration:
-                                print(f"  → SKIP: Line 2 doesn't look like duration: {lines[2][:50]}")
-                                continue
-                            
-                            # Find location: it's after the duplicate date line
-                            location = ""
-                            if len(lines) > 4:
-                                potential_location = lines[4]
-                                # Location is short and doesn't look like description or certificate
-                                is_location = (
-                                    len(potential_location) < 100 and
-                                    ' to ' not in potential_location and
-                                    'http' not in potential_location.lower() and
-                                    'www.' not in potential_location.lower() and
-                                    not potential_location.startswith('Certificate') and
-                                    not potential_location.startswith('Training') and
-                                    not (len(potential_location) > 50 and ' is ' in potential_location)
-                                )
-                                
-                                if is_location:
-                                    location = potential_location
-                            
-                            exp_data = {
-                                'title': lines[0],
-                                'company': lines[1],
-                                'duration': lines[2],
-                                'location': location
-                            }
-                            
-                            experiences.append(exp_data)
-                            print(f"  ✓ ADDED {len(experiences)}. {exp_data['title']} at {exp_data['company'][:50]}")
-                        else:
-                            print(f"  → SKIP: Not enough lines ({len(lines)})")
-                    
-                    except Exception as e:
-                        print(f"  Error parsing item {idx}: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        continue
+                log.debug("Processing %s items...", len(items))
                 
+                # All item texts in one execute_script call, then parsed in Python
+                experiences.extend(self._parse_experience_detail_items(self._bulk_extract(items, _ITEM_TEXTS_JS)))
                 # Click back
                 click_back_arrow(self.driver)
             
             else:
                 # No "Show all" button - extract from main page
-                print("  Extracting from main page...")
-                items = exp_section.find_elements(By.XPATH, ".//ul/li")
-                print(f"  Found {len(items)} items on main page")
+                log.debug("  Extracting from main page...")
+                # All item texts in one round-trip instead of 1 + N WebDriver calls
+                texts = self._bulk_extract(exp_section, _SECTION_ITEM_TEXTS_JS)
+                log.debug("  Found %s items on main page", len(texts))
                 
-                for idx, item in enumerate(items):
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 20:
-                            continue
-                        
-                        print(f"\n  === Item {idx + 1}/{len(items)} ===")
-                        
-                        # Check if this is a GROUPED experience (multiple roles at same company)
-                        # Pattern: Company name first (no ·), then multiple roles with ·
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"  Lines: {len(lines)}")
-                        for i, line in enumerate(lines[:8]):
-                            print(f"    [{i}] {line[:80]}")
-                        
-                        # Detect grouped: 
-                        # Grouped = Line 0 is company (no ·), Line 1 has "Full-time · X yrs X mos" (total duration with time), Line 2 is location, Line 3+ are roles
-                        # Normal = Line 0 is title (no ·), Line 1 is "Company · Full-time" (company with type, NO duration), Line 2 is duration
-                        is_grouped = False
-                        if len(lines) >= 4 and '·' not in lines[0]:
-                            # Key difference: Grouped has duration (yr/mo) in line 1, Single doesn't
-                            # Grouped line 1: "Full-time · 3 yrs 9 mos"
-                            # Single line 1: "PT Bank Mandiri · Full-time" (no yr/mo)
-                            line1_has_duration = ('yr' in lines[1] or 'mo' in lines[1])
-                            
-                            # Also check that line 3 looks like a role title (not a date)
-                            line3_is_role = (
-                                len(lines) > 3 and
-                                '-' not in lines[3] and  # Not a date range
-                                'Present' not in lines[3] and
-                                not any(month in lines[3] for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
-                            )
-                            
-                            if line1_has_duration and line3_is_role:
-                                # Line 0 = Company, Line 1 = Total duration, Line 2 = Location, Line 3+ = Roles
-                                is_grouped = True
+                experiences.extend(self._parse_experience_items(texts))
+        
+        except Exception as e:
+            log.warning("Error: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
+        
+        return experiences
+    
+    def _parse_experience_detail_items(self, texts):
+        """Parse experience entries from "Show all" detail page item texts"""
+        experiences = []
+        
+        for idx, text in enumerate(texts):
+            try:
+                text = text.strip()
+                if not text or len(text) < 20:
+                    continue
+                
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("\n  === Item %s/%s ===", idx + 1, len(texts))
+                    log.debug("  Raw text length: %s chars", len(text))
+                    log.debug("  First 200 chars: %s...", text[:200])
+                
+                # Skip nested items (Skills:, etc)
+                if text.startswith('Skills:') or text.startswith('Skill'):
+                    log.debug("  → SKIP: Nested skills item")
+                    continue
+                
+                # Skip if it's just a certificate/training line
+                if text.startswith('Certificate') or text.startswith('Training'):
+                    log.debug("  → SKIP: Certificate/Training item")
+                    continue
+                
+                # Must have company indicator OR be a valid experience format
+                # Some experiences don't have · in first line if it's just title
+                
+                # Split by newlines and remove consecutive duplicates (LinkedIn has duplicate lines)
+                lines = _dedupe_lines(text)
+                n = len(lines)
+                
+                log.debug("  Total unique lines: %s", n)
+                if log.isEnabledFor(logging.DEBUG):
+                    for i, line in enumerate(islice(lines, 12)):
+                        log.debug("    [%s] %s", i, line[:100])
+                
+                # LinkedIn structure after deduplication:
+                # 0: Title
+                # 1: Company (with or without · Type)
+                # 2: Date range (e.g., "Aug 2024 - Present · 6 mos")
+                # 3: Date range again (e.g., "Aug 2024 to Present · 6 mos") 
+                # 4: Location (if exists)
+                # 5+: Description/Skills/Certificate (skip these)
+                
+                if n >= 3:
+                    # Check if line 1 looks like a company (has · or is just company name)
+                    # Check if line 2 looks like duration (has date or "Present")
+                    line1_is_company = True  # Assume line 1 is company
+                    line2_is_duration = bool(_DURATION_LINE.search(lines[2]))
+                    
+                    if not line2_is_duration:
+                        log.debug("  → SKIP: Line 2 doesn't look like duration: %s", lines[2][:50])
+                        continue
+                    
+                    # Find location: it's after the duplicate date line
+                    location = ""
+                    if n > 4:
+                        potential_location = lines[4]
+                        # Location is short and doesn't look like description or certificate
+                        is_location = (
+                            len(potential_location) < 100 and
+                            not _LOC_REJECT.search(potential_location) and
+                            not potential_location.startswith(('Certificate', 'Training')) and
+                            not (len(potential_location) > 50 and ' is ' in potential_location)
+                        )
                         
-                        if is_grouped:
-                            print(f"  → GROUPED experience detected")
-                            # Handle grouped: multiple roles at same company
-                            # Structure: Company, Total Duration, Location, Role1 Title, Role1 Duration, Role1 Duration Dup, Role2 Title...
-                            
-                            company = lines[0]
-                            company_location = lines[2] if len(lines) > 2 else ""
-                            
-                            # Parse roles starting from line 3
-                            i = 3
-                            while i < len(lines):
-                                # Each role: Title, Duration, Duration Dup (skip)
-                                if i >= len(lines):
-                                    break
-                                
-                                role_title = lines[i]
-                                
-                                # Skip if this looks like a certificate or skills line
-                                if role_title.startswith('Certificate') or role_title.startswith('Skills:'):
-                                    i += 1
-                                    continue
-                                
-                                # Check if next line is duration (has - or Present)
-                                if i + 1 < len(lines) and ('-' in lines[i + 1] or 'Present' in lines[i + 1]):
-                                    role_duration = lines[i + 1]
-                                    
-                                    # Add this role as separate experience
-                                    exp_data = {
-                                        'title': role_title,
-                                        'company': company,
-                                        'duration': role_duration,
-                                        'location': company_location
-                                    }
-                                    experiences.append(exp_data)
-                                    print(f"  ✓ ADDED {len(experiences)}. {exp_data['title']} at {company}")
-                                    
-                                    # Skip duplicate duration line (line i+2) and move to next role
-                                    i += 3
-                                else:
-                                    # Not a valid role, skip
-                                    i += 1
-                            
+                        if is_location:
+                            location = potential_location
+                    
+                    exp_data = {
+                        'title': lines[0],
+                        'company': lines[1],
+                        'duration': lines[2],
+                        'location': location
+                    }
+                    
+                    experiences.append(exp_data)
+                    log.debug("  ✓ ADDED %s. %s at %s", len(experiences), exp_data['title'], exp_data['company'][:50])
+                else:
+                    log.debug("  → SKIP: Not enough lines (%s)", n)
+            
+            except Exception as e:
+                log.warning("  Error parsing item %s: %s", idx, e, exc_info=log.isEnabledFor(logging.DEBUG))
+                continue
+        
+        return experiences
+    
+    def _parse_experience_items(self, texts):
+        """Parse experience entries from main-page item texts (handles grouped roles)"""
+        experiences = []
+        
+        for idx, text in enumerate(texts):
+            try:
+                text = text.strip()
+                if not text or len(text) < 20:
+                    continue
+                
+                log.debug("\n  === Item %s/%s ===", idx + 1, len(texts))
+                
+                # Check if this is a GROUPED experience (multiple roles at same company)
+                # Pattern: Company name first (no ·), then multiple roles with ·
+                lines = _dedupe_lines(text)
+                n = len(lines)
+                
+                log.debug("  Lines: %s", n)
+                if log.isEnabledFor(logging.DEBUG):
+                    for i, line in enumerate(islice(lines, 8)):
+                        log.debug("    [%s] %s", i, line[:80])
+                
+                # Detect grouped: 
+                # Grouped = Line 0 is company (no ·), Line 1 has "Full-time · X yrs X mos" (total duration with time), Line 2 is location, Line 3+ are roles
+                # Normal = Line 0 is title (no ·), Line 1 is "Company · Full-time" (company with type, NO duration), Line 2 is duration
+                is_grouped = False
+                if n >= 4 and '·' not in lines[0]:
+                    # Key difference: Grouped has duration (yr/mo) in line 1, Single doesn't
+                    # Grouped line 1: "Full-time · 3 yrs 9 mos"
+                    # Single line 1: "PT Bank Mandiri · Full-time" (no yr/mo)
+                    line1_has_duration = bool(_TENURE_HINT.search(lines[1]))
+                    
+                    # Also check that line 3 looks like a role title (not a date)
+                    line3_is_role = n > 3 and not _DATE_HINT.search(lines[3])  # Not a date range
+                    
+                    if line1_has_duration and line3_is_role:
+                        # Line 0 = Company, Line 1 = Total duration, Line 2 = Location, Line 3+ = Roles
+                        is_grouped = True
+                
+                if is_grouped:
+                    log.debug("  → GROUPED experience detected")
+                    # Handle grouped: multiple roles at same company
+                    # Structure: Company, Total Duration, Location, Role1 Title, Role1 Duration, Role1 Duration Dup, Role2 Title...
+                    
+                    company = lines[0]
+                    company_location = lines[2] if n > 2 else ""
+                    
+                    # Parse roles starting from line 3
+                    i = 3
+                    while i < n:
+                        # Each role: Title, Duration, Duration Dup (skip)
+                        if i >= n:
+                            break
+                        
+                        role_title = lines[i]
+                        
+                        # Skip if this looks like a certificate or skills line
+                        if role_title.startswith('Certificate') or role_title.startswith('Skills:'):
+                            i += 1
                             continue
                         
-                        # Normal single experience
-                        # Line 0 = Title, Line 1 = Company (has ·), Line 2 = Duration, Line 3 = Duration dup, Line 4 = Location
-                        if len(lines) >= 3:
-                            # Check if line 1 has company indicator (· for employment type or just company name)
-                            # Check if line 2 looks like duration
-                            line2_is_duration = (
-                                '-' in lines[2] or 
-                                'Present' in lines[2] or 
-                                'to' in lines[2].lower() or
-                                any(month in lines[2] for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
-                            )
+                        # Check if next line is duration (has - or Present)
+                        if i + 1 < n and _ROLE_DURATION.search(lines[i + 1]):
+                            role_duration = lines[i + 1]
                             
-                            if line2_is_duration:
-                                location = ""
-                                # Location is at line 4 (after duplicate duration at line 3)
-                                if len(lines) > 4:
-                                    potential_location = lines[4]
-                                    is_location = (
-                                        len(potential_location) < 100 and
-                                        ' to ' not in potential_location and
-                                        'http' not in potential_location.lower() and
-                                        'www.' not in potential_location.lower() and
-                                        not potential_location.startswith('Certificate') and
-                                        not potential_location.startswith('Skills:') and
-                                        not (len(potential_location) > 50 and ' is ' in potential_location)
-                                    )
-                                    if is_location:
-                                        location = potential_location
-                                
-                                exp_data = {
-                                    'title': lines[0],
-                                    'company': lines[1],
-                                    'duration': lines[2],
-                                    'location': location
-                                }
-                                experiences.append(exp_data)
-                                print(f"  ✓ ADDED {len(experiences)}. {exp_data['title']} at {exp_data['company'][:50]}")
-                            else:
-                                print(f"  → SKIP: Line 2 doesn't look like duration: {lines[2][:50]}")
+                            # Add this role as separate experience
+                            exp_data = {
+                                'title': role_title,
+                                'company': company,
+                                'duration': role_duration,
+                                'location': company_location
+                            }
+                            experiences.append(exp_data)
+                            log.debug("  ✓ ADDED %s. %s at %s", len(experiences), exp_data['title'], company)
+                            
+                            # Skip duplicate duration line (line i+2) and move to next role
+                            i += 3
                         else:
-                            print(f"  → SKIP: Not enough lines ({len(lines)})")
+                            # Not a valid role, skip
+                            i += 1
                     
-                    except Exception as e:
-                        print(f"  Error: {e}")
-                        continue
-        
-        except Exception as e:
-            print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
+                    continue
+                
+                # Normal single experience
+                # Line 0 = Title, Line 1 = Company (has ·), Line 2 = Duration, Line 3 = Duration dup, Line 4 = Location
+                if n >= 3:
+                    # Check if line 1 has company indicator (· for employment type or just company name)
+                    # Check if line 2 looks like duration
+                    line2_is_duration = bool(_DURATION_LINE.search(lines[2]))
+                    
+                    if line2_is_duration:
+                        location = ""
+                        # Location is at line 4 (after duplicate duration at line 3)
+                        if n > 4:
+                            potential_location = lines[4]
+                            is_location = (
+                                len(potential_location) < 100 and
+                                not _LOC_REJECT.search(potential_location) and
+                                not potential_location.startswith(('Certificate', 'Skills:')) and
+                                not (len(potential_location) > 50 and ' is ' in potential_location)
+                            )
+                            if is_location:
+                                location = potential_location
+                        
+                        exp_data = {
+                            'title': lines[0],
+                            'company': lines[1],
+                            'duration': lines[2],
+                            'location': location
+                        }
+                        experiences.append(exp_data)
+                        log.debug("  ✓ ADDED %s. %s at %s", len(experiences), exp_data['title'], exp_data['company'][:50])
+                    else:
+                        log.debug("  → SKIP: Line 2 doesn't look like duration: %s", lines[2][:50])
+                else:
+                    log.debug("  → SKIP: Not enough lines (%s)", n)
+            
+            except Exception as e:
+                log.warning("  Error: %s", e)
+                continue
         
         return experiences
     
     def extract_education(self):
         """Extract education section with show all flow"""
+        embedded = self._embedded_section('education')
+        if embedded is not None:
+            return embedded
+        
         education = []
+        
+        harvested, snap_section = self._snapshot_section('education')
+        if harvested and not snap_section:
+            log.debug("⚠ Education section not found")
+            return education
+        if snap_section and not snap_section['show_all']:
+            log.debug("  Parsing %s items from page snapshot...", len(snap_section['items']))
+            return self._parse_education_items([item['text'] for item in snap_section['items']])
+        
         try:
-            print("Looking for education section...")
-            
-            edu_section = None
-            selectors = [
-                "//section[contains(@id, 'education')]",
-                "//section[.//div[@id='education']]",
-                "//section[.//h2[contains(text(), 'Education')]]",
-            ]
+            log.debug("Looking for education section...")
             
-            for selector in selectors:
-                try:
-                    edu_section = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print("✓ Found section")
-                    break
-                except TimeoutException:
-                    continue
+            edu_section = self._wait_for_section(_EDU_XPATH)
+            if edu_section:
+                log.debug("✓ Found section")
             
             if not edu_section:
-                print("⚠ Education section not found")
+                log.debug("⚠ Education section not found")
                 return education
             
             # Click "Show all"
-            clicked = click_show_all(self.driver, edu_section)
+            clicked = show_all_needed(edu_section) and click_show_all(self.driver, edu_section)
             
             if clicked:
                 items = extract_items_from_detail_page(self.driver)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 5:
-                            continue
-                        
-                        # Remove consecutive duplicates
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"  Education item lines: {len(lines)}")
-                        for i, line in enumerate(lines[:6]):
-                            print(f"    {i}: {line[:80]}")
-                        
-                        # Skip if it's "Activities and societies" or "...see more"
-                        if lines[0].startswith('Activities and societies') or lines[0] == '…see more':
-                            print(f"  → SKIP: Activities/see more line")
-                            continue
-                        
-                        # LinkedIn structure after deduplication varies:
-                        # Sometimes: School, School (dup), Degree, Year
-                        # Sometimes: School, Degree, Year
-                        # Need to detect which format
-                        
-                        if len(lines) >= 2:
-                            school = lines[0]
-                            degree = ""
-                            year = ""
-                            
-                            # Check if line 1 is duplicate of line 0
-                            if len(lines) > 1 and lines[1] == lines[0]:
-                                # Format: School, School, Degree, Year
-                                degree = lines[2] if len(lines) > 2 else ""
-                                year_line = lines[3] if len(lines) > 3 else ""
-                            else:
-                                # Format: School, Degree, Year
-                                degree = lines[1] if len(lines) > 1 else ""
-                                year_line = lines[2] if len(lines) > 2 else ""
-                            
-                            # Extract just the end year from year range
-                            if year_line:
-                                if '-' in year_line or '–' in year_line:
-                                    # Split by dash and get last part
-                                    parts = year_line.replace('–', '-').split('-')
-                                    year = parts[-1].strip()
-                                else:
-                                    year = year_line.strip()
-                            
-                            edu_data = {
-                                'school': school,
-                                'degree': degree,
-                                'year': year
-                            }
-                            education.append(edu_data)
-                            print(f"  ✓ {len(education)}. {edu_data['school']}")
-                    except Exception as e:
-                        print(f"  Error parsing education: {e}")
-                        continue
+                # Detail-page items have the same line structure as the main page
+                education.extend(self._parse_education_items(self._bulk_extract(items, _ITEM_TEXTS_JS)))
                 
                 click_back_arrow(self.driver)
             else:
                 # No show all, extract from main page
-                print("  Extracting from main page...")
-                items = edu_section.find_elements(By.XPATH, ".//ul/li")
+                log.debug("  Extracting from main page...")
+                texts = self._bulk_extract(edu_section, _SECTION_ITEM_TEXTS_JS)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 5:
-                            continue
-                        
-                        # Remove consecutive duplicates
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"  Education lines ({len(lines)}):")
-                        for i, line in enumerate(lines[:6]):
-                            print(f"    [{i}] {line[:80]}")
-                        
-                        # Skip if it's "Activities and societies" or "...see more"
-                        if lines[0].startswith('Activities and societies') or lines[0] == '…see more':
-                            print(f"  → SKIP: Activities/see more line")
-                            continue
-                        
-                        if len(lines) >= 2:
-                            school = lines[0]
-                            degree = ""
-                            year = ""
-                            
-                            # Check if line 1 is duplicate of line 0
-                            if len(lines) > 1 and lines[1] == lines[0]:
-                                # Format: School, School, Degree, Year
-                                degree = lines[2] if len(lines) > 2 else ""
-                                year_line = lines[3] if len(lines) > 3 else ""
-                            else:
-                                # Format: School, Degree, Year
-                                degree = lines[1] if len(lines) > 1 else ""
-                                year_line = lines[2] if len(lines) > 2 else ""
-                            
-                            # Extract just the end year from year range
-                            if year_line:
-                                if '-' in year_line or '–' in year_line:
-                                    # Split by dash and get last part
-                                    parts = year_line.replace('–', '-').split('-')
-                                    year = parts[-1].strip()
-                                else:
-                                    year = year_line.strip()
-                            
-                            edu_data = {
-                                'school': school,
-                                'degree': degree,
-                                'year': year
-                            }
-                            education.append(edu_data)
-                            print(f"  ✓ {len(education)}. {edu_data['school']}")
-                    except Exception as e:
-                        print(f"  Error: {e}")
-                        continue
+                education.extend(self._parse_education_items(texts))
         
         except Exception as e:
-            print(f"Error: {e}")
+            log.warning("Error: %s", e)
         
         return education
     
-    def extract_skills(self):
-        """Extract skills section with details"""
-        skills = []
-        try:
-            print("Looking for skills section...")
-            
-            skills_section = None
-            selectors = [
-                "//section[contains(@id, 'skills')]",
-                "//section[.//div[@id='skills']]",
-                "//section[.//h2[contains(text(), 'Skills')]]",
-            ]
-            
-            for selector in selectors:
-                try:
-                    skills_section = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print("✓ Found section")
-                    break
-                except TimeoutException:
+    def _parse_education_items(self, texts):
+        """Parse education entries from main-page or detail-page item texts"""
+        education = []
+        
+        for text in texts:
+            try:
+                text = text.strip()
+                if not text or len(text) < 5:
                     continue
+                
+                # Remove consecutive duplicates
+                lines = _dedupe_lines(text)
+                n = len(lines)
+                
+                log.debug("  Education lines (%s):", n)
+                if log.isEnabledFor(logging.DEBUG):
+                    for i, line in enumerate(islice(lines, 6)):
+                        log.debug("    [%s] %s", i, line[:80])
+                
+                # Skip if it's "Activities and societies" or "...see more"
+                if lines[0].startswith('Activities and societies') or lines[0] == '…see more':
+                    log.debug("  → SKIP: Activities/see more line")
+                    continue
+                
+                if n >= 2:
+                    school = lines[0]
+                    degree = ""
+                    year = ""
+                    
+                    # Check if line 1 is duplicate of line 0
+                    if lines[1] == lines[0]:
+                        # Format: School, School, Degree, Year
+                        degree = lines[2] if n > 2 else ""
+                        year_line = lines[3] if n > 3 else ""
+                    else:
+                        # Format: School, Degree, Year
+                        degree = lines[1]
+                        year_line = lines[2] if n > 2 else ""
+                    
+                    # Extract just the end year from year range
+                    if year_line:
+                        # Last part after the final dash, or the whole line if there is no range
+                        match = _YEAR_END.search(year_line)
+                        year = (match.group(1) if match else year_line).strip()
+                    
+                    edu_data = {
+                        'school': school,
+                        'degree': degree,
+                        'year': year
+                    }
+                    education.append(edu_data)
+                    log.debug("  ✓ %s. %s", len(education), edu_data['school'])
+            except Exception as e:
+                log.warning("  Error: %s", e)
+                continue
+        
+        return education
+    
+    def extract_skills(self):
+        """Extract skills section with details"""
+        embedded = self._embedded_section('skills')
+        if embedded is not None:
+            return embedded
+        
+        skills = []
+        # Used on every skill with a details modal
+        driver = self.driver
+        
+        harvested, snap_section = self._snapshot_section('skills')
+        if harvested and not snap_section:
+            log.debug("⚠ Skills section not found")
+            return skills
+        if snap_section and not snap_section['show_all']:
+            log.debug("  Parsing %s items from page snapshot...", len(snap_section['items']))
+            return self._parse_skill_names([item['spans'] for item in snap_section['items']])
+        
+        try:
+            log.debug("Looking for skills section...")
+            
+            skills_section = self._wait_for_section(_SKILLS_XPATH)
+            if skills_section:
+                log.debug("✓ Found section")
             
             if not skills_section:
-                print("⚠ Skills section not found")
+                log.debug("⚠ Skills section not found")
                 return skills
             
             # Click "Show all skills"
-            clicked = click_show_all(self.driver, skills_section)
+            clicked = click_show_all(driver, skills_section)
             
             if clicked:
-                items = extract_items_from_detail_page(self.driver)
-                print(f"Found {len(items)} skill items")
+                items = extract_items_from_detail_page(driver)
+                log.debug("Found %s skill items", len(items))
+                
+                # Names + visible details for every item in one round-trip
+                item_data = self._bulk_extract(items, _SKILL_ITEMS_JS)
                 
-                for idx, item in enumerate(items):
+                for idx, (item, data) in enumerate(zip(items, item_data)):
                     try:
                         # Get skill name from first span
-                        skill_spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
-                        
-                        if not skill_spans:
-                            continue
-                        
-                        skill_name = skill_spans[0].text.strip()
+                        skill_name = data['name']
                         
                         if not skill_name:
                             continue
                         
-                        # Filter junk
-                        skip_if_contains = [
-                            'Passed LinkedIn', 
-                            'LinkedIn Skill Assessment',
-                            ' endorsement',      # "6 endorsements", "1 endorsement"
-                        ]
-                        skip_if_starts_with = ['Show ', 'See ']
-                        
-                        # Additional check: skip if it's experience/endorsement count pattern
-                        # Pattern: starts with number + "experience" or "endorsement"
-                        is_count_pattern = False
-                        if skill_name and len(skill_name) > 0:
-                            first_word = skill_name.split()[0] if ' ' in skill_name else skill_name
-                            if first_word.isdigit() and ('experience' in skill_name.lower() or 'endorsement' in skill_name.lower()):
-                                is_count_pattern = True
+                        # Filter junk (badges, counts, links) and job titles (contains " at "),
+                        # cheapest checks first: length, then the one junk regex scan
+                        is_job_title = len(skill_name) > 30 and ' at ' in skill_name
                         
-                        # Skip if it's a job title (contains " at ")
-                        is_job_title = ' at ' in skill_name and len(skill_name) > 30
-                        
-                        should_skip = (
-                            any(pattern in skill_name for pattern in skip_if_contains) or
-                            any(skill_name.startswith(pattern) for pattern in skip_if_starts_with) or
-                            len(skill_name) > 100 or
-                            is_count_pattern or
-                            is_job_title
-                        )
-                        
-                        if should_skip:
-                            print(f"  [{idx+1}] Skip: {skill_name[:60]}")
+                        if len(skill_name) > 100 or _SKILL_SKIP.search(skill_name) or is_job_title:
+                            log.debug("  [%s] Skip: %s", idx+1, skill_name[:60])
                             continue
                         
-                        print(f"\n  [{idx+1}] Processing: {skill_name}")
+                        log.debug("\n  [%s] Processing: %s", idx+1, skill_name)
                         
-                        details = []
+                        # Step 1: Details yang langsung tampil (tanpa click), already filtered in the page
+                        # (no endorsement/experience counts, assessment badges or the skill name itself)
+                        details = list(data['details'])
+                        if log.isEnabledFor(logging.DEBUG):
+                            for detail in details:
+                                log.debug("      • %s", detail[:60])
                         
-                        # Step 1: Extract details yang langsung tampil (tanpa click)
-                        # Details ada di nested <ul> setelah skill name, tapi bukan endorsement count
-                        try:
-                            # Ambil semua text lines dari item
-                            item_text = item.text.strip()
-                            if item_text:
-                                lines = [l.strip() for l in item_text.split('\n') if l.strip()]
-                                
-                                # Remove consecutive duplicates
-                                unique_lines = []
-                                prev = None
-                                for line in lines:
-                                    if line != prev:
-                                        unique_lines.append(line)
-                                        prev = line
-                                
-                                # Line 0 = skill name
-                                # Lines after that could be details or endorsement counts
-                                # Filter: skip endorsements, experiences count, skill name itself
-                                for line in unique_lines[1:]:  # Skip first line (skill name)
-                                    # Skip if it's endorsement/experience count
-                                    if 'endorsement' in line.lower():
-                                        continue
-                                    if 'experience' in line.lower() and ' at ' in line:
-                                        # "2 experiences at Company" is not a real detail
-                                        continue
-                                    # Skip Passed LinkedIn badge
-                                    if 'Passed LinkedIn' in line or 'LinkedIn Skill Assessment' in line:
-                                        continue
-                                    # Skip if it's the skill name again
-                                    if line == skill_name:
-                                        continue
-                                    # Skip if too short
-                                    if len(line) < 5:
-                                        continue
-                                    
-                                    # This is a valid detail
-                                    if line not in details:
-                                        details.append(line)
-                                        print(f"      • {line[:60]}")
-                        except Exception as e:
-                            print(f"    Error extracting visible details: {e}")
+                        # Step 2: Open the "Show all X details" modal unless every detail is already visible
+                        all_visible = data['detail_count'] is not None and data['detail_count'] <= len(details)
+                        show_details_btns = []
+                        if data['has_details'] and not all_visible:
+                            show_details_btns = item.find_elements(By.XPATH, _SHOW_ALL_DETAIL_XPATH)
                         
-                        # Step 2: Check if there's "Show all X details" button
-                        try:
-                            show_details_btn = item.find_element(By.XPATH, 
-                                ".//button[contains(., 'Show all') and contains(., 'detail')] | " +
-                                ".//a[contains(., 'Show all') and contains(., 'detail')]"
-                            )
+                        if show_details_btns:
+                            show_details_btn = show_details_btns[0]
+                            log.debug("    → Found 'Show all details' button")
                             
-                            if show_details_btn:
-                                print(f"    → Found 'Show all details' button")
-                                
-                                # Scroll to button
-                                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", show_details_btn)
-                                human_delay(0.3, 0.5)
-                                
-                                # Click to open modal
-                                self.driver.execute_script("arguments[0].click();", show_details_btn)
-                                print(f"    → Clicked 'Show all details'")
-                                human_delay(0.8, 1.2)
-                                
-                                # Extract details from modal
-                                modal_items = self.driver.find_elements(By.XPATH, 
-                                    "//div[contains(@role, 'dialog')]//ul/li | " +
-                                    "//div[@data-test-modal]//ul/li | " +
-                                    "//div[contains(@class, 'artdeco-modal')]//ul/li"
-                                )
-                                
-                                if modal_items:
-                                    print(f"    → Found {len(modal_items)} detail items in modal")
-                                    # Clear previous details, use modal data instead
-                                    details = []
-                                    for modal_item in modal_items:
-                                        detail_text = modal_item.text.strip()
-                                        if detail_text and len(detail_text) > 5:
-                                            # Get first line only (title/name)
-                                            first_line = detail_text.split('\n')[0].strip()
-                                            if first_line and first_line not in details:
-                                                details.append(first_line)
-                                                print(f"      • {first_line[:60]}")
-                                else:
-                                    print(f"    → No detail items found in modal")
-                                
-                                # Close modal - click X button
-                                close_selectors = [
-                                    "//button[@aria-label='Dismiss']",
-                                    "//button[contains(@aria-label, 'Close')]",
-                                    "//button[contains(@class, 'artdeco-modal__dismiss')]",
-                                    "//button[@data-test-modal-close-btn]",
-                                ]
-                                
-                                for close_selector in close_selectors:
-                                    try:
-                                        close_btn = self.driver.find_element(By.XPATH, close_selector)
-                                        self.driver.execute_script("arguments[0].click();", close_btn)
-                                        print(f"    → Closed modal")
-                                        human_delay(0.3, 0.5)
-                                        break
-                                    except:
-                                        continue
-                        
-                        except NoSuchElementException:
-                            # No "Show all details" button - use details from step 1
-                            if details:
-                                print(f"    → No 'Show all details' button, using visible details")
+                            # Click to open modal (JS click, no scroll needed); the observer
+                            # reports once the modal list exists and has stopped growing
+                            watch_until_stable(driver, _MODAL_ITEMS_CSS)
+                            driver.execute_script("arguments[0].click();", show_details_btn)
+                            log.debug("    → Clicked 'Show all details'")
+                            
+                            # Locate and read the new modal's items in one round-trip; a modal
+                            # that doesn't show up keeps the visible details
+                            if wait_until_stable(driver, timeout=MODAL_TIMEOUT):
+                                modal = driver.execute_script(_MODAL_DETAILS_JS, _MODAL_ITEMS_CSS)
+                            else:
+                                modal = {'count': 0, 'details': []}
+                            
+                            if modal['count']:
+                                log.debug("    → Found %s detail items in modal", modal['count'])
+                                # Use modal data instead: first line (title/name) of each item
+                                details = modal['details']
+                                if log.isEnabledFor(logging.DEBUG):
+                                    for detail in details:
+                                        log.debug("      • %s", detail[:60])
                             else:
-                                print(f"    → No details available")
+                                log.debug("    → No detail items found in modal")
+                            
+                            # Close modal - find and click the X button in one call
+                            if driver.execute_script(_CLOSE_MODAL_JS):
+                                log.debug("    → Closed modal")
+                                try:
+                                    self.fast_wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, _MODAL_CSS)))
+                                except TimeoutException:
+                                    pass
+                        elif all_visible and details:
+                            log.debug("    → All details already visible, skipping modal")
+                        elif details:
+                            log.debug("    → No 'Show all details' button, using visible details")
+                        else:
+                            log.debug("    → No details available")
                         
                         # Add skill with details
                         skill_data = {
@@ -1165,67 +1400,66 @@ class LinkedInCrawler:
                             "details": details
                         }
                         skills.append(skill_data)
-                        print(f"  ✓ Added: {skill_name} ({len(details)} details)")
-                        
+                        log.debug("  ✓ Added: %s (%s details)", skill_name, len(details))
+                    
                     except Exception as e:
-                        print(f"  Error processing skill {idx+1}: {e}")
+                        log.warning("  Error processing skill %s: %s", idx+1, e)
                         continue
                 
                 # Click back arrow to return to profile (once at the end)
-                click_back_arrow(self.driver)
+                click_back_arrow(driver)
             
             else:
                 # No "Show all skills" button - extract from main page (simplified)
-                print("  No 'Show all' button, extracting from main page...")
-                items = skills_section.find_elements(By.XPATH, ".//ul/li")
-                
-                for item in items:
-                    try:
-                        skill_spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
-                        if skill_spans:
-                            skill_name = skill_spans[0].text.strip()
-                            if skill_name and len(skill_name) < 100:
-                                skill_data = {
-                                    "name": skill_name,
-                                    "details": []
-                                }
-                                skills.append(skill_data)
-                                print(f"✓ {len(skills)}. {skill_name}")
-                    except:
-                        continue
+                log.debug("  No 'Show all' button, extracting from main page...")
+                skills.extend(self._parse_skill_names(read_item_spans(driver, skills_section)))
         
         except Exception as e:
-            print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
+            log.warning("Error: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
         
         return skills
     
+    def _parse_skill_names(self, span_texts):
+        """Build skill entries from each item's aria-hidden span texts (first span is the name)"""
+        skills = []
+        for spans in span_texts:
+            if not spans:
+                continue
+            skill_name = spans[0].strip()
+            if skill_name and len(skill_name) < 100:
+                skill_data = {
+                    "name": skill_name,
+                    "details": []
+                }
+                skills.append(skill_data)
+                log.debug("✓ %s. %s", len(skills), skill_name)
+        return skills
+    
     def extract_projects(self):
         """Extract projects section with show all flow"""
+        embedded = self._embedded_section('projects')
+        if embedded is not None:
+            return embedded
+        
         projects = []
+        
+        harvested, snap_section = self._snapshot_section('projects')
+        if harvested and not snap_section:
+            log.debug("⚠ Projects section not found")
+            return projects
+        if snap_section and not snap_section['show_all']:
+            log.debug("  Parsing %s items from page snapshot...", len(snap_section['items']))
+            return self._parse_project_items([item['text'] for item in snap_section['items']])
+        
         try:
-            print("Looking for projects section...")
+            log.debug("Looking for projects section...")
             
-            proj_section = None
-            selectors = [
-                "//section[contains(@id, 'projects')]",
-                "//section[.//div[@id='projects']]",
-                "//section[.//h2[contains(text(), 'Projects')]]",
-            ]
-            
-            for selector in selectors:
-                try:
-                    proj_section = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print("✓ Found section")
-                    break
-                except TimeoutException:
-                    continue
+            proj_section = self._wait_for_section(_PROJECTS_XPATH)
+            if proj_section:
+                log.debug("✓ Found section")
             
             if not proj_section:
-                print("⚠ Projects section not found")
+                log.debug("⚠ Projects section not found")
                 return projects
             
             # Click "Show all"
@@ -1234,142 +1468,76 @@ class LinkedInCrawler:
             if clicked:
                 items = extract_items_from_detail_page(self.driver)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 10:
-                            continue
-                        
-                        # Remove consecutive duplicates
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"  Project item lines: {len(lines)}")
-                        for i, line in enumerate(lines[:8]):
-                            print(f"    [{i}] {line[:80]}")
-                        
-                        # Structure after deduplication:
-                        # 0: Title
-                        # 1: Duration
-                        # 2: Associated with Company (skip this)
-                        # 3: "Show project" link (skip this)
-                        # 4+: Detail/Description
-                        
-                        if len(lines) >= 2:
-                            title = lines[0]
-                            duration = lines[1]
-                            detail = ""
-                            
-                            # Find detail: skip "Associated with", "Show project", "Other contributors"
-                            for line in lines[2:]:
-                                if 'Associated with' in line:
-                                    continue
-                                if 'Show project' in line:
-                                    continue
-                                if 'Other contributors' in line:
-                                    break  # Stop here, rest is contributor info
-                                
-                                # This is the detail/description
-                                if len(line) > 10:
-                                    detail = line
-                                    break
-                            
-                            proj_data = {
-                                'title': title,
-                                'duration': duration,
-                                'detail': detail
-                            }
-                            projects.append(proj_data)
-                            print(f"  ✓ {len(projects)}. {proj_data['title']}")
-                    except Exception as e:
-                        print(f"  Error parsing project: {e}")
-                        continue
+                # Same structure as the main page: Title, Duration, Associated with, Show project, Detail
+                projects.extend(self._parse_project_items(self._bulk_extract(items, _ITEM_TEXTS_JS)))
                 
                 click_back_arrow(self.driver)
             else:
                 # No show all, extract from main page
-                print("  Extracting from main page...")
-                items = proj_section.find_elements(By.XPATH, ".//ul/li")
+                log.debug("  Extracting from main page...")
+                texts = self._bulk_extract(proj_section, _SECTION_ITEM_TEXTS_JS)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 10:
-                            continue
-                        
-                        # Remove consecutive duplicates
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        if len(lines) >= 2:
-                            title = lines[0]
-                            duration = lines[1]
-                            detail = ""
-                            
-                            for line in lines[2:]:
-                                if 'Associated with' in line or 'Show project' in line:
-                                    continue
-                                if 'Other contributors' in line:
-                                    break
-                                if len(line) > 10:
-                                    detail = line
-                                    break
-                            
-                            proj_data = {
-                                'title': title,
-                                'duration': duration,
-                                'detail': detail
-                            }
-                            projects.append(proj_data)
-                            print(f"  ✓ {len(projects)}. {proj_data['title']}")
-                    except Exception as e:
-                        print(f"  Error: {e}")
-                        continue
+                projects.extend(self._parse_project_items(texts))
         
         except Exception as e:
-            print(f"Error: {e}")
+            log.warning("Error: %s", e)
+        
+        return projects
+    
+    def _parse_project_items(self, texts):
+        """Parse project entries from main-page item texts"""
+        projects = []
+        
+        for text in texts:
+            try:
+                text = text.strip()
+                if not text or len(text) < 10:
+                    continue
+                
+                # Remove consecutive duplicates
+                lines = _dedupe_lines(text)
+                
+                if len(lines) >= 2:
+                    title = lines[0]
+                    duration = lines[1]
+                    # Title/duration can be repeated further down; never take them as the detail
+                    seen = {title, duration}
+                    
+                    # First long, non-metadata line before the "Other contributors" block
+                    detail = next((
+                        line for line in takewhile(lambda line: 'Other contributors' not in line, lines[2:])
+                        if len(line) > 10 and line not in seen and not _PROJECT_SKIP.search(line)
+                    ), "")
+                    
+                    proj_data = {
+                        'title': title,
+                        'duration': duration,
+                        'detail': detail
+                    }
+                    projects.append(proj_data)
+                    log.debug("  ✓ %s. %s", len(projects), proj_data['title'])
+            except Exception as e:
+                log.warning("  Error: %s", e)
+                continue
         
         return projects
     
     def extract_honors(self):
         """Extract honors & awards section with show all flow"""
         honors = []
+        if self._snapshot_lacks('honors'):
+            log.debug("⚠ Honors & awards section not found")
+            return honors
+        
         try:
-            print("Looking for honors & awards section...")
-            
-            honors_section = None
-            selectors = [
-                "//section[contains(@id, 'honors')]",
-                "//section[contains(@id, 'accomplishments')]",
-                "//section[.//div[@id='honors']]",
-                "//section[.//div[@id='accomplishments']]",
-                "//section[.//h2[contains(text(), 'Honors')]]",
-                "//section[.//h2[contains(text(), 'awards')]]",
-                "//section[.//span[contains(text(), 'Honors & awards')]]",
-            ]
+            log.debug("Looking for honors & awards section...")
             
-            for selector in selectors:
-                try:
-                    honors_section = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print("✓ Found section")
-                    break
-                except TimeoutException:
-                    continue
+            honors_section = self._wait_for_section(_HONORS_XPATH)
+            if honors_section:
+                log.debug("✓ Found section")
             
             if not honors_section:
-                print("⚠ Honors & awards section not found")
+                log.debug("⚠ Honors & awards section not found")
                 return honors
             
             # Click "Show all"
@@ -1378,193 +1546,142 @@ class LinkedInCrawler:
             if clicked:
                 items = extract_items_from_detail_page(self.driver)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 10:
-                            continue
-                        
-                        # Remove consecutive duplicates
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"  Honor item lines: {len(lines)}")
-                        for i, line in enumerate(lines[:4]):
-                            print(f"    [{i}] {line[:80]}")
-                        
-                        # Structure:
-                        # 0: Title
-                        # 1: "Issued by X · Date" (need to split by ·)
-                        
-                        if len(lines) >= 2:
-                            title = lines[0]
-                            issued_line = lines[1]
-                            
-                            # Split "Issued by X · Date" by ·
-                            issued_by = ""
-                            year = ""
-                            
-                            if '·' in issued_line:
-                                parts = issued_line.split('·')
-                                issued_by = parts[0].strip()
-                                year = parts[1].strip() if len(parts) > 1 else ""
-                                
-                                # Remove "Issued by " prefix
-                                if issued_by.startswith('Issued by '):
-                                    issued_by = issued_by.replace('Issued by ', '', 1)
-                            else:
-                                # No ·, whole line is issued_by
-                                issued_by = issued_line.replace('Issued by ', '', 1)
-                            
-                            honor_data = {
-                                'title': title,
-                                'issued_by': issued_by,
-                                'year': year
-                            }
-                            honors.append(honor_data)
-                            print(f"  ✓ {len(honors)}. {honor_data['title']}")
-                    except Exception as e:
-                        print(f"  Error parsing honor: {e}")
-                        continue
+                # Detail-page items have the same line structure as the main page
+                honors.extend(self._parse_honor_items(self._bulk_extract(items, _ITEM_TEXTS_JS)))
                 
                 click_back_arrow(self.driver)
             else:
                 # No show all, extract from main page
-                print("  Extracting from main page...")
-                items = honors_section.find_elements(By.XPATH, ".//ul/li")
+                log.debug("  Extracting from main page...")
+                texts = self._bulk_extract(honors_section, _SECTION_ITEM_TEXTS_JS)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 10:
-                            continue
-                        
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        if len(lines) >= 2:
-                            title = lines[0]
-                            issued_line = lines[1]
-                            
-                            issued_by = ""
-                            year = ""
-                            
-                            if '·' in issued_line:
-                                parts = issued_line.split('·')
-                                issued_by = parts[0].strip()
-                                year = parts[1].strip() if len(parts) > 1 else ""
-                                if issued_by.startswith('Issued by '):
-                                    issued_by = issued_by.replace('Issued by ', '', 1)
-                            else:
-                                issued_by = issued_line.replace('Issued by ', '', 1)
-                            
-                            honor_data = {
-                                'title': title,
-                                'issued_by': issued_by,
-                                'year': year
-                            }
-                            honors.append(honor_data)
-                            print(f"  ✓ {len(honors)}. {honor_data['title']}")
-                    except Exception as e:
-                        print(f"  Error: {e}")
-                        continue
+                honors.extend(self._parse_honor_items(texts))
         
         except Exception as e:
-            print(f"Error: {e}")
+            log.warning("Error: %s", e)
+        
+        return honors
+    
+    def _parse_honor_items(self, texts):
+        """Parse honors & awards entries from main-page or detail-page item texts"""
+        honors = []
+        
+        for text in texts:
+            try:
+                text = text.strip()
+                if not text or len(text) < 10:
+                    continue
+                
+                # Remove consecutive duplicates
+                lines = _dedupe_lines(text)
+                
+                log.debug("  Honor item lines: %s", len(lines))
+                if log.isEnabledFor(logging.DEBUG):
+                    for i, line in enumerate(islice(lines, 4)):
+                        log.debug("    [%s] %s", i, line[:80])
+                
+                # Structure:
+                # 0: Title
+                # 1: "Issued by X · Date" (need to split by ·)
+                
+                if len(lines) >= 2:
+                    title = lines[0]
+                    issued_line = lines[1]
+                    
+                    # Split "Issued by X · Date" by ·
+                    issued_by = ""
+                    year = ""
+                    
+                    if '·' in issued_line:
+                        parts = issued_line.split('·')
+                        issued_by = parts[0].strip()
+                        year = parts[1].strip() if len(parts) > 1 else ""
+                        
+                        # Remove "Issued by " prefix
+                        issued_by = issued_by.removeprefix('Issued by ')
+                    else:
+                        # No ·, whole line is issued_by
+                        issued_by = issued_line.removeprefix('Issued by ')
+                    
+                    honor_data = {
+                        'title': title,
+                        'issued_by': issued_by,
+                        'year': year
+                    }
+                    honors.append(honor_data)
+                    log.debug("  ✓ %s. %s", len(honors), honor_data['title'])
+            except Exception as e:
+                log.warning("  Error parsing honor: %s", e)
+                continue
         
         return honors
     
     def extract_languages(self):
         """Extract languages section"""
+        embedded = self._embedded_section('languages')
+        if embedded is not None:
+            return embedded
+        
         languages = []
+        
+        harvested, snap_section = self._snapshot_section('languages')
+        if harvested:
+            if not snap_section:
+                log.debug("⚠ Languages section not found")
+                return languages
+            return self._parse_language_spans([item['spans'] for item in snap_section['items']])
+        
         try:
-            print("Looking for languages section...")
-            
-            lang_section = None
-            selectors = [
-                "//section[contains(@id, 'languages')]",
-                "//section[.//div[@id='languages']]",
-                "//section[.//h2[contains(text(), 'Languages')]]",
-            ]
+            log.debug("Looking for languages section...")
             
-            for selector in selectors:
-                try:
-                    lang_section = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print(f"✓ Found section")
-                    break
-                except TimeoutException:
-                    continue
+            lang_section = self._wait_for_section(_LANGUAGES_XPATH)
+            if lang_section:
+                log.debug("✓ Found section")
             
             if not lang_section:
-                print("⚠ Languages section not found")
+                log.debug("⚠ Languages section not found")
                 return languages
             
-            smooth_scroll(self.driver, lang_section)
-            human_delay(0.3, 0.5)
-            
-            items = lang_section.find_elements(By.XPATH, ".//ul/li")
-            
-            for item in items:
-                try:
-                    spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
-                    if spans:
-                        lang_name = spans[0].text.strip()
-                        proficiency = spans[1].text.strip() if len(spans) > 1 else ""
-                        
-                        if lang_name:
-                            if proficiency and proficiency != lang_name:
-                                languages.append(f"{lang_name} - {proficiency}")
-                            else:
-                                languages.append(lang_name)
-                            print(f"✓ {len(languages)}. {lang_name}")
-                except:
-                    continue
+            languages.extend(self._parse_language_spans(read_item_spans(self.driver, lang_section)))
         
         except Exception as e:
-            print(f"Languages section not found")
+            log.warning("Error: %s", e)
         
         return languages
     
+    def _parse_language_spans(self, span_texts):
+        """Build "Language - Proficiency" strings from each item's aria-hidden span texts"""
+        languages = []
+        for spans in span_texts:
+            if not spans:
+                continue
+            lang_name = spans[0].strip()
+            proficiency = spans[1].strip() if len(spans) > 1 else ""
+            
+            if lang_name:
+                if proficiency and proficiency != lang_name:
+                    languages.append(f"{lang_name} - {proficiency}")
+                else:
+                    languages.append(lang_name)
+                log.debug("✓ %s. %s", len(languages), lang_name)
+        return languages
+    
     def extract_licenses(self):
         """Extract licenses & certifications section with show all flow"""
         licenses = []
+        if self._snapshot_lacks('licenses'):
+            log.debug("⚠ Licenses & certifications section not found")
+            return licenses
+        
         try:
-            print("Looking for licenses & certifications section...")
-            
-            licenses_section = None
-            selectors = [
-                "//section[contains(@id, 'licenses')]",
-                "//section[contains(@id, 'certifications')]",
-                "//section[.//div[@id='licenses_and_certifications']]",
-                "//section[.//h2[contains(text(), 'Licenses')]]",
-                "//section[.//h2[contains(text(), 'Certifications')]]",
-                "//section[.//span[contains(text(), 'Licenses & certifications')]]",
-            ]
+            log.debug("Looking for licenses & certifications section...")
             
-            for selector in selectors:
-                try:
-                    licenses_section = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print("✓ Found section")
-                    break
-                except TimeoutException:
-                    continue
+            licenses_section = self._wait_for_section(_LICENSES_XPATH)
+            if licenses_section:
+                log.debug("✓ Found section")
             
             if not licenses_section:
-                print("⚠ Licenses & certifications section not found")
+                log.debug("⚠ Licenses & certifications section not found")
                 return licenses
             
             # Click "Show all"
@@ -1573,139 +1690,94 @@ class LinkedInCrawler:
             if clicked:
                 items = extract_items_from_detail_page(self.driver)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 10:
-                            continue
-                        
-                        # Remove consecutive duplicates
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"  License item lines: {len(lines)}")
-                        for i, line in enumerate(lines[:6]):
-                            print(f"    [{i}] {line[:80]}")
-                        
-                        # Structure after deduplication:
-                        # 0: Name
-                        # 1: Issuer
-                        # 2: Issued date (e.g., "Issued Sep 2023")
-                        # 3: Credential ID (e.g., "Credential ID: ABC123") - optional
-                        
-                        if len(lines) >= 2:
-                            name = lines[0]
-                            issuer = lines[1]
-                            issued_date = ""
-                            credential_id = ""
-                            
-                            # Extract issued date
-                            if len(lines) > 2:
-                                date_line = lines[2]
-                                if 'Issued' in date_line:
-                                    issued_date = date_line.replace('Issued ', '').strip()
-                            
-                            # Extract credential ID
-                            if len(lines) > 3:
-                                cred_line = lines[3]
-                                if 'Credential ID' in cred_line:
-                                    credential_id = cred_line.replace('Credential ID', '').replace(':', '').strip()
-                            
-                            license_data = {
-                                'name': name,
-                                'issuer': issuer,
-                                'issued_date': issued_date,
-                                'credential_id': credential_id
-                            }
-                            licenses.append(license_data)
-                            print(f"  ✓ {len(licenses)}. {license_data['name']}")
-                    except Exception as e:
-                        print(f"  Error parsing license: {e}")
-                        continue
+                # Detail-page items have the same line structure as the main page
+                licenses.extend(self._parse_license_items(self._bulk_extract(items, _ITEM_TEXTS_JS)))
                 
                 click_back_arrow(self.driver)
             else:
                 # No show all, extract from main page
-                print("  Extracting from main page...")
-                items = licenses_section.find_elements(By.XPATH, ".//ul/li")
+                log.debug("  Extracting from main page...")
+                texts = self._bulk_extract(licenses_section, _SECTION_ITEM_TEXTS_JS)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 10:
-                            continue
-                        
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        if len(lines) >= 2:
-                            name = lines[0]
-                            issuer = lines[1]
-                            issued_date = ""
-                            credential_id = ""
-                            
-                            if len(lines) > 2:
-                                date_line = lines[2]
-                                if 'Issued' in date_line:
-                                    issued_date = date_line.replace('Issued ', '').strip()
-                            
-                            if len(lines) > 3:
-                                cred_line = lines[3]
-                                if 'Credential ID' in cred_line:
-                                    credential_id = cred_line.replace('Credential ID', '').replace(':', '').strip()
-                            
-                            license_data = {
-                                'name': name,
-                                'issuer': issuer,
-                                'issued_date': issued_date,
-                                'credential_id': credential_id
-                            }
-                            licenses.append(license_data)
-                            print(f"  ✓ {len(licenses)}. {license_data['name']}")
-                    except Exception as e:
-                        print(f"  Error: {e}")
-                        continue
+                licenses.extend(self._parse_license_items(texts))
         
         except Exception as e:
-            print(f"Error: {e}")
+            log.warning("Error: %s", e)
+        
+        return licenses
+    
+    def _parse_license_items(self, texts):
+        """Parse license & certification entries from main-page or detail-page item texts"""
+        licenses = []
+        
+        for text in texts:
+            try:
+                text = text.strip()
+                if not text or len(text) < 10:
+                    continue
+                
+                # Remove consecutive duplicates
+                lines = _dedupe_lines(text)
+                
+                log.debug("  License item lines: %s", len(lines))
+                if log.isEnabledFor(logging.DEBUG):
+                    for i, line in enumerate(islice(lines, 6)):
+                        log.debug("    [%s] %s", i, line[:80])
+                
+                # Structure after deduplication:
+                # 0: Name
+                # 1: Issuer
+                # 2: Issued date (e.g., "Issued Sep 2023")
+                # 3: Credential ID (e.g., "Credential ID: ABC123") - optional
+                
+                if len(lines) >= 2:
+                    name = lines[0]
+                    issuer = lines[1]
+                    issued_date = ""
+                    credential_id = ""
+                    
+                    # Extract issued date
+                    if len(lines) > 2:
+                        date_line = lines[2]
+                        if 'Issued' in date_line:
+                            issued_date = date_line.removeprefix('Issued ').strip()
+                    
+                    # Extract credential ID
+                    if len(lines) > 3:
+                        cred_line = lines[3]
+                        if 'Credential ID' in cred_line:
+                            credential_id = _CREDENTIAL_ID_LABEL.sub('', cred_line).strip()
+                    
+                    license_data = {
+                        'name': name,
+                        'issuer': issuer,
+                        'issued_date': issued_date,
+                        'credential_id': credential_id
+                    }
+                    licenses.append(license_data)
+                    log.debug("  ✓ %s. %s", len(licenses), license_data['name'])
+            except Exception as e:
+                log.warning("  Error parsing license: %s", e)
+                continue
         
         return licenses
     
     def extract_courses(self):
         """Extract courses section with show all flow"""
         courses = []
+        if self._snapshot_lacks('courses'):
+            log.debug("⚠ Courses section not found")
+            return courses
+        
         try:
-            print("Looking for courses section...")
+            log.debug("Looking for courses section...")
             
-            courses_section = None
-            selectors = [
-                "//section[contains(@id, 'courses')]",
-                "//section[.//div[@id='courses']]",
-                "//section[.//h2[contains(text(), 'Courses')]]",
-            ]
-            
-            for selector in selectors:
-                try:
-                    courses_section = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print("✓ Found section")
-                    break
-                except TimeoutException:
-                    continue
+            courses_section = self._wait_for_section(_COURSES_XPATH)
+            if courses_section:
+                log.debug("✓ Found section")
             
             if not courses_section:
-                print("⚠ Courses section not found")
+                log.debug("⚠ Courses section not found")
                 return courses
             
             # Click "Show all"
@@ -1714,149 +1786,96 @@ class LinkedInCrawler:
             if clicked:
                 items = extract_items_from_detail_page(self.driver)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 5:
-                            continue
-                        
-                        # Remove consecutive duplicates
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"  Course item lines: {len(lines)}")
-                        for i, line in enumerate(lines[:5]):
-                            print(f"    [{i}] {line[:80]}")
-                        
-                        # Skip if this line is "Associated with X" (it's a duplicate from previous course)
-                        if lines[0].startswith('Associated with'):
-                            print(f"  → SKIP: Associated with line (duplicate)")
-                            continue
-                        
-                        # Structure after deduplication:
-                        # 0: Name
-                        # 1: Code (e.g., "COMP6502" or "Course number: CS101")
-                        # 2: Associated with (e.g., "Associated with University Name")
-                        
-                        if len(lines) >= 1:
-                            name = lines[0]
-                            code = ""
-                            associated_with = ""
-                            
-                            # Extract code and associated_with
-                            for line in lines[1:]:
-                                # Check if it's "Associated with"
-                                if line.startswith('Associated with'):
-                                    associated_with = line.replace('Associated with', '').strip()
-                                # Check if it's course number/code
-                                elif 'Course number' in line or 'number' in line.lower():
-                                    code = line.replace('Course number', '').replace(':', '').strip()
-                                # If it's short and alphanumeric, likely a code (e.g., "COMP6502")
-                                elif len(line) < 20 and not line.startswith('Associated'):
-                                    code = line
-                            
-                            course_data = {
-                                'name': name,
-                                'code': code,
-                                'associated_with': associated_with
-                            }
-                            courses.append(course_data)
-                            print(f"  ✓ {len(courses)}. {course_data['name']}")
-                    except Exception as e:
-                        print(f"  Error parsing course: {e}")
-                        continue
+                # Detail-page items have the same line structure as the main page
+                courses.extend(self._parse_course_items(self._bulk_extract(items, _ITEM_TEXTS_JS)))
                 
                 click_back_arrow(self.driver)
             else:
                 # No show all, extract from main page
-                print("  Extracting from main page...")
-                items = courses_section.find_elements(By.XPATH, ".//ul/li")
+                log.debug("  Extracting from main page...")
+                texts = self._bulk_extract(courses_section, _SECTION_ITEM_TEXTS_JS)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 5:
-                            continue
-                        
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        # Skip if this line is "Associated with X" (it's a duplicate from previous course)
-                        if lines[0].startswith('Associated with'):
-                            print(f"  → SKIP: Associated with line (duplicate)")
-                            continue
-                        
-                        if len(lines) >= 1:
-                            name = lines[0]
-                            code = ""
-                            associated_with = ""
-                            
-                            # Extract code and associated_with
-                            for line in lines[1:]:
-                                # Check if it's "Associated with"
-                                if line.startswith('Associated with'):
-                                    associated_with = line.replace('Associated with', '').strip()
-                                # Check if it's course number/code
-                                elif 'Course number' in line or 'number' in line.lower():
-                                    code = line.replace('Course number', '').replace(':', '').strip()
-                                # If it's short and alphanumeric, likely a code (e.g., "COMP6502")
-                                elif len(line) < 20 and not line.startswith('Associated'):
-                                    code = line
-                            
-                            course_data = {
-                                'name': name,
-                                'code': code,
-                                'associated_with': associated_with
-                            }
-                            courses.append(course_data)
-                            print(f"  ✓ {len(courses)}. {course_data['name']}")
-                    except Exception as e:
-                        print(f"  Error: {e}")
-                        continue
+                courses.extend(self._parse_course_items(texts))
         
         except Exception as e:
-            print(f"Error: {e}")
+            log.warning("Error: %s", e)
+        
+        return courses
+    
+    def _parse_course_items(self, texts):
+        """Parse course entries from main-page or detail-page item texts"""
+        courses = []
+        
+        for text in texts:
+            try:
+                text = text.strip()
+                if not text or len(text) < 5:
+                    continue
+                
+                # Remove consecutive duplicates
+                lines = _dedupe_lines(text)
+                
+                log.debug("  Course item lines: %s", len(lines))
+                if log.isEnabledFor(logging.DEBUG):
+                    for i, line in enumerate(islice(lines, 5)):
+                        log.debug("    [%s] %s", i, line[:80])
+                
+                # Skip if this line is "Associated with X" (it's a duplicate from previous course)
+                if lines[0].startswith('Associated with'):
+                    log.debug("  → SKIP: Associated with line (duplicate)")
+                    continue
+                
+                # Structure after deduplication:
+                # 0: Name
+                # 1: Code (e.g., "COMP6502" or "Course number: CS101")
+                # 2: Associated with (e.g., "Associated with University Name")
+                
+                if len(lines) >= 1:
+                    name = lines[0]
+                    code = ""
+                    associated_with = ""
+                    
+                    # Extract code and associated_with
+                    for line in lines[1:]:
+                        # Check if it's "Associated with"
+                        if line.startswith('Associated with'):
+                            associated_with = line.removeprefix('Associated with').strip()
+                        # Check if it's course number/code
+                        elif _COURSE_NUMBER.search(line):
+                            code = _COURSE_NUMBER_LABEL.sub('', line).strip()
+                        # If it's short and alphanumeric, likely a code (e.g., "COMP6502")
+                        elif len(line) < 20 and not line.startswith('Associated'):
+                            code = line
+                    
+                    course_data = {
+                        'name': name,
+                        'code': code,
+                        'associated_with': associated_with
+                    }
+                    courses.append(course_data)
+                    log.debug("  ✓ %s. %s", len(courses), course_data['name'])
+            except Exception as e:
+                log.warning("  Error parsing course: %s", e)
+                continue
         
         return courses
     
     def extract_volunteering(self):
         """Extract volunteering section with show all flow"""
         volunteering = []
+        if self._snapshot_lacks('volunteering'):
+            log.debug("⚠ Volunteering section not found")
+            return volunteering
+        
         try:
-            print("Looking for volunteering section...")
-            
-            vol_section = None
-            selectors = [
-                "//section[contains(@id, 'volunteering')]",
-                "//section[.//div[@id='volunteering-experience']]",
-                "//section[.//div[@id='volunteering_experience']]",
-                "//section[.//h2[contains(text(), 'Volunteering')]]",
-                "//section[.//span[contains(text(), 'Volunteer experience')]]",
-                "//div[@id='volunteering-experience-section']",
-            ]
+            log.debug("Looking for volunteering section...")
             
-            for selector in selectors:
-                try:
-                    vol_section = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print("✓ Found section")
-                    break
-                except TimeoutException:
-                    continue
+            vol_section = self._wait_for_section(_VOLUNTEERING_XPATH)
+            if vol_section:
+                log.debug("✓ Found section")
             
             if not vol_section:
-                print("⚠ Volunteering section not found")
+                log.debug("⚠ Volunteering section not found")
                 return volunteering
             
             # Click "Show all"
@@ -1864,188 +1883,117 @@ class LinkedInCrawler:
             
             if clicked:
                 items = extract_items_from_detail_page(self.driver)
-                print(f"Found {len(items)} volunteering items")
+                log.debug("Found %s volunteering items", len(items))
                 
-                for idx, item in enumerate(items):
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 10:
-                            continue
-                        
-                        # Remove consecutive duplicates
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"\n  === Volunteering Item {idx+1}/{len(items)} ===")
-                        print(f"  Total lines: {len(lines)}")
-                        for i, line in enumerate(lines[:10]):
-                            print(f"    [{i}] {line[:80]}")
-                        
-                        # Structure after deduplication:
-                        # [0] Role/Title (e.g., "YLI by McKinsey & Co. Awardee: Wave 14")
-                        # [1] Organization (e.g., "Young Leaders for Indonesia Foundation")
-                        # [2] Duration (e.g., "May 2022 - Dec 2022 · 8 mos")
-                        # [3] Duration duplicate (e.g., "May 2022 to Dec 2022 · 8 mos")
-                        # [4] Cause/Category (e.g., "Education")
-                        # [5+] Description (optional)
-                        
-                        if len(lines) >= 3:
-                            role = lines[0]
-                            organization = lines[1]
-                            duration = lines[2]
-                            cause = ""
-                            description = ""
-                            
-                            # Line[3] is duplicate duration, skip it
-                            # Line[4] is usually cause (short, single word or phrase)
-                            if len(lines) > 4:
-                                potential_cause = lines[4]
-                                # Cause is usually short (< 50 chars) and doesn't have dates or long descriptions
-                                if len(potential_cause) < 50 and '-' not in potential_cause and '·' not in potential_cause:
-                                    cause = potential_cause
-                                    print(f"  → Cause: {cause}")
-                            
-                            # Description is after cause (if exists)
-                            desc_start_idx = 5 if cause else 4
-                            if len(lines) > desc_start_idx:
-                                # Join remaining lines as description
-                                desc_lines = []
-                                for line in lines[desc_start_idx:]:
-                                    # Skip "Skills:" and skill names
-                                    if line.startswith('Skills:') or line == 'Skills':
-                                        break
-                                    # Skip if it's "Associated with"
-                                    if line.startswith('Associated with'):
-                                        break
-                                    desc_lines.append(line)
-                                
-                                if desc_lines:
-                                    description = ' '.join(desc_lines)
-                                    print(f"  → Description: {description[:60]}...")
-                            
-                            vol_data = {
-                                'role': role,
-                                'organization': organization,
-                                'duration': duration,
-                                'cause': cause,
-                                'description': description
-                            }
-                            volunteering.append(vol_data)
-                            print(f"  ✓ ADDED {len(volunteering)}. {vol_data['role']}")
-                        else:
-                            print(f"  → SKIP: Not enough lines ({len(lines)})")
-                    except Exception as e:
-                        print(f"  Error parsing volunteering item {idx+1}: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        continue
+                # Detail-page items have the same line structure as the main page
+                volunteering.extend(self._parse_volunteering_items(self._bulk_extract(items, _ITEM_TEXTS_JS)))
                 
                 click_back_arrow(self.driver)
             else:
                 # No show all, extract from main page
-                print("  Extracting from main page...")
-                items = vol_section.find_elements(By.XPATH, ".//ul/li")
-                print(f"  Found {len(items)} items on main page")
+                log.debug("  Extracting from main page...")
+                texts = self._bulk_extract(vol_section, _SECTION_ITEM_TEXTS_JS)
+                log.debug("  Found %s items on main page", len(texts))
                 
-                for idx, item in enumerate(items):
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 10:
-                            continue
-                        
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"\n  === Item {idx+1}/{len(items)} ===")
-                        print(f"  Lines: {len(lines)}")
-                        for i, line in enumerate(lines[:8]):
-                            print(f"    [{i}] {line[:80]}")
-                        
-                        if len(lines) >= 3:
-                            role = lines[0]
-                            organization = lines[1]
-                            duration = lines[2]
-                            cause = ""
-                            description = ""
-                            
-                            if len(lines) > 4:
-                                potential_cause = lines[4]
-                                if len(potential_cause) < 50 and '-' not in potential_cause and '·' not in potential_cause:
-                                    cause = potential_cause
-                            
-                            desc_start_idx = 5 if cause else 4
-                            if len(lines) > desc_start_idx:
-                                desc_lines = []
-                                for line in lines[desc_start_idx:]:
-                                    if line.startswith('Skills:') or line == 'Skills':
-                                        break
-                                    if line.startswith('Associated with'):
-                                        break
-                                    desc_lines.append(line)
-                                
-                                if desc_lines:
-                                    description = ' '.join(desc_lines)
-                            
-                            vol_data = {
-                                'role': role,
-                                'organization': organization,
-                                'duration': duration,
-                                'cause': cause,
-                                'description': description
-                            }
-                            volunteering.append(vol_data)
-                            print(f"  ✓ ADDED {len(volunteering)}. {vol_data['role']}")
-                        else:
-                            print(f"  → SKIP: Not enough lines")
-                    except Exception as e:
-                        print(f"  Error: {e}")
-                        continue
+                volunteering.extend(self._parse_volunteering_items(texts))
         
         except Exception as e:
-            print(f"Error extracting volunteering: {e}")
-            import traceback
-            traceback.print_exc()
+            log.warning("Error extracting volunteering: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
+        
+        return volunteering
+    
+    def _parse_volunteering_items(self, texts):
+        """Parse volunteering entries from main-page or detail-page item texts"""
+        volunteering = []
+        
+        for idx, text in enumerate(texts):
+            try:
+                text = text.strip()
+                if not text or len(text) < 10:
+                    continue
+                
+                # Remove consecutive duplicates
+                lines = _dedupe_lines(text)
+                n = len(lines)
+                
+                log.debug("\n  === Volunteering Item %s/%s ===", idx+1, len(texts))
+                log.debug("  Total lines: %s", n)
+                if log.isEnabledFor(logging.DEBUG):
+                    for i, line in enumerate(islice(lines, 10)):
+                        log.debug("    [%s] %s", i, line[:80])
+                
+                # Structure after deduplication:
+                # [0] Role/Title (e.g., "YLI by McKinsey & Co. Awardee: Wave 14")
+                # [1] Organization (e.g., "Young Leaders for Indonesia Foundation")
+                # [2] Duration (e.g., "May 2022 - Dec 2022 · 8 mos")
+                # [3] Duration duplicate (e.g., "May 2022 to Dec 2022 · 8 mos"), missing in older layouts
+                # [4] Cause/Category (e.g., "Education")
+                # [5+] Description (optional)
+                
+                if n >= 3:
+                    role = lines[0]
+                    organization = lines[1]
+                    duration = lines[2]
+                    cause = ""
+                    description = ""
+                    
+                    # Skip the duplicate duration only when it is there, so cause/description stay aligned
+                    cause_idx = 4 if n > 3 and _DUPLICATE_DURATION.match(lines[3]) else 3
+                    
+                    # Cause is usually short (< 50 chars) and doesn't have dates or long descriptions
+                    if n > cause_idx:
+                        potential_cause = lines[cause_idx]
+                        if len(potential_cause) < 50 and '-' not in potential_cause and '·' not in potential_cause:
+                            cause = potential_cause
+                            log.debug("  → Cause: %s", cause)
+                    
+                    # Description is after cause (if exists)
+                    desc_start_idx = cause_idx + 1 if cause else cause_idx
+                    if n > desc_start_idx:
+                        # Join remaining lines as description, up to the skills / "Associated with" lines
+                        desc_lines = []
+                        for line in lines[desc_start_idx:]:
+                            if line.startswith('Skills:') or line == 'Skills' or line.startswith('Associated with'):
+                                break
+                            desc_lines.append(line)
+                        
+                        if desc_lines:
+                            description = ' '.join(desc_lines)
+                            log.debug("  → Description: %s...", description[:60])
+                    
+                    vol_data = {
+                        'role': role,
+                        'organization': organization,
+                        'duration': duration,
+                        'cause': cause,
+                        'description': description
+                    }
+                    volunteering.append(vol_data)
+                    log.debug("  ✓ ADDED %s. %s", len(volunteering), vol_data['role'])
+                else:
+                    log.debug("  → SKIP: Not enough lines (%s)", n)
+            except Exception as e:
+                log.warning("  Error parsing volunteering item %s: %s", idx+1, e, exc_info=log.isEnabledFor(logging.DEBUG))
+                continue
         
         return volunteering
     
     def extract_test_scores(self):
         """Extract test scores section with show all flow"""
         test_scores = []
+        if self._snapshot_lacks('test_scores'):
+            log.debug("⚠ Test scores section not found")
+            return test_scores
+        
         try:
-            print("Looking for test scores section...")
-            
-            test_section = None
-            selectors = [
-                "//section[contains(@id, 'test-scores')]",
-                "//section[contains(@id, 'test_scores')]",
-                "//section[.//div[@id='test-scores']]",
-                "//section[.//h2[contains(text(), 'Test scores')]]",
-                "//section[.//h2[contains(text(), 'Test Scores')]]",
-                "//section[.//span[contains(text(), 'Test scores')]]",
-            ]
+            log.debug("Looking for test scores section...")
             
-            for selector in selectors:
-                try:
-                    test_section = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print("✓ Found section")
-                    break
-                except TimeoutException:
-                    continue
+            test_section = self._wait_for_section(_TEST_SCORES_XPATH)
+            if test_section:
+                log.debug("✓ Found section")
             
             if not test_section:
-                print("⚠ Test scores section not found")
+                log.debug("⚠ Test scores section not found")
                 return test_scores
             
             # Click "Show all"
@@ -2054,136 +2002,93 @@ class LinkedInCrawler:
             if clicked:
                 items = extract_items_from_detail_page(self.driver)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 5:
-                            continue
-                        
-                        # Remove consecutive duplicates
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        print(f"  Test score item lines: {len(lines)}")
-                        for i, line in enumerate(lines[:6]):
-                            print(f"    [{i}] {line[:80]}")
-                        
-                        # Structure after deduplication:
-                        # [0] Test Name (e.g., "TOEFL iBT")
-                        # [1] Score · Duration (e.g., "110 · Jan 2023 - Jan 2025")
-                        # [2] Score · Duration duplicate (e.g., "110 · Jan 2023 to Jan 2025")
-                        # [3] Description (optional)
-                        
-                        if len(lines) >= 2:
-                            name = lines[0]
-                            score = ""
-                            duration = ""
-                            description = ""
-                            
-                            # Parse line[1]: "Score · Duration"
-                            score_duration_line = lines[1]
-                            
-                            # Split by middle dot (·)
-                            if '·' in score_duration_line:
-                                parts = score_duration_line.split('·')
-                                score = parts[0].strip()
-                                duration = parts[1].strip() if len(parts) > 1 else ""
-                            else:
-                                # No middle dot, whole line is score
-                                score = score_duration_line
-                            
-                            # Line[2] is duplicate, skip it
-                            # Line[3+] is description (optional)
-                            if len(lines) > 3:
-                                desc_lines = []
-                                for line in lines[3:]:
-                                    # Skip if it's "Associated with" or other metadata
-                                    if line.startswith('Associated with'):
-                                        break
-                                    desc_lines.append(line)
-                                
-                                if desc_lines:
-                                    description = ' '.join(desc_lines)
-                            
-                            test_data = {
-                                'name': name,
-                                'score': score,
-                                'duration': duration,
-                                'description': description
-                            }
-                            test_scores.append(test_data)
-                            print(f"  ✓ {len(test_scores)}. {test_data['name']} - {test_data['score']}")
-                    except Exception as e:
-                        print(f"  Error parsing test score: {e}")
-                        continue
+                # Detail-page items have the same line structure as the main page
+                test_scores.extend(self._parse_test_score_items(self._bulk_extract(items, _ITEM_TEXTS_JS)))
                 
                 click_back_arrow(self.driver)
             else:
                 # No show all, extract from main page
-                print("  Extracting from main page...")
-                items = test_section.find_elements(By.XPATH, ".//ul/li")
+                log.debug("  Extracting from main page...")
+                texts = self._bulk_extract(test_section, _SECTION_ITEM_TEXTS_JS)
                 
-                for item in items:
-                    try:
-                        text = item.text.strip()
-                        if not text or len(text) < 5:
-                            continue
-                        
-                        all_lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        lines = []
-                        prev = None
-                        for line in all_lines:
-                            if line != prev:
-                                lines.append(line)
-                                prev = line
-                        
-                        if len(lines) >= 2:
-                            name = lines[0]
-                            score = ""
-                            duration = ""
-                            description = ""
-                            
-                            score_duration_line = lines[1]
-                            
-                            if '·' in score_duration_line:
-                                parts = score_duration_line.split('·')
-                                score = parts[0].strip()
-                                duration = parts[1].strip() if len(parts) > 1 else ""
-                            else:
-                                score = score_duration_line
-                            
-                            if len(lines) > 3:
-                                desc_lines = []
-                                for line in lines[3:]:
-                                    if line.startswith('Associated with'):
-                                        break
-                                    desc_lines.append(line)
-                                
-                                if desc_lines:
-                                    description = ' '.join(desc_lines)
-                            
-                            test_data = {
-                                'name': name,
-                                'score': score,
-                                'duration': duration,
-                                'description': description
-                            }
-                            test_scores.append(test_data)
-                            print(f"  ✓ {len(test_scores)}. {test_data['name']}")
-                    except Exception as e:
-                        print(f"  Error: {e}")
-                        continue
+                test_scores.extend(self._parse_test_score_items(texts))
         
         except Exception as e:
-            print(f"Error: {e}")
+            log.warning("Error: %s", e)
+        
+        return test_scores
+    
+    def _parse_test_score_items(self, texts):
+        """Parse test score entries from main-page or detail-page item texts"""
+        test_scores = []
+        
+        for text in texts:
+            try:
+                text = text.strip()
+                if not text or len(text) < 5:
+                    continue
+                
+                # Remove consecutive duplicates
+                lines = _dedupe_lines(text)
+                
+                log.debug("  Test score item lines: %s", len(lines))
+                if log.isEnabledFor(logging.DEBUG):
+                    for i, line in enumerate(islice(lines, 6)):
+                        log.debug("    [%s] %s", i, line[:80])
+                
+                # Structure after deduplication:
+                # [0] Test Name (e.g., "TOEFL iBT")
+                # [1] Score · Duration (e.g., "110 · Jan 2023 - Jan 2025")
+                # [2] Score · Duration duplicate (e.g., "110 · Jan 2023 to Jan 2025")
+                # [3] Description (optional)
+                
+                if len(lines) >= 2:
+                    name = lines[0]
+                    score = ""
+                    duration = ""
+                    description = ""
+                    
+                    # Parse line[1]: "Score · Duration"
+                    score_duration_line = lines[1]
+                    
+                    # Split by middle dot (·)
+                    if '·' in score_duration_line:
+                        parts = score_duration_line.split('·')
+                        score = parts[0].strip()
+                        duration = parts[1].strip() if len(parts) > 1 else ""
+                    else:
+                        # No middle dot, whole line is score
+                        score = score_duration_line
+                    
+                    # Line[2] is duplicate, skip it
+                    # Line[3+] is description (optional)
+                    if len(lines) > 3:
+                        desc_lines = []
+                        for line in lines[3:]:
+                            # Skip if it's "Associated with" or other metadata
+                            if line.startswith('Associated with'):
+                                break
+                            desc_lines.append(line)
+                        
+                        if desc_lines:
+                            description = ' '.join(desc_lines)
+                    
+                    test_data = {
+                        'name': name,
+                        'score': score,
+                        'duration': duration,
+                        'description': description
+                    }
+                    test_scores.append(test_data)
+                    log.debug("  ✓ %s. %s - %s", len(test_scores), test_data['name'], test_data['score'])
+            except Exception as e:
+                log.warning("  Error parsing test score: %s", e)
+                continue
         
         return test_scores
     
     def close(self):
         """Close the browser"""
+        if self.fetcher is not None:
+            self.fetcher.close()
         self.driver.quit()
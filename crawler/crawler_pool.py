@@ -0,0 +1,98 @@
+"""
+Crawler pool - run several logged-in browsers in parallel over a list of URLs
+"""
+import asyncio
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from crawler import LinkedInCrawler
+from helper.browser_helper import create_driver
+from helper.cache_helper import normalize_url
+
+
+log = logging.getLogger(__name__)
+
+
+class CrawlerPool:
+    """Pool of logged-in LinkedInCrawler instances, one browser per worker thread"""
+    
+    def __init__(self, size=3):
+        self.size = size
+        self.crawlers = queue.Queue()
+        # Runs crawl_many's scrapes; owned by the pool so a cancelled crawl_many doesn't
+        # block the event loop waiting for in-flight scrapes
+        self.executor = ThreadPoolExecutor(max_workers=size)
+        
+        # Start browsers and log each in once (cookies are reused after the first login)
+        try:
+            for i in range(size):
+                log.info("[Pool] Starting browser %s/%s...", i + 1, size)
+                crawler = LinkedInCrawler(driver=create_driver())
+                self.crawlers.put(crawler)
+                crawler.login()
+        except Exception:
+            self.close()
+            raise
+        
+        log.info("✓ Pool ready with %s browsers", size)
+    
+    def scrape(self, url):
+        """Scrape one profile on the next free crawler"""
+        crawler = self.crawlers.get()
+        try:
+            return crawler.get_profile(url)
+        finally:
+            self.crawlers.put(crawler)
+    
+    def map(self, urls):
+        """Scrape URLs concurrently, yielding (url, profile_data, error) as each one finishes"""
+        # Each profile is scraped once even if listed twice (or under another URL form)
+        urls = list({normalize_url(url): url for url in urls}.values())
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = {executor.submit(self.scrape, url): url for url in urls}
+            
+            try:
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        yield url, future.result(), None
+                    except Exception as e:
+                        yield url, None, e
+            finally:
+                # Stopped early (e.g. Ctrl+C): drop URLs that haven't started yet
+                for future in futures:
+                    future.cancel()
+    
+    async def crawl_many(self, urls):
+        """
+        Async variant of map for callers already running an event loop.
+        At most one scrape per browser runs at a time; returns (url, profile_data, error) in URL order (duplicates dropped).
+        """
+        urls = list({normalize_url(url): url for url in urls}.values())
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.BoundedSemaphore(self.size)
+        
+        async def guarded(url):
+            async with semaphore:
+                try:
+                    return url, await loop.run_in_executor(self.executor, self.scrape, url), None
+                except Exception as e:
+                    return url, None, e
+        
+        return await asyncio.gather(*(guarded(url) for url in urls))
+    
+    def close(self):
+        """Wait for running scrapes, then close all browsers"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        while not self.crawlers.empty():
+            crawler = self.crawlers.get_nowait()
+            try:
+                crawler.close()
+            except Exception as e:
+                log.warning("⚠ Error closing browser: %s", e)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -4,44 +4,68 @@ Scrape profiles and send to scoring queue
 """
 import json
 import glob
+import logging
+import multiprocessing
 import os
+import signal
 import threading
 import time
+from multiprocessing.managers import SyncManager
 import pika
 from crawler import LinkedInCrawler
 from helper.rabbitmq_helper import RabbitMQManager, ack_message, nack_message
-from main import save_profile_data
+from helper.browser_helper import share_navigation_budget
+from main import ProfileSaver
+from helper.logging_helper import setup_logging, stop_logging
 
 
+log = logging.getLogger(__name__)
+
 # Configuration
 SCORING_QUEUE = os.getenv('SCORING_QUEUE', 'scoring_queue')
 DEFAULT_REQUIREMENTS_ID = os.getenv('DEFAULT_REQUIREMENTS_ID', 'desk_collection')
+# Unacked messages each worker may hold. Scrapes take seconds, so with 1 the first
+# worker to connect can't hoard messages while the others sit idle
+PREFETCH_COUNT = int(os.getenv('RABBITMQ_PREFETCH', '1'))
+# Restart each worker's browser after this many profiles to release leaked memory
+CRAWLER_RECYCLE_AFTER = int(os.getenv('CRAWLER_RECYCLE_AFTER', '50'))
+# Seconds each worker gets to write pending profiles and quit Chrome before it is killed
+WORKER_SHUTDOWN_TIMEOUT = int(os.getenv('WORKER_SHUTDOWN_TIMEOUT', '30'))
 
-# Statistics
+# Statistics (main() swaps these for Manager proxies shared with the worker processes)
 stats = {
     'processing': 0,
     'completed': 0,
     'failed': 0,
     'skipped': 0,
-    'sent_to_scoring': 0,
-    'lock': threading.Lock()
+    'sent_to_scoring': 0
 }
+stats_lock = threading.Lock()
+
+
+def use_shared_stats(shared_stats, shared_lock):
+    """Point this process's stats at the dict/lock shared through the Manager"""
+    global stats, stats_lock
+    stats, stats_lock = shared_stats, shared_lock
 
 
 def print_stats():
-    """Print current statistics"""
-    print("\n" + "="*60)
-    print("STATISTICS")
-    print("="*60)
-    print(f"Processing: {stats['processing']}")
-    print(f"Completed: {stats['completed']}")
-    print(f"Failed: {stats['failed']}")
-    print(f"Skipped: {stats['skipped']}")
-    print(f"Sent to Scoring: {stats['sent_to_scoring']}")
+    """Log current statistics as a single record"""
+    lines = [
+        "\n" + "="*60,
+        "STATISTICS",
+        "="*60,
+        f"Processing: {stats['processing']}",
+        f"Completed: {stats['completed']}",
+        f"Failed: {stats['failed']}",
+        f"Skipped: {stats['skipped']}",
+        f"Sent to Scoring: {stats['sent_to_scoring']}",
+    ]
     if stats['completed'] + stats['failed'] > 0:
         success_rate = stats['completed'] / (stats['completed'] + stats['failed']) * 100
-        print(f"Success Rate: {success_rate:.1f}%")
-    print("="*60)
+        lines.append(f"Success Rate: {success_rate:.1f}%")
+    lines.append("="*60)
+    log.info("\n".join(lines))
 
 
 def send_to_scoring_queue(profile_data, requirements_id, mq_config):
@@ -56,7 +80,7 @@ def send_to_scoring_queue(profile_data, requirements_id, mq_config):
         mq.queue_name = SCORING_QUEUE
         
         if not mq.connect():
-            print(f"  ✗ Failed to connect to scoring queue")
+            log.error("  ✗ Failed to connect to scoring queue")
             return False
         
         # Prepare message
@@ -78,11 +102,11 @@ def send_to_scoring_queue(profile_data, requirements_id, mq_config):
         )
         
         mq.close()
-        print(f"  📤 Sent to scoring queue: {SCORING_QUEUE}")
+        log.info("  📤 Sent to scoring queue: %s", SCORING_QUEUE)
         return True
     
     except Exception as e:
-        print(f"  ✗ Failed to send to scoring queue: {e}")
+        log.error("  ✗ Failed to send to scoring queue: %s", e)
         return False
 
 
@@ -166,9 +190,16 @@ def load_urls_from_profile_folder(crawled_urls=None):
     return urls, skipped
 
 
-def worker_thread(worker_id, mq_config, requirements_id):
-    """Worker thread that continuously processes messages"""
-    print(f"[Worker {worker_id}] Started")
+def worker_process(worker_id, mq_config, requirements_id, shared_stats, shared_lock,
+                   navigation_state, navigation_lock):
+    """Worker process that continuously processes messages (own interpreter, browser and connection)"""
+    # Forked workers inherit the parent's queue handler but not its listener
+    # thread, so each one starts its own
+    setup_logging()
+    use_shared_stats(shared_stats, shared_lock)
+    # All workers draw from one LinkedIn page-load budget instead of one each
+    share_navigation_budget(navigation_state, navigation_lock)
+    log.info("[Worker %s] Started", worker_id)
     
     # Each worker has its own RabbitMQ connection
     mq = RabbitMQManager()
@@ -179,15 +210,45 @@ def worker_thread(worker_id, mq_config, requirements_id):
     mq.queue_name = mq_config['queue_name']
     
     if not mq.connect():
-        print(f"[Worker {worker_id}] Failed to connect to RabbitMQ")
+        log.error("[Worker %s] Failed to connect to RabbitMQ", worker_id)
         return
     
-    # Set QoS - only process 1 message at a time
-    mq.channel.basic_qos(prefetch_count=1)
+    # Set QoS - process one message at a time
+    mq.channel.basic_qos(prefetch_count=PREFETCH_COUNT)
+    
+    # Profiles are written by a background thread while the scoring message is sent
+    saver = ProfileSaver()
+    
+    # One logged-in browser per worker, reused across messages and recycled periodically
+    crawler = None
+    processed_count = 0
+    
+    def get_crawler():
+        """Return the worker's crawler, (re)starting the browser when needed"""
+        nonlocal crawler, processed_count
+        if crawler and processed_count >= CRAWLER_RECYCLE_AFTER:
+            log.info("[Worker %s] ♻ Recycling browser after %s profiles", worker_id, processed_count)
+            close_crawler()
+        if crawler is None:
+            crawler = LinkedInCrawler()
+            processed_count = 0
+            # Login (will use cookies if available)
+            crawler.login()
+        return crawler
+    
+    def close_crawler():
+        """Close the worker's browser (a new one is started on the next message)"""
+        nonlocal crawler
+        if crawler:
+            try:
+                crawler.close()
+            except Exception as e:
+                log.warning("[Worker %s] ⚠ Error closing browser: %s", worker_id, e)
+            crawler = None
     
     def callback(ch, method, properties, body):
         """Process each message"""
-        crawler = None
+        nonlocal processed_count
         
         try:
             # Parse message
@@ -195,50 +256,51 @@ def worker_thread(worker_id, mq_config, requirements_id):
             url = message.get('url')
             
             if not url:
-                print(f"[Worker {worker_id}] ✗ Invalid message")
+                log.error("[Worker %s] ✗ Invalid message", worker_id)
                 ack_message(ch, method.delivery_tag)
                 return
             
-            print(f"\n[Worker {worker_id}] 📥 Processing: {url}")
+            log.info("\n[Worker %s] 📥 Processing: %s", worker_id, url)
             
-            with stats['lock']:
+            with stats_lock:
                 stats['processing'] += 1
             
-            # Create crawler and process
-            crawler = LinkedInCrawler()
-            
             try:
-                # Login (will use cookies if available)
-                crawler.login()
-                
-                # Scrape profile
-                profile_data = crawler.get_profile(url)
+                # Scrape profile on the worker's browser (started and logged in on first use)
+                profile_data = get_crawler().get_profile(url)
+                processed_count += 1
                 
-                # Save to file
-                save_profile_data(profile_data)
+                # Save to file (written by the saver thread while we send to scoring)
+                saver.save(profile_data)
                 
                 # Send to scoring queue
-                print(f"[Worker {worker_id}] 📤 Sending to scoring...")
+                log.info("[Worker %s] 📤 Sending to scoring...", worker_id)
                 if send_to_scoring_queue(profile_data, requirements_id, mq_config):
-                    with stats['lock']:
+                    with stats_lock:
                         stats['sent_to_scoring'] += 1
                 
-                with stats['lock']:
+                # Wait for the profile to be written before counting and acking it
+                saver.flush()
+                
+                with stats_lock:
                     stats['completed'] += 1
                 
-                print(f"[Worker {worker_id}] ✓ Completed: {profile_data.get('name', 'Unknown')}")
+                log.info("[Worker %s] ✓ Completed: %s", worker_id, profile_data.get('name', 'Unknown'))
                 
                 # Print stats after completion
                 print_stats()
                 
                 # Acknowledge message
                 ack_message(ch, method.delivery_tag)
-                
+            
             except Exception as e:
-                with stats['lock']:
+                with stats_lock:
                     stats['failed'] += 1
                 
-                print(f"[Worker {worker_id}] ✗ Error: {e}")
+                log.error("[Worker %s] ✗ Error: %s", worker_id, e)
+                
+                # The browser may be in a bad state; start a fresh one for the next message
+                close_crawler()
                 
                 # Print stats after failure
                 print_stats()
@@ -247,15 +309,11 @@ def worker_thread(worker_id, mq_config, requirements_id):
                 nack_message(ch, method.delivery_tag, requeue=False)
             
             finally:
-                # Close browser
-                if crawler:
-                    crawler.close()
-                
-                with stats['lock']:
+                with stats_lock:
                     stats['processing'] -= 1
         
         except Exception as e:
-            print(f"[Worker {worker_id}] ✗ Fatal error: {e}")
+            log.error("[Worker %s] ✗ Fatal error: %s", worker_id, e)
             nack_message(ch, method.delivery_tag, requeue=False)
     
     try:
@@ -266,15 +324,22 @@ def worker_thread(worker_id, mq_config, requirements_id):
             auto_ack=False
         )
         
-        print(f"[Worker {worker_id}] Waiting for messages...")
+        log.info("[Worker %s] Waiting for messages...", worker_id)
         mq.channel.start_consuming()
     
+    except KeyboardInterrupt:
+        pass
+    
     except Exception as e:
-        print(f"[Worker {worker_id}] Error: {e}")
+        log.error("[Worker %s] Error: %s", worker_id, e)
     
     finally:
+        # Write pending profiles first: quitting Chrome can be slow
+        saver.close()
+        close_crawler()
         mq.close()
-        print(f"[Worker {worker_id}] Stopped")
+        log.info("[Worker %s] Stopped", worker_id)
+        stop_logging()
 
 
 def main():
@@ -328,6 +393,12 @@ def main():
     print(f"  - Skipped: {skipped_count}")
     print(f"  - Requirements: {requirements_id}")
     
+    # Shared counters for the worker processes; the manager ignores Ctrl+C so
+    # final stats can still be read after the workers stop
+    manager = SyncManager()
+    manager.start(signal.signal, (signal.SIGINT, signal.SIG_IGN))
+    use_shared_stats(manager.dict(stats), manager.Lock())
+    navigation_state, navigation_lock = manager.dict(), manager.Lock()
     stats['skipped'] = skipped_count
     
     # Connect to RabbitMQ
@@ -337,6 +408,7 @@ def main():
         print("✗ Failed to connect to RabbitMQ. Is it running?")
         print("\nTo start RabbitMQ:")
         print("  docker-compose up -d")
+        manager.shutdown()
         return
     
     # Publish URLs to queue
@@ -346,6 +418,7 @@ def main():
     if success_count == 0:
         print("✗ Failed to publish URLs")
         mq.close()
+        manager.shutdown()
         return
     
     # Show queue status
@@ -373,16 +446,15 @@ def main():
     print("\n  Press Ctrl+C to stop")
     print(f"  Management UI: http://localhost:15672 (guest/guest)")
     
-    # Start worker threads
-    threads = []
+    # Start worker processes
+    processes = []
     for i in range(num_workers):
-        t = threading.Thread(
-            target=worker_thread, 
-            args=(i+1, mq_config, requirements_id), 
-            daemon=True
+        p = multiprocessing.Process(
+            target=worker_process, 
+            args=(i+1, mq_config, requirements_id, stats, stats_lock, navigation_state, navigation_lock)
         )
-        t.start()
-        threads.append(t)
+        p.start()
+        processes.append(p)
         time.sleep(0.5)
     
     print(f"\n✓ All {num_workers} workers are running!")
@@ -401,8 +473,11 @@ def main():
         print("  (Workers will finish current tasks)")
     
     finally:
-        # Wait a bit for workers to finish current tasks
-        time.sleep(3)
+        # Let workers save pending profiles and close their browsers, then stop any that are stuck
+        for p in processes:
+            p.join(timeout=WORKER_SHUTDOWN_TIMEOUT)
+            if p.is_alive():
+                p.terminate()
         
         # Final stats
         print("\n" + "="*60)
@@ -419,7 +494,10 @@ def main():
         print("="*60)
         print(f"\nCrawler output: data/output/")
         print(f"Scoring output: ../scoring/data/scores/")
+        manager.shutdown()
 
 
 if __name__ == "__main__":
+    # Crawler extraction details are logged at DEBUG; set LOG_LEVEL=DEBUG to see them
+    setup_logging()
     main()
@@ -1,6 +1,8 @@
 """LinkedIn authentication helper"""
 import os
 import json
+import logging
+import threading
 from pathlib import Path
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -9,52 +11,99 @@ from dotenv import load_dotenv
 from helper.browser_helper import human_delay
 
 
+log = logging.getLogger(__name__)
+
+
 COOKIES_FILE = "data/cookie/.linkedin_cookies.json"
 
+# Cookie jar shared by every driver in this process (read from disk once)
+_cookie_jar = None
+_cookie_lock = threading.Lock()
+# Set once a driver in this process has confirmed the jar is a live session
+_session_verified = False
+
 
 def save_cookies(driver):
     """Save cookies to JSON file for session persistence"""
+    global _cookie_jar, _session_verified
     try:
         Path("data/cookie").mkdir(parents=True, exist_ok=True)
         cookies = driver.get_cookies()
-        with open(COOKIES_FILE, 'w') as f:
-            json.dump(cookies, f, indent=2)
-        print("✓ Cookies saved for future sessions")
+        with _cookie_lock:
+            with open(COOKIES_FILE, 'w') as f:
+                json.dump(cookies, f, indent=2)
+            _cookie_jar = cookies
+            # Saved right after a login, so the jar is known to be valid
+            _session_verified = True
+        log.info("✓ Cookies saved for future sessions")
     except Exception as e:
-        print(f"⚠ Could not save cookies: {e}")
+        log.warning("⚠ Could not save cookies: %s", e)
+
+
+def get_saved_cookies():
+    """Return the shared cookie jar, loading it from COOKIES_FILE on first use"""
+    global _cookie_jar
+    with _cookie_lock:
+        if _cookie_jar is None and os.path.exists(COOKIES_FILE):
+            with open(COOKIES_FILE, 'r') as f:
+                _cookie_jar = json.load(f)
+        return _cookie_jar
+
+
+def _to_cdp_cookie(cookie):
+    """Convert a Selenium cookie dict to the CDP Network.setCookies format"""
+    cdp_cookie = {key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly') if key in cookie}
+    if 'expiry' in cookie:
+        cdp_cookie['expires'] = cookie['expiry']
+    if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+        cdp_cookie['sameSite'] = cookie['sameSite']
+    return cdp_cookie
 
 
 def load_cookies(driver):
-    """Load cookies from JSON file"""
+    """Inject saved cookies into the driver and verify the session on the feed page"""
+    global _session_verified
     try:
-        if not os.path.exists(COOKIES_FILE):
+        cookies = get_saved_cookies()
+        if not cookies:
             return False
         
-        driver.get('https://www.linkedin.com')
-        human_delay(2, 3)  # Increased back
-        
-        with open(COOKIES_FILE, 'r') as f:
-            cookies = json.load(f)
-        
-        for cookie in cookies:
-            try:
-                driver.add_cookie(cookie)
-            except:
-                pass
+        try:
+            # Set cookies before any navigation - no extra page load needed
+            driver.execute_cdp_cmd('Network.setCookies', {'cookies': [_to_cdp_cookie(c) for c in cookies]})
+            
+            # Another browser in this process already checked this jar: skip the feed round-trip
+            if _session_verified and any(cookie['name'] == 'li_at' for cookie in cookies):
+                log.info("✓ Logged in using saved session (already verified)")
+                return True
+        except Exception:
+            # Fallback: add_cookie needs to be on the LinkedIn domain first
+            driver.get('https://www.linkedin.com')
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except:
+                    pass
         
-        # Refresh to apply cookies
-        driver.refresh()
-        human_delay(2, 3)  # Increased back
+        # Open feed and wait until LinkedIn either shows it or redirects to login
+        driver.get('https://www.linkedin.com/feed/')
+        try:
+            WebDriverWait(driver, 10).until(
+                lambda d: any(part in d.current_url for part in ('feed', 'mynetwork', 'login', 'authwall', 'checkpoint'))
+            )
+        except Exception:
+            pass
         
         # Check if logged in
         current_url = driver.current_url
         if 'feed' in current_url or 'mynetwork' in current_url:
-            print("✓ Logged in using saved session!")
+            log.info("✓ Logged in using saved session!")
+            _session_verified = True
             return True
         
         return False
     except Exception as e:
-        print(f"⚠ Could not load cookies: {e}")
+        log.warning("⚠ Could not load cookies: %s", e)
         return False
 
 
@@ -63,7 +112,7 @@ def login(driver):
     load_dotenv()
     
     # Try to use saved cookies first
-    print("Checking for saved session...")
+    log.info("Checking for saved session...")
     if load_cookies(driver):
         return
     
@@ -74,31 +123,34 @@ def login(driver):
     if not email or not password:
         raise ValueError("LinkedIn credentials not found in .env file")
     
-    print("Attempting automatic login...")
+    log.info("Attempting automatic login...")
     driver.get('https://www.linkedin.com/login')
-    human_delay(2, 3)
     
     try:
         wait = WebDriverWait(driver, 10)
         
-        print("Filling email...")
+        log.info("Filling email...")
         email_field = wait.until(EC.presence_of_element_located((By.ID, 'username')))
         email_field.clear()
         email_field.send_keys(email)
         human_delay(0.5, 1.0)
         
-        print("Filling password...")
+        log.info("Filling password...")
         password_field = driver.find_element(By.ID, 'password')
         password_field.clear()
         password_field.send_keys(password)
         human_delay(0.5, 1.0)
         
-        print("Clicking login button...")
-        login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
+        log.info("Clicking login button...")
+        login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
         login_button.click()
         
-        print("Checking login status...")
-        human_delay(3, 5)
+        log.info("Checking login status...")
+        # Wait for LinkedIn to leave the login form (feed, checkpoint, etc.) instead of sleeping
+        try:
+            wait.until(lambda d: '/login' not in d.current_url)
+        except Exception:
+            pass
         
         current_url = driver.current_url
         
@@ -115,6 +167,7 @@ def login(driver):
         needs_verification = any(indicator in current_url for indicator in verification_indicators)
         
         if needs_verification:
+            # Interactive instructions stay on print so they appear before the input() prompt
             print("\n" + "="*60)
             print("⚠ VERIFICATION REQUIRED!")
             print("="*60)
@@ -143,7 +196,7 @@ def login(driver):
             
             current_url = driver.current_url
             if 'feed' in current_url or 'mynetwork' in current_url or '/in/' in current_url:
-                print("✓ Login berhasil!")
+                log.info("✓ Login berhasil!")
                 # Save cookies for next time
                 save_cookies(driver)
             else:
@@ -153,7 +206,7 @@ def login(driver):
                     raise Exception("Login dibatalkan")
         else:
             if 'feed' in current_url or 'mynetwork' in current_url or '/in/' in current_url:
-                print("✓ Login otomatis berhasil tanpa verifikasi!")
+                log.info("✓ Login otomatis berhasil tanpa verifikasi!")
                 # Save cookies for next time
                 save_cookies(driver)
             else:
@@ -162,9 +215,7 @@ def login(driver):
                 save_cookies(driver)
     
     except Exception as e:
-        print(f"\nError during login: {e}")
-        import traceback
-        traceback.print_exc()
+        log.error("\nError during login: %s", e, exc_info=True)
         print("\nSilakan login manual di browser yang terbuka...")
         input("Tekan ENTER setelah berhasil login...")
         save_cookies(driver)
@@ -2,11 +2,16 @@
 import time
 import random
 import os
+import threading
+import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 
 
+log = logging.getLogger(__name__)
+
 # Load delay configuration from environment
 try:
     MIN_DELAY = float(os.getenv('MIN_DELAY', '0.5'))
@@ -15,6 +20,66 @@ except:
     MIN_DELAY = 0.5
     MAX_DELAY = 1.0
 
+# Block stylesheets too (off by default, see create_driver)
+BLOCK_CSS = os.getenv('BLOCK_CSS', 'false').lower() == 'true'
+
+# 'eager' returns from driver.get() at DOMContentLoaded; 'normal' waits for every image/tracker
+PAGE_LOAD_STRATEGY = os.getenv('PAGE_LOAD_STRATEGY', 'eager').lower()
+if PAGE_LOAD_STRATEGY not in ('normal', 'eager', 'none'):
+    PAGE_LOAD_STRATEGY = 'eager'
+
+# LinkedIn page loads allowed per minute across all crawlers sharing the budget (0 = unlimited):
+# every browser in this process, plus other processes after share_navigation_budget()
+try:
+    NAVIGATIONS_PER_MINUTE = float(os.getenv('NAVIGATIONS_PER_MINUTE', '60'))
+    NAVIGATION_BURST = max(1, int(os.getenv('NAVIGATION_BURST', '5')))
+except ValueError:
+    NAVIGATIONS_PER_MINUTE = 60.0
+    NAVIGATION_BURST = 5
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: acquire() blocks until a token is free (refills at rate per second).
+    The token count lives in state and is guarded by lock, so passing a Manager dict and
+    lock shares one bucket between processes.
+    """
+    
+    def __init__(self, rate, burst, state=None, lock=None):
+        self.rate = rate
+        self.burst = burst
+        self.state = state if state is not None else {}
+        self.state.setdefault('tokens', float(burst))
+        self.state.setdefault('updated', time.monotonic())
+        self.lock = lock or threading.Lock()
+    
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            tokens = min(self.burst, self.state['tokens'] + (now - self.state['updated']) * self.rate)
+            # Reserve a token now (may go negative) and sleep outside the lock
+            tokens -= 1
+            self.state.update(tokens=tokens, updated=now)
+            wait = -tokens / self.rate if tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+_navigation_bucket = TokenBucket(NAVIGATIONS_PER_MINUTE / 60, NAVIGATION_BURST)
+
+
+def share_navigation_budget(state, lock):
+    """Draw page loads from a bucket shared with other processes (state/lock from a multiprocessing Manager)"""
+    global _navigation_bucket
+    _navigation_bucket = TokenBucket(NAVIGATIONS_PER_MINUTE / 60, NAVIGATION_BURST, state, lock)
+
+
+def throttle_navigation():
+    """Wait for the shared LinkedIn navigation budget (call before each page load)"""
+    _navigation_bucket.acquire()
+
 
 def create_driver():
     """Create and configure Chrome driver with anti-detection"""
@@ -29,6 +94,7 @@ def create_driver():
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
     
     # Random user agent (rotate for better stealth)
     user_agents = [
@@ -45,11 +111,18 @@ def create_driver():
     
     # Language
     options.add_argument('--lang=en-US')
-    options.add_experimental_option('prefs', {'intl.accept_languages': 'en-US,en'})
+    prefs = {'intl.accept_languages': 'en-US,en'}
     
-    # Disable images for faster loading (optional, comment if needed)
-    # prefs = {"profile.managed_default_content_settings.images": 2}
-    # options.add_experimental_option("prefs", prefs)
+    # Extraction only reads DOM text: don't wait for sub-resources, skip images
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
+    prefs['profile.managed_default_content_settings.images'] = 2
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    
+    # Blocking CSS saves more bandwidth but changes innerText (hidden duplicate spans become visible)
+    if BLOCK_CSS:
+        prefs['profile.managed_default_content_settings.stylesheets'] = 2
+    
+    options.add_experimental_option('prefs', prefs)
     
     # Try multiple methods to create driver
     driver = None
@@ -59,13 +132,13 @@ def create_driver():
         from selenium.webdriver.chrome.service import Service as ChromeService
         service = ChromeService()
         driver = webdriver.Chrome(service=service, options=options)
-        print("✓ Using Selenium auto-managed ChromeDriver")
+        log.info("✓ Using Selenium auto-managed ChromeDriver")
     except Exception as e:
-        print(f"⚠ Selenium auto-download failed: {e}")
+        log.warning("⚠ Selenium auto-download failed: %s", e)
         
         # Method 2: webdriver-manager
         try:
-            print("  Trying webdriver-manager...")
+            log.info("  Trying webdriver-manager...")
             from webdriver_manager.chrome import ChromeDriverManager
             from webdriver_manager.core.os_manager import ChromeType
             
@@ -73,52 +146,53 @@ def create_driver():
             import os
             cache_path = os.path.expanduser("~/.wdm")
             if os.path.exists(cache_path):
-                print(f"  Clearing webdriver-manager cache: {cache_path}")
+                log.info("  Clearing webdriver-manager cache: %s", cache_path)
                 import shutil
                 shutil.rmtree(cache_path, ignore_errors=True)
             
             # Install chromedriver
             driver_path = ChromeDriverManager().install()
-            print(f"  ChromeDriver installed at: {driver_path}")
+            log.info("  ChromeDriver installed at: %s", driver_path)
             
             service = ChromeService(executable_path=driver_path)
             driver = webdriver.Chrome(service=service, options=options)
-            print("✓ Using webdriver-manager ChromeDriver")
-            
+            log.info("✓ Using webdriver-manager ChromeDriver")
+        
         except ImportError:
-            print("✗ webdriver-manager not installed!")
-            print("\nInstall it with:")
-            print("  pip install webdriver-manager")
+            log.error("✗ webdriver-manager not installed!\n\nInstall it with:\n  pip install webdriver-manager")
             raise
         except Exception as e2:
-            print(f"✗ webdriver-manager failed: {e2}")
+            log.warning("✗ webdriver-manager failed: %s", e2)
             
             # Method 3: System chromedriver
             try:
-                print("  Trying system chromedriver...")
+                log.info("  Trying system chromedriver...")
                 import subprocess
                 result = subprocess.run(['which', 'chromedriver'], 
                                       capture_output=True, text=True)
                 if result.returncode == 0:
                     chromedriver_path = result.stdout.strip()
-                    print(f"  Found system chromedriver: {chromedriver_path}")
+                    log.info("  Found system chromedriver: %s", chromedriver_path)
                     service = ChromeService(executable_path=chromedriver_path)
                     driver = webdriver.Chrome(service=service, options=options)
-                    print("✓ Using system ChromeDriver")
+                    log.info("✓ Using system ChromeDriver")
                 else:
                     raise Exception("System chromedriver not found")
             except Exception as e3:
-                print(f"✗ System chromedriver failed: {e3}")
-                print("\n" + "="*60)
-                print("CHROMEDRIVER INSTALLATION REQUIRED")
-                print("="*60)
-                print("\nOption 1: Install Chrome + ChromeDriver (Recommended)")
-                print("  ./install_chrome.sh")
-                print("\nOption 2: Install webdriver-manager")
-                print("  pip install webdriver-manager")
-                print("\nOption 3: Manual ChromeDriver")
-                print("  sudo apt install chromium-chromedriver")
-                print("="*60)
+                log.error("✗ System chromedriver failed: %s", e3)
+                # One record so the instructions aren't interleaved with other workers' output
+                log.error("\n".join([
+                    "\n" + "="*60,
+                    "CHROMEDRIVER INSTALLATION REQUIRED",
+                    "="*60,
+                    "\nOption 1: Install Chrome + ChromeDriver (Recommended)",
+                    "  ./install_chrome.sh",
+                    "\nOption 2: Install webdriver-manager",
+                    "  pip install webdriver-manager",
+                    "\nOption 3: Manual ChromeDriver",
+                    "  sudo apt install chromium-chromedriver",
+                    "="*60,
+                ]))
                 raise Exception("Failed to create ChromeDriver. See options above.")
     
     if driver is None:
@@ -197,40 +271,32 @@ def smooth_scroll(driver, element):
     time.sleep(random.uniform(0.3, 0.6))
 
 
-def scroll_page_to_load(driver):
-    """Scroll entire page to load all lazy-loaded content with human-like behavior"""
-    print("Scrolling page to load all content...")
-    
-    # Get page height
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    
-    # Scroll down in random increments (human-like)
-    scroll_pause_time = random.uniform(0.8, 1.2)  # Increased
+def scroll_page_to_load(driver, max_steps=40, growth_timeout=2):
+    """Scroll page until it is fully loaded and the bottom is reached (polls page state instead of fixed sleeps)"""
+    log.debug("Scrolling page to load all content...")
     
-    for i in range(5):  # Increased back to 5
-        # Random scroll amount (not always same)
-        scroll_amount = random.randint(1000, 1500)
-        driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
+    for _ in range(max_steps):
+        ready_state, bottom, height = driver.execute_script(
+            "return [document.readyState, window.scrollY + window.innerHeight, document.body.scrollHeight];"
+        )
         
-        # Random pause (human behavior)
-        time.sleep(random.uniform(0.5, 0.8))  # Increased
+        if bottom < height:
+            driver.execute_script("window.scrollBy(0, window.innerHeight);")
+            continue
         
-        # Sometimes scroll up a bit (human behavior) - reduced frequency
-        if random.random() > 0.85:
-            driver.execute_script(f"window.scrollBy(0, -{random.randint(100, 300)});")
-            time.sleep(random.uniform(0.3, 0.5))
-    
-    # Scroll to bottom
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(scroll_pause_time)
-    
-    # Check if new content loaded
-    new_height = driver.execute_script("return document.body.scrollHeight")
-    if new_height > last_height:
-        # More content loaded, scroll again
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(scroll_pause_time)
-    
-    # Scroll back to top (human behavior)
+        # At the bottom: wait briefly for lazy-loaded sections to extend the page, or for a page
+        # still loading (eager strategy) to finish, instead of re-scrolling in place
+        try:
+            WebDriverWait(driver, growth_timeout, poll_frequency=0.2).until(
+                lambda d: d.execute_script(
+                    "return document.body.scrollHeight > arguments[0] || document.readyState !== arguments[1];",
+                    height, ready_state
+                )
+            )
+            log.debug("  ✓ Page changed (height %s, %s), continuing...", height, ready_state)
+        except TimeoutException:
+            log.debug("  ✓ Page fully loaded (height %s)", height)
+            break
+    
+    # Scroll back to top
     driver.execute_script("window.scrollTo(0, 0);")
-    time.sleep(random.uniform(0.5, 0.8))
@@ -0,0 +1,148 @@
+"""SQLite cache for scraped profiles, keyed by normalized profile URL"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+CACHE_DB = "data/cache/profiles.sqlite3"
+PARTIAL_DIR = "data/partial"
+CACHE_TTL = 7 * 86400  # 7 days
+
+# Query params LinkedIn adds for tracking; they don't change the profile
+TRACKING_PARAMS = ('trk', 'trackingId', 'lipi', 'midToken', 'midSig', 'originalSubdomain', 'miniProfileUrn')
+
+
+def normalize_url(url):
+    """Normalize a URL for cache keys: canonical LinkedIn profile URL, else lowercase host without tracking params, fragment or trailing slash"""
+    parts = urlsplit(url.strip())
+    
+    # Profile URLs (any linkedin.com host, query or sub-page like /details/...) → https://www.linkedin.com/in/<slug>
+    segments = [segment for segment in parts.path.split('/') if segment]
+    if parts.netloc.lower().endswith('linkedin.com') and len(segments) >= 2 and segments[0] == 'in':
+        return f"https://www.linkedin.com/in/{segments[1].lower()}"
+    
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query)
+        if key not in TRACKING_PARAMS and not key.startswith('utm_')
+    ]
+    path = parts.path.rstrip('/')
+    return urlunsplit((parts.scheme.lower() or 'https', parts.netloc.lower(), path, urlencode(query), ''))
+
+
+class ProfileCache:
+    """
+    SQLite table of profiles keyed by normalized URL, with scraped_at / access_count metadata.
+    Each section also keeps its own scrape time, so partial scrapes merge into the row and
+    a lookup only needs the requested sections to be fresh.
+    """
+    
+    def __init__(self, db_path=CACHE_DB, ttl=CACHE_TTL):
+        self.db_path = db_path
+        self.ttl = ttl
+        self._ready = False
+    
+    def _connect(self):
+        # A short-lived connection per call: crawlers move between threads and processes share the file
+        if not self._ready:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        if not self._ready:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS linkedin_cache ("
+                "normalized_url TEXT PRIMARY KEY, scraped_at REAL NOT NULL, "
+                "access_count INTEGER NOT NULL DEFAULT 0, data_json TEXT NOT NULL, "
+                "section_times_json TEXT NOT NULL DEFAULT '{}')"
+            )
+            # Tables created before per-section times: their rows fall back to scraped_at
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(linkedin_cache)")]
+            if 'section_times_json' not in columns:
+                connection.execute(
+                    "ALTER TABLE linkedin_cache ADD COLUMN section_times_json TEXT NOT NULL DEFAULT '{}'"
+                )
+            self._ready = True
+        return connection
+    
+    def is_stale(self, scraped_at):
+        """Check if a record scraped at this time is older than the TTL"""
+        return time.time() - scraped_at > self.ttl
+    
+    def get(self, url, sections=None):
+        """
+        Return cached profile data (only the given sections plus profile_url when sections is set),
+        or None if the row is missing or any requested section is missing or stale
+        """
+        key = normalize_url(url)
+        try:
+            with closing(self._connect()) as connection, connection:
+                row = connection.execute(
+                    "SELECT scraped_at, data_json, section_times_json FROM linkedin_cache WHERE normalized_url = ?",
+                    (key,)
+                ).fetchone()
+                if not row:
+                    return None
+                data = json.loads(row[1])
+                times = json.loads(row[2])
+                wanted = data.keys() - {'profile_url'} if sections is None else sections
+                if any(section not in data or self.is_stale(times.get(section, row[0])) for section in wanted):
+                    return None
+                connection.execute(
+                    "UPDATE linkedin_cache SET access_count = access_count + 1 WHERE normalized_url = ?", (key,)
+                )
+        except sqlite3.Error:
+            return None
+        if sections is None:
+            return data
+        return {section: value for section, value in data.items() if section == 'profile_url' or section in sections}
+    
+    def set(self, url, data):
+        """Store profile data for a URL, merging its sections into any cached row"""
+        key = normalize_url(url)
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT scraped_at, data_json, section_times_json FROM linkedin_cache WHERE normalized_url = ?",
+                (key,)
+            ).fetchone()
+            merged, times = {}, {}
+            if row:
+                merged = json.loads(row[1])
+                times = {section: json.loads(row[2]).get(section, row[0]) for section in merged}
+            merged.update(data)
+            times.update(dict.fromkeys(data, now))
+            connection.execute(
+                "INSERT OR REPLACE INTO linkedin_cache "
+                "(normalized_url, scraped_at, access_count, data_json, section_times_json) VALUES (?, ?, 0, ?, ?)",
+                (key, now, json.dumps(merged, ensure_ascii=False), json.dumps(times))
+            )
+
+
+class PartialProfileWriter:
+    """
+    Append each extracted section to data/partial/<hash>.jsonl as it arrives.
+    The file is removed when the profile completes and kept if scraping fails.
+    """
+    
+    def __init__(self, url, partial_dir=PARTIAL_DIR):
+        key = hashlib.md5(normalize_url(url).encode()).hexdigest()
+        self.path = os.path.join(partial_dir, f"{key}.jsonl")
+        self.partial_dir = partial_dir
+        self.file = None
+    
+    def __enter__(self):
+        os.makedirs(self.partial_dir, exist_ok=True)
+        self.file = open(self.path, 'w', encoding='utf-8', buffering=1)
+        return self
+    
+    def write(self, section, value):
+        """Write one section as a JSON line"""
+        self.file.write(json.dumps({'section': section, 'value': value}, ensure_ascii=False) + '\n')
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.file.close()
+        if exc_type is None:
+            os.remove(self.path)
@@ -0,0 +1,184 @@
+"""Helper functions for parsing the JSON payloads LinkedIn embeds in the page source"""
+import html
+import json
+import re
+from urllib.parse import unquote, urlsplit
+
+
+# <code id="bpr-guid-..."> blocks carry the profile API responses as escaped JSON
+BPR_CODE_PATTERN = re.compile(r'<code[^>]*\bid="bpr-guid-[^"]*"[^>]*>(.*?)</code>', re.DOTALL)
+
+# Section entities that belong to a profile carry its id in their URN,
+# e.g. urn:li:fsd_profilePosition:(ACoAAB...,123456)
+PROFILE_ENTITY_TYPES = ('Position', 'Education', 'Skill', 'Project', 'Language')
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+def extract_embedded_payloads(page_source):
+    """Return every bpr-guid JSON payload found in the page source"""
+    payloads = []
+    for raw in BPR_CODE_PATTERN.findall(page_source or ''):
+        try:
+            payloads.append(json.loads(html.unescape(raw).strip()))
+        except ValueError:
+            continue
+    return payloads
+
+
+def _iter_typed_objects(node):
+    """Yield every dict with a $type key in document order, walking nested dicts and lists"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if '$type' in current:
+                yield current
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+def public_identifier(url):
+    """Profile slug from a /in/<slug> URL (lowercase), or None for other URLs"""
+    segments = [segment for segment in urlsplit(url or '').path.split('/') if segment]
+    if len(segments) >= 2 and segments[0] == 'in':
+        return unquote(segments[1]).lower()
+    return None
+
+
+def _type_name(obj):
+    """Last segment of a $type, e.g. 'com.linkedin.voyager.identity.profile.Position' -> 'Position'"""
+    return obj.get('$type', '').rsplit('.', 1)[-1]
+
+
+def _text(value):
+    """Plain string from a field that may be a string or a {'text': ...} object"""
+    if isinstance(value, dict):
+        value = value.get('text', '')
+    return value.strip() if isinstance(value, str) else ''
+
+
+def _format_date(date):
+    """Format a {'month', 'year'} date the way LinkedIn shows it (e.g. 'Jan 2020')"""
+    if not isinstance(date, dict) or not date.get('year'):
+        return ''
+    month = date.get('month')
+    if isinstance(month, int) and 1 <= month <= 12:
+        return f"{MONTHS[month - 1]} {date['year']}"
+    return str(date['year'])
+
+
+def _period(obj):
+    """Return (start, end) strings from timePeriod/dateRange; end is 'Present' if open"""
+    period = obj.get('timePeriod') or obj.get('dateRange') or {}
+    start = _format_date(period.get('startDate') or period.get('start'))
+    end = _format_date(period.get('endDate') or period.get('end'))
+    if start and not end:
+        end = 'Present'
+    return start, end
+
+
+def _duration(obj):
+    """Duration string in the same 'Start - End' form as the DOM scraper"""
+    start, end = _period(obj)
+    if start:
+        return f"{start} - {end}"
+    return end
+
+
+def parse_embedded_profile(page_source, url):
+    """
+    Build profile sections from the embedded JSON payloads.
+    The payloads also carry the viewer's own profile and other people's
+    mini-profiles, so only the Profile whose publicIdentifier matches the
+    URL and the entities whose URN holds its id are used.
+    Only sections that have entities in the payload are returned,
+    so callers can fall back to DOM scraping for the rest.
+    """
+    slug = public_identifier(url)
+    if not slug:
+        return {}
+    
+    # The same entity can appear in several payloads
+    objects = []
+    seen = set()
+    for payload in extract_embedded_payloads(page_source):
+        for obj in _iter_typed_objects(payload):
+            urn = obj.get('entityUrn') or obj.get('*entityUrn')
+            if urn:
+                if urn in seen:
+                    continue
+                seen.add(urn)
+            objects.append(obj)
+    
+    profiles = [
+        obj for obj in objects
+        if _type_name(obj) == 'Profile' and str(obj.get('publicIdentifier', '')).lower() == slug
+    ]
+    # urn:li:fsd_profile:ACoAAB... -> ACoAAB...
+    profile_ids = {obj['entityUrn'].rsplit(':', 1)[-1] for obj in profiles if obj.get('entityUrn')}
+    if not profile_ids:
+        return {}
+    
+    sections = {}
+    
+    for profile in profiles:
+        if profile.get('firstName'):
+            full_name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}".strip()
+            sections.setdefault('name', full_name)
+            location = _text(profile.get('locationName')) or _text(profile.get('geoLocationName'))
+            if location:
+                sections.setdefault('location', location)
+    
+    for obj in objects:
+        type_name = _type_name(obj)
+        if type_name not in PROFILE_ENTITY_TYPES:
+            continue
+        urn = obj.get('entityUrn', '')
+        if not any(profile_id in urn for profile_id in profile_ids):
+            continue
+        
+        if type_name == 'Position' and obj.get('title'):
+            sections.setdefault('experiences', []).append({
+                'title': _text(obj.get('title')),
+                'company': _text(obj.get('companyName')),
+                'duration': _duration(obj),
+                'location': _text(obj.get('locationName')) or _text(obj.get('geoLocationName'))
+            })
+        
+        elif type_name == 'Education' and obj.get('schoolName'):
+            degree = ', '.join(
+                part for part in (_text(obj.get('degreeName')), _text(obj.get('fieldOfStudy'))) if part
+            )
+            start, end = _period(obj)
+            sections.setdefault('education', []).append({
+                'school': _text(obj.get('schoolName')),
+                'degree': degree,
+                'year': '' if end == 'Present' else end.split(' ')[-1]
+            })
+        
+        elif type_name == 'Skill' and obj.get('name'):
+            sections.setdefault('skills', []).append({
+                'name': _text(obj.get('name')),
+                'details': []
+            })
+        
+        elif type_name == 'Project' and obj.get('title'):
+            sections.setdefault('projects', []).append({
+                'title': _text(obj.get('title')),
+                'duration': _duration(obj),
+                'detail': _text(obj.get('description'))
+            })
+        
+        elif type_name == 'Language' and obj.get('name'):
+            lang_name = _text(obj.get('name'))
+            proficiency = obj.get('proficiency', '')
+            if isinstance(proficiency, str) and proficiency:
+                # ENUM values like FULL_PROFESSIONAL -> "Full professional proficiency"
+                proficiency = proficiency.replace('_', ' ').capitalize() + ' proficiency'
+                sections.setdefault('languages', []).append(f"{lang_name} - {proficiency}")
+            else:
+                sections.setdefault('languages', []).append(lang_name)
+    
+    return sections
@@ -1,74 +1,119 @@
 """Helper functions for data extraction with show all flow"""
+import logging
+import re
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-from helper.browser_helper import human_delay, smooth_scroll
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from helper.browser_helper import throttle_navigation
+
+
+log = logging.getLogger(__name__)
+
+# List items on a "Show all" detail page
+DETAIL_ITEMS_CSS = "main ul[class*='pvs-list'] > li"
+
+# Link / button variants as single XPath unions: one lookup instead of one per variant
+SHOW_ALL_LINK_XPATH = ".//a[contains(., 'Show all')] | .//div[contains(@class, 'pvs-list__footer')]//a"
+BACK_BUTTON_XPATH = "//button[@aria-label='Back' or .//li-icon[@type='arrow-left']] | //a[@aria-label='Back']"
+
+
+# Flips window.__scrapeReady once an element matching arguments[0] that wasn't on the page
+# when the observer was installed exists and the DOM has been quiet for 250ms; one observer
+# per call, disconnected when it fires. The elements already there (e.g. a previous modal that
+# is still closing) are kept in window.__scrapeStale so readers can skip them
+_READY_OBSERVER_JS = """
+const selector = arguments[0];
+if (window.__scrapeObserver) window.__scrapeObserver.disconnect();
+clearTimeout(window.__scrapeTimer);
+window.__scrapeReady = false;
+const stale = new Set(document.querySelectorAll(selector));
+window.__scrapeStale = stale;
+const observer = new MutationObserver(() => {
+    if (!Array.from(document.querySelectorAll(selector)).some((el) => !stale.has(el))) return;
+    clearTimeout(window.__scrapeTimer);
+    window.__scrapeTimer = setTimeout(() => {
+        window.__scrapeReady = true;
+        observer.disconnect();
+    }, 250);
+});
+observer.observe(document.body, {childList: true, subtree: true});
+window.__scrapeObserver = observer;
+"""
+
+
+def _wait_for(driver, condition, timeout=10, poll_frequency=0.2):
+    """Wait for a condition, returning False instead of raising on timeout"""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(condition)
+        return True
+    except TimeoutException:
+        return False
 
 
 def click_show_all(driver, section):
     """Click 'Show all' link in section"""
     try:
-        smooth_scroll(driver, section)
-        human_delay(0.5, 0.8)
+        # Find "Show all X items" link (JS click below doesn't need it scrolled into view)
+        buttons = section.find_elements(By.XPATH, SHOW_ALL_LINK_XPATH)
+        if not buttons:
+            log.debug("  ⚠ No 'Show all' button found")
+            return False
         
-        # Find "Show all X items" link
-        selectors = [
-            ".//a[contains(text(), 'Show all')]",
-            ".//a[contains(., 'Show all')]",
-            ".//div[contains(@class, 'pvs-list__footer')]//a",
-        ]
+        button = buttons[0]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("  Found: '%s'", button.text.strip())
         
-        for selector in selectors:
-            try:
-                button = section.find_element(By.XPATH, selector)
-                button_text = button.text.strip()
-                print(f"  Found: '{button_text}'")
-                
-                # Click
-                driver.execute_script("arguments[0].click();", button)
-                print("  ✓ Clicked 'Show all'")
-                
-                # Wait for page to load
-                human_delay(2, 2.5)  # Increased for better page load
-                return True
-            except NoSuchElementException:
-                continue
+        # Click (the detail page is a page load, so it counts against the rate limit)
+        throttle_navigation()
+        driver.execute_script("arguments[0].click();", button)
+        log.debug("  ✓ Clicked 'Show all'")
         
-        print("  ⚠ No 'Show all' button found")
-        return False
+        # Wait for navigation to the detail page; items are awaited in extract_items_from_detail_page
+        if not _wait_for(driver, lambda d: '/details/' in d.current_url):
+            log.debug("  ⚠ Detail page URL not reached, continuing")
+        return True
     except Exception as e:
-        print(f"  Error clicking show all: {e}")
+        log.warning("  Error clicking show all: %s", e)
         return False
 
 
+def show_all_needed(section):
+    """Check if 'Show all N items' lists more than the section already shows on the main page"""
+    links = section.find_elements(By.XPATH, ".//a[contains(., 'Show all')]")
+    if not links:
+        return True  # Let click_show_all try its other selectors
+    
+    match = re.search(r'(\d+)', links[0].text)
+    if not match:
+        return True
+    
+    total = int(match.group(1))
+    # Top-level items only; grouped roles nest their own <li>
+    visible = len(section.find_elements(By.CSS_SELECTOR, "ul > li:not(li li)"))
+    if visible >= total:
+        log.debug("  ✓ All %s items already on main page, skipping 'Show all'", total)
+        return False
+    return True
+
+
 def click_back_arrow(driver):
     """Click back arrow button on detail page"""
     try:
         # Back arrow is usually at top left
-        back_selectors = [
-            "//button[@aria-label='Back']",
-            "//button[contains(@class, 'app-aware-link')]//li-icon[@type='arrow-left']",
-            "//button[.//li-icon[@type='arrow-left']]",
-            "//a[@aria-label='Back']",
-        ]
-        
-        for selector in back_selectors:
-            try:
-                back_button = driver.find_element(By.XPATH, selector)
-                print("  Found back button")
-                driver.execute_script("arguments[0].click();", back_button)
-                print("  ✓ Clicked back")
-                human_delay(1.5, 2)  # Increased for page transition
-                return True
-            except NoSuchElementException:
-                continue
-        
-        # Fallback: browser back
-        print("  Using browser back()")
-        driver.back()
-        human_delay(1.5, 2)
+        back_buttons = driver.find_elements(By.XPATH, BACK_BUTTON_XPATH)
+        if back_buttons:
+            log.debug("  Found back button")
+            driver.execute_script("arguments[0].click();", back_buttons[0])
+            log.debug("  ✓ Clicked back")
+        else:
+            # Fallback: browser back
+            log.debug("  Using browser back()")
+            driver.back()
+        _wait_for(driver, lambda d: '/details/' not in d.current_url)
         return True
     except Exception as e:
-        print(f"  Error clicking back: {e}")
+        log.warning("  Error clicking back: %s", e)
         return False
 
 
@@ -76,32 +121,36 @@ def extract_items_from_detail_page(driver):
     """Extract list items from detail page (after show all)"""
     items = []
     
-    # Wait for detail page to fully load
-    print("  Waiting for detail page to load...")
-    human_delay(2, 2.5)  # Increased even more
+    # Wait for the first detail items to render
+    log.debug("  Waiting for detail page to load...")
+    _wait_for(driver, EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_ITEMS_CSS)))
     
     # Aggressive scrolling to load ALL lazy content
-    print("  Scrolling to load all items...")
+    log.debug("  Scrolling to load all items...")
     last_count = 0
     no_change_count = 0
     max_scrolls = 20  # Increased even more
     
     for i in range(max_scrolls):
-        # Scroll down
+        # Scroll down, then wait (up to 1.5s) for more items instead of sleeping a fixed time
         driver.execute_script("window.scrollBy(0, 1500);")
-        human_delay(1, 1.5)  # Increased for better loading
+        _wait_for(
+            driver,
+            lambda d: len(d.find_elements(By.CSS_SELECTOR, DETAIL_ITEMS_CSS)) > last_count,
+            timeout=1.5
+        )
         
         # Count current items
-        current_items = driver.find_elements(By.XPATH, "//main//ul[contains(@class, 'pvs-list')]/li")
+        current_items = driver.find_elements(By.CSS_SELECTOR, DETAIL_ITEMS_CSS)
         current_count = len(current_items)
         
-        print(f"    Scroll {i + 1}/{max_scrolls}: {current_count} items")
+        log.debug("    Scroll %s/%s: %s items", i + 1, max_scrolls, current_count)
         
         if current_count == last_count:
             no_change_count += 1
-            # If no change for 4 consecutive scrolls, we're done
-            if no_change_count >= 4:
-                print(f"    No new items after 4 scrolls, stopping")
+            # Each round already waited for growth, so 2 misses in a row means we're done
+            if no_change_count >= 2:
+                log.debug("    No new items after 2 scrolls, stopping")
                 break
         else:
             no_change_count = 0
@@ -113,35 +162,48 @@ def extract_items_from_detail_page(driver):
             "return (window.innerHeight + window.scrollY) >= document.body.scrollHeight - 100;"
         )
         if at_bottom and no_change_count >= 2:
-            print(f"    Reached bottom of page")
+            log.debug("    Reached bottom of page")
             break
     
-    print(f"  Final item count after scrolling: {last_count}")
-    
-    # Scroll back to top
-    print("  Scrolling back to top...")
-    driver.execute_script("window.scrollTo(0, 0);")
-    human_delay(1, 1.5)
-    
-    # Scroll down a bit to middle
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-    human_delay(0.8, 1)
+    log.debug("  Final item count after scrolling: %s", last_count)
     
     # Get items - try multiple selectors
     selectors = [
-        "//main//ul[contains(@class, 'pvs-list')]/li[contains(@class, 'pvs-list__paged-list-item')]",
-        "//main//ul[contains(@class, 'pvs-list')]/li",
-        "//div[contains(@class, 'scaffold-finite-scroll__content')]//ul/li",
-        "//main//ul/li[contains(@class, 'artdeco-list__item')]",
+        "main ul[class*='pvs-list'] > li[class*='pvs-list__paged-list-item']",
+        DETAIL_ITEMS_CSS,
+        "div[class*='scaffold-finite-scroll__content'] ul > li",
+        "main ul > li[class*='artdeco-list__item']",
     ]
     
     for selector in selectors:
-        items = driver.find_elements(By.XPATH, selector)
+        items = driver.find_elements(By.CSS_SELECTOR, selector)
         if items and len(items) > 0:
-            print(f"  ✓ Found {len(items)} items using selector")
+            log.debug("  ✓ Found %s items using selector", len(items))
             break
     
     if not items:
-        print("  ⚠ No items found on detail page!")
+        log.debug("  ⚠ No items found on detail page!")
     
     return items
+
+
+def watch_until_stable(driver, css_selector):
+    """Install a MutationObserver that marks the page ready once a new css_selector match appears and the DOM settles"""
+    driver.execute_script(_READY_OBSERVER_JS, css_selector)
+
+
+def wait_until_stable(driver, timeout=10):
+    """Poll the flag set by watch_until_stable (one cheap script call per 50ms)"""
+    return _wait_for(driver, lambda d: d.execute_script("return window.__scrapeReady === true"),
+                     timeout=timeout, poll_frequency=0.05)
+
+
+def read_item_spans(driver, section):
+    """First two aria-hidden span texts of every list item in section, in one call (no per-item lookups)"""
+    return driver.execute_script("""
+        return Array.from(arguments[0].querySelectorAll('ul > li')).map((li) =>
+            Array.from(li.querySelectorAll('span[aria-hidden="true"]'))
+                .slice(0, 2)
+                .map((span) => (span.textContent || '').trim())
+        );
+    """, section)
@@ -0,0 +1,75 @@
+"""Plain HTTPS fetching of profile pages with the saved LinkedIn session (no browser)"""
+import gzip
+import http.client
+import os
+from urllib.parse import urlsplit
+from helper.auth_helper import get_saved_cookies
+from helper.browser_helper import throttle_navigation
+
+
+# Opt-in: try profiles over HTTP first and only load them in the browser when the page lacks data.
+# Only used by get_profile calls limited to crawler.HTTP_SECTIONS; the bundled entry points scrape
+# every section, so they always use the browser. Embedded lists are taken as-is (no "Show all" check)
+HTTP_FAST_PATH = os.getenv('HTTP_FAST_PATH', 'false').lower() == 'true'
+
+LINKEDIN_HOST = 'www.linkedin.com'
+
+
+class ProfileFetcher:
+    """Fetch profile HTML over one kept-alive HTTPS connection, sending the saved session cookies"""
+    
+    def __init__(self, user_agent, timeout=15):
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.conn = None
+    
+    def _cookie_header(self):
+        cookies = get_saved_cookies() or []
+        return '; '.join(
+            f"{cookie['name']}={cookie['value']}" for cookie in cookies
+            if 'linkedin.com' in cookie.get('domain', '')
+        )
+    
+    def fetch(self, url):
+        """Return the page HTML, or None if there is no session, LinkedIn redirects (authwall) or the request fails"""
+        cookie_header = self._cookie_header()
+        parts = urlsplit(url)
+        if not cookie_header or parts.netloc.lower() not in (LINKEDIN_HOST, 'linkedin.com'):
+            return None
+        
+        path = parts.path + (f"?{parts.query}" if parts.query else '')
+        headers = {
+            'User-Agent': self.user_agent,
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Language': 'en-US,en',
+            'Accept-Encoding': 'gzip',
+            'Cookie': cookie_header,
+        }
+        
+        throttle_navigation()
+        
+        # A kept-alive connection may have been closed by the server; reconnect once
+        for attempt in range(2):
+            try:
+                if self.conn is None:
+                    self.conn = http.client.HTTPSConnection(LINKEDIN_HOST, timeout=self.timeout)
+                self.conn.request('GET', path, headers=headers)
+                response = self.conn.getresponse()
+                body = response.read()
+                if response.getheader('Content-Encoding', '').lower() == 'gzip':
+                    body = gzip.decompress(body)
+            except (http.client.HTTPException, OSError, EOFError):
+                self.close()
+                continue
+            
+            if response.status != 200:
+                return None
+            return body.decode(response.headers.get_content_charset() or 'utf-8', errors='replace')
+        
+        return None
+    
+    def close(self):
+        """Close the connection"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
@@ -0,0 +1,66 @@
+"""Logging setup: records are queued in memory and written by one background listener thread"""
+import atexit
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+# Loggers whose DEBUG output (per-line extraction details) is enabled by LOG_LEVEL
+VERBOSE_LOGGERS = ('crawler', 'helper')
+
+_listener = None
+# PID of the process that started _listener (a forked child inherits the
+# variable but not the listener thread)
+_listener_pid = None
+_queue_handler = None
+
+
+def setup_logging(level=None):
+    """
+    Route all logging through a QueueHandler so callers only enqueue records.
+    Status messages (INFO) are always shown; LOG_LEVEL=DEBUG adds extraction details.
+    """
+    global _listener, _listener_pid, _queue_handler
+    if _listener is not None and _listener_pid == os.getpid():
+        return
+    
+    root = logging.getLogger()
+    if _queue_handler is not None:
+        # Forked from a configured parent: its handler feeds a queue nobody reads here
+        root.removeHandler(_queue_handler)
+    
+    # stdout, alongside the interactive prints
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, handler)
+    _listener.start()
+    _listener_pid = os.getpid()
+    # Flush queued records on exit
+    atexit.register(stop_logging)
+    
+    _queue_handler = QueueHandler(log_queue)
+    root.setLevel(logging.INFO)
+    root.addHandler(_queue_handler)
+    
+    # LOG_LEVEL=DEBUG turns on the extraction details; status lines (INFO) stay visible
+    # whatever it is set to
+    level = logging.getLevelName((level or os.getenv('LOG_LEVEL', 'INFO')).upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+    for name in VERBOSE_LOGGERS:
+        logging.getLogger(name).setLevel(min(level, logging.INFO))
+
+
+def stop_logging():
+    """
+    Write out any queued records and stop the listener.
+    Worker processes call this themselves: they exit without running atexit hooks.
+    """
+    global _listener
+    if _listener is not None and _listener_pid == os.getpid():
+        _listener.stop()
+        _listener = None
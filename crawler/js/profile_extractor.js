@@ -0,0 +1,130 @@
+// LinkedIn profile page harvester.
+// Runs inside the browser via driver.execute_script and returns every field the
+// crawler needs as one JSON string, so the page is read in a single round-trip.
+// Selectors mirror the XPaths used by the extract_* methods in crawler.py.
+
+const text = (el) => (el && el.innerText ? el.innerText.trim() : '');
+
+const firstText = (root, selectors, minLength = 1) => {
+    for (const selector of selectors) {
+        const value = text(root.querySelector(selector));
+        if (value.length >= minLength) {
+            return value;
+        }
+    }
+    return '';
+};
+
+// Same order as the XPath fallbacks: id contains key, div#key inside, then h2 heading
+const findSection = (key, heading) => {
+    const byId = document.querySelector(`section[id*="${key}"]`);
+    if (byId) {
+        return byId;
+    }
+    const anchor = document.getElementById(key);
+    if (anchor && anchor.closest('section')) {
+        return anchor.closest('section');
+    }
+    return Array.from(document.querySelectorAll('section')).find(
+        (section) => Array.from(section.querySelectorAll('h2')).some(
+            (h2) => h2.textContent.includes(heading)
+        )
+    ) || null;
+};
+
+const hasShowAll = (section) => (
+    Array.from(section.querySelectorAll('a')).some((a) => a.textContent.includes('Show all')) ||
+    !!section.querySelector('div.pvs-list__footer a')
+);
+
+// Entry count from the section's "Show all 12 experiences" link; null when it has no count
+const showAllTotal = (section) => {
+    const link = Array.from(section.querySelectorAll('a')).find((a) => a.textContent.includes('Show all'));
+    const match = link && link.textContent.match(/Show all (\d+)/);
+    return match ? parseInt(match[1], 10) : null;
+};
+
+// Main-page list items of a section (same as the `.//ul/li` XPath)
+const listSection = (key, heading) => {
+    const section = findSection(key, heading);
+    if (!section) {
+        return null;
+    }
+    return {
+        show_all: hasShowAll(section),
+        show_all_total: showAllTotal(section),
+        items: Array.from(section.querySelectorAll('ul > li')).map((li) => ({
+            text: li.innerText || '',
+            spans: Array.from(li.querySelectorAll('span[aria-hidden="true"]'))
+                .slice(0, 2)
+                .map((span) => text(span)),
+        })),
+    };
+};
+
+// Whether any of a section's XPath fallbacks would match: section id contains a key,
+// section holding div#id, or section with an h2/span containing the heading text
+const sectionPresent = (keys, divIds, headings) => (
+    keys.some((key) => document.querySelector(`section[id*="${key}"]`)) ||
+    divIds.some((id) => document.querySelector(`section div[id="${id}"]`)) ||
+    Array.from(document.querySelectorAll('section h2, section span')).some(
+        (el) => headings.some((heading) => el.textContent.includes(heading))
+    )
+);
+
+const aboutSection = findSection('about', 'About');
+
+// Header location, same fallbacks as extract_location: first match per selector,
+// skipped when too short or when it looks like pronouns ("he/him")
+const headerLocation = () => {
+    const bodySmall = Array.from(document.querySelectorAll('div.mt2 span.text-body-small'));
+    const candidates = [
+        bodySmall.find((span) => span.textContent.includes(',')),
+        Array.from(document.querySelectorAll('span')).find((span) => {
+            const value = span.textContent;
+            return (span.classList.contains('text-body-small') && value.includes('Indonesia')) ||
+                ['Jakarta', 'Bandung', 'Surabaya'].some((city) => value.includes(city));
+        }),
+        bodySmall[0],
+    ];
+    for (const candidate of candidates) {
+        const value = text(candidate);
+        if (value.length >= 3 && !value.includes('/')) {
+            return value;
+        }
+    }
+    return '';
+};
+
+return JSON.stringify({
+    name: firstText(document, [
+        'h1.text-heading-xlarge',
+        'h1[class*="inline"]',
+        'h1[class*="text-heading"]',
+    ]),
+    location: headerLocation(),
+    about: aboutSection ? firstText(aboutSection, [
+        'div[class*="display-flex"] span[aria-hidden="true"]',
+        'div[class*="inline-show-more-text"] span',
+        'span[aria-hidden="true"]',
+    ], 21) : '',
+    sections: {
+        experience: listSection('experience', 'Experience'),
+        education: listSection('education', 'Education'),
+        skills: listSection('skills', 'Skills'),
+        projects: listSection('projects', 'Projects'),
+        languages: listSection('languages', 'Languages'),
+    },
+    // Sections only read through the live DOM: lets extractors skip their selector waits when absent
+    present: {
+        honors: sectionPresent(['honors', 'accomplishments'], ['honors', 'accomplishments'],
+            ['Honors', 'awards']),
+        licenses: sectionPresent(['licenses', 'certifications'], ['licenses_and_certifications'],
+            ['Licenses', 'Certifications']),
+        courses: sectionPresent(['courses'], ['courses'], ['Courses']),
+        volunteering: sectionPresent(['volunteering'], ['volunteering-experience', 'volunteering_experience'],
+            ['Volunteering', 'Volunteer experience']),
+        test_scores: sectionPresent(['test-scores', 'test_scores'], ['test-scores'],
+            ['Test scores', 'Test Scores']),
+    },
+});
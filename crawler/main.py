@@ -1,15 +1,20 @@
 import json
 import os
-import queue
-import threading
-import time
 import glob
 import hashlib
+import queue
+import threading
 from datetime import datetime
 from crawler import LinkedInCrawler
+from crawler_pool import CrawlerPool
+from helper.logging_helper import setup_logging
 
 COOKIES_FILE = "data/cookie/.linkedin_cookies.json"
 
+# Background saver: queue capacity and max profiles written per batch
+SAVE_QUEUE_SIZE = 1000
+SAVE_BATCH_SIZE = 64
+
 
 def get_profile_hash(profile_url):
     """Generate unique hash from profile URL"""
@@ -58,6 +63,13 @@ def save_profile_data(profile_data, output_dir='data/output'):
             print(f"  Skipping save to avoid duplication")
             return existing_file
     
+    return _write_profile_file(profile_data, output_dir)
+
+
+def _write_profile_file(profile_data, output_dir):
+    """Write one profile to <name>_<timestamp>_<url hash>.json and return the path"""
+    profile_url = profile_data.get('profile_url', '')
+    
     # Create filename with timestamp and URL hash
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
@@ -84,64 +96,105 @@ def save_profile_data(profile_data, output_dir='data/output'):
     return filepath
 
 
-def worker(worker_id, url_queue, stats):
-    """Worker function to process URLs from queue"""
-    print(f"[Worker {worker_id}] Started")
-    
-    crawler = None
+def save_profile_batch(profiles, output_dir='data/output'):
+    """Save several profiles, scanning the output directory once for the whole batch"""
+    os.makedirs(output_dir, exist_ok=True)
     
-    while True:
+    # Same duplicate checks as check_if_already_crawled: URL hash in the filename, then profile_url inside
+    existing_by_hash = {}
+    existing_by_url = {}
+    for filepath in glob.glob(os.path.join(output_dir, "*.json")):
+        existing_by_hash.setdefault(filepath[-13:-5], filepath)
         try:
-            # Get URL from queue (timeout 2 seconds)
-            url = url_queue.get(timeout=2)
-            
-            print(f"\n[Worker {worker_id}] 📥 Processing: {url}")
-            
-            # Check if already crawled before processing
-            already_exists, existing_file = check_if_already_crawled(url)
-            if already_exists:
-                print(f"[Worker {worker_id}] ⊘ Already crawled: {existing_file}")
-                stats['skipped'] += 1
-                url_queue.task_done()
+            with open(filepath, 'r', encoding='utf-8') as f:
+                existing_by_url.setdefault(json.load(f).get('profile_url'), filepath)
+        except:
+            continue
+    
+    paths = []
+    for profile_data in profiles:
+        profile_url = profile_data.get('profile_url', '')
+        if profile_url:
+            existing_file = existing_by_hash.get(get_profile_hash(profile_url)) or existing_by_url.get(profile_url)
+            if existing_file:
+                print(f"\n⚠ Profile already exists: {existing_file}")
+                print(f"  Skipping save to avoid duplication")
+                paths.append(existing_file)
                 continue
+        
+        filepath = _write_profile_file(profile_data, output_dir)
+        if profile_url:
+            existing_by_hash[get_profile_hash(profile_url)] = filepath
+            existing_by_url[profile_url] = filepath
+        paths.append(filepath)
+    
+    return paths
+
+
+class ProfileSaver:
+    """
+    Save profiles on a background thread so callers don't wait on disk I/O.
+    Queued profiles are written in batches of up to SAVE_BATCH_SIZE; when the
+    queue is full, save() writes synchronously instead. flush() waits until
+    everything queued so far is on disk.
+    """
+    
+    def __init__(self, output_dir='data/output', maxsize=SAVE_QUEUE_SIZE):
+        self.output_dir = output_dir
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.error = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+    
+    def save(self, profile_data):
+        """Queue a profile for saving (falls back to a synchronous write if the queue is full)"""
+        try:
+            self.queue.put_nowait(profile_data)
+        except queue.Full:
+            save_profile_data(profile_data, self.output_dir)
+    
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            while len(batch) < SAVE_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
             
-            stats['processing'] += 1
-            
-            crawler = LinkedInCrawler()
+            # None is the stop sentinel from close(); save what came before it
+            if None in batch:
+                stopping = True
+                batch = [profile for profile in batch if profile is not None]
             
             try:
-                # Login (will use cookies if available)
-                crawler.login()
-                
-                # Scrape profile
-                profile_data = crawler.get_profile(url)
-                
-                # Save to file
-                save_profile_data(profile_data)
-                
-                stats['completed'] += 1
-                print(f"[Worker {worker_id}] ✓ Completed: {profile_data.get('name', 'Unknown')}")
-                
+                if batch:
+                    save_profile_batch(batch, self.output_dir)
             except Exception as e:
-                stats['failed'] += 1
-                print(f"[Worker {worker_id}] ✗ Error: {e}")
-                import traceback
-                traceback.print_exc()
-            
+                self.error = e
+                print(f"✗ Error saving {len(batch)} profile(s): {e}")
             finally:
-                # Close browser after each profile
-                if crawler:
-                    print(f"[Worker {worker_id}] Closing browser...")
-                    crawler.close()
-                    crawler = None
-                url_queue.task_done()
-                stats['processing'] -= 1
-            
-        except queue.Empty:
-            # Queue empty, check if really done
-            if url_queue.empty():
-                print(f"[Worker {worker_id}] No more URLs, stopping")
-                break
+                for _ in range(len(batch) + stopping):
+                    self.queue.task_done()
+    
+    def flush(self):
+        """Wait until every queued profile is written; raises the error if a write failed"""
+        self.queue.join()
+        error, self.error = self.error, None
+        if error:
+            raise error
+    
+    def close(self):
+        """Write everything still queued and stop the saver thread"""
+        self.queue.put(None)
+        self.thread.join()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
 def print_stats(stats, total):
@@ -150,7 +203,6 @@ def print_stats(stats, total):
     print("PROGRESS")
     print("="*60)
     print(f"Total URLs: {total}")
-    print(f"Processing: {stats['processing']}")
     print(f"Completed: {stats['completed']}")
     print(f"Failed: {stats['failed']}")
     print(f"Skipped (duplicates): {stats['skipped']}")
@@ -160,7 +212,7 @@ def print_stats(stats, total):
 
 def main():
     print("="*60)
-    print("LINKEDIN PROFILE SCRAPER - QUEUE MODE")
+    print("LINKEDIN PROFILE SCRAPER - POOL MODE")
     print("="*60)
     
     # Get URLs from user
@@ -204,49 +256,45 @@ def main():
     else:
         print("\n✓ Cookies found!")
     
-    # Create queue
-    url_queue = queue.Queue()
-    
-    # Put all URLs to queue
-    print(f"\n→ Adding {len(urls)} URLs to queue...")
-    for url in urls:
-        url_queue.put(url)
-    
     # Statistics
     stats = {
-        'processing': 0,
         'completed': 0,
         'failed': 0,
         'skipped': 0
     }
     
-    # Start workers
-    print(f"\n→ Starting {max_workers} workers...")
-    threads = []
-    
-    for i in range(max_workers):
-        t = threading.Thread(target=worker, args=(i+1, url_queue, stats))
-        t.daemon = True
-        t.start()
-        threads.append(t)
-        time.sleep(0.3)  # Small delay between starting workers
-    
-    # Monitor progress
-    print("\n→ Workers are processing URLs...")
-    print("→ Press Ctrl+C to stop (gracefully)\n")
+    # Skip profiles that were already crawled before starting any browser
+    pending_urls = []
+    for url in urls:
+        already_exists, existing_file = check_if_already_crawled(url)
+        if already_exists:
+            print(f"⊘ Already crawled: {existing_file}")
+            stats['skipped'] += 1
+        else:
+            pending_urls.append(url)
     
-    try:
-        # Print stats every 30 seconds (reduced spam)
-        while not url_queue.empty() or stats['processing'] > 0:
-            time.sleep(60)
-            print_stats(stats, len(urls))
+    if pending_urls:
+        pool_size = min(max_workers, len(pending_urls))
+        print(f"\n→ Starting pool with {pool_size} browsers for {len(pending_urls)} URLs...")
+        print("→ Press Ctrl+C to stop\n")
         
-        # Wait for all tasks to complete
-        url_queue.join()
+        try:
+            with CrawlerPool(pool_size) as pool, ProfileSaver() as saver:
+                for done, (url, profile_data, error) in enumerate(pool.map(pending_urls), 1):
+                    if error:
+                        stats['failed'] += 1
+                        print(f"✗ Error scraping {url}: {error}")
+                    else:
+                        saver.save(profile_data)
+                        stats['completed'] += 1
+                        print(f"✓ Completed: {profile_data.get('name', 'Unknown')}")
+                    
+                    # Print stats every 5 profiles (reduced spam)
+                    if done % 5 == 0:
+                        print_stats(stats, len(urls))
         
-    except KeyboardInterrupt:
-        print("\n\n⚠ Interrupted by user. Waiting for current tasks to finish...")
-        url_queue.join()
+        except KeyboardInterrupt:
+            print("\n\n⚠ Interrupted by user. Remaining URLs were skipped.")
     
     # Final stats
     print("\n" + "="*60)
@@ -263,4 +311,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Crawler extraction details are logged at DEBUG; set LOG_LEVEL=DEBUG to see them
+    setup_logging()
     main()